@@ -0,0 +1,73 @@
+#!/usr/bin/env python
+"""
+Memory footprint of GObjects and their GItems and GNodes
+
+Creates N AND gates (7 GItems and 3 GNodes each) on a GCanvas in a hidden window, and reports how much Python
+memory they take, both in total (per gate, counting what tracemalloc sees allocated by tkshapes' own code) and
+per instance (the object itself, plus its __dict__ if it has one).  The canvas items themselves live in Tk, and
+are not counted.
+
+Each per-instance size is shown next to what the same object would take without __slots__, as these classes were
+before they had them:  an object with the same attributes in a __dict__.
+
+Usage:  python benchmarks/memory.py [N]
+"""
+
+import os
+import sys
+import tracemalloc
+import tkinter as tk
+
+import tkshapes
+from tkshapes import GCanvas
+
+
+def shallow_size(obj):
+    """ the size of obj, plus the size of its __dict__ (if it has one) """
+    size = sys.getsizeof(obj)
+    if hasattr(obj, '__dict__'):
+        size += sys.getsizeof(obj.__dict__)
+    return size
+
+
+def unslotted_size(obj):
+    """ the size obj would be without __slots__:  an object with a __dict__ holding the same attributes """
+    names = [name for cls in type(obj).__mro__ for name in cls.__dict__.get('__slots__', ())
+             if not name.startswith('__') and hasattr(obj, name)]
+    plain = type('Unslotted' + type(obj).__name__, (), {})()
+    for name in names:
+        setattr(plain, name, getattr(obj, name))
+    return shallow_size(plain)
+
+
+def main(n):
+    root = tk.Tk()
+    root.withdraw()
+    gcanvas = GCanvas(root, canvas_width=10000, canvas_height=10000)
+    gcanvas.register_builtins()
+
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    gates = [gcanvas.create('GAndGate', 100 + 120 * (i % 80), 100 + 100 * (i // 80)) for i in range(n)]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    only_tkshapes = [tracemalloc.Filter(True, os.path.join(os.path.dirname(tkshapes.__file__), '*'))]
+    before = before.filter_traces(only_tkshapes)
+    after = after.filter_traces(only_tkshapes)
+    total = sum(stat.size_diff for stat in after.compare_to(before, 'filename'))
+    gate = gates[0]
+    g_item = gate._items['body']
+    g_node = gate._nodes['output']
+
+    print(f"{n} AND gates:  {total / 1024 / 1024:.1f} MB,  {total / n:.0f} bytes per gate")
+    print("           slotted  unslotted  (bytes)")
+    for (name, obj, count) in (('GObject', gate, 1), ('GItem', g_item, len(gate._items)),
+                               ('GNode', g_node, len(gate._nodes))):
+        print(f"  {name:7s}  {shallow_size(obj):7d}  {unslotted_size(obj):9d}  (x {count} per gate)")
+
+    root.destroy()
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10000)
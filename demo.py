@@ -4,7 +4,7 @@ import tkinter as tk
 import tkinter.ttk as ttk
 
 from tkapp import AppRootWindow
-from tkshapes import GCanvas, GToggleSwitch
+from tkshapes import GCanvas, GEventType, GSimulator, GToggleSwitch
 
 
 root = tk.Tk()
@@ -32,7 +32,8 @@ gcanvas.register_status_var(status_text)
 gcanvas.register_builtins()
 
 # The 'BACKGROUND' name will associate this GObject with the immovable background items
-graph_paper = gcanvas.create('GGraphPaper', 0, 0, 10000, 10000, name="BACKGROUND")
+# With viewport_only=True only the visible grid lines are drawn, rather than ~2000 lines for the whole sheet
+graph_paper = gcanvas.create('GGraphPaper', 0, 0, 10000, 10000, name="BACKGROUND", viewport_only=True)
 graph_paper.set_outline_width(2)
 graph_paper.set_active_outline_width(0)
 graph_paper.show()
@@ -149,61 +150,62 @@ bulb1.add_mouse_bindings()
 bulb1.show()
 
 
-def event_handler(event):
-
+def on_clickable_clicked(event):
+    """ any clickable GItem was clicked """
     print("------------------------------------------------------------------------------")
-
-    # Check GCanvas Event Queue for events to handle
-    if not gcanvas.event_queue.is_empty():
-        print(f"DEBUG: Event Queue Size = {gcanvas.event_queue.get_qsize()}")
-        event = gcanvas.event_queue.get_event()
-        if event:
-
-            if event.event_type == 'ClickableClicked':
-                canvas_item = event.event_data['canvas_item']
-                g_item = event.event_data['g_item']
-                g_object = event.event_data['g_object']
-                print(f"DEBUG: Event:{event.event_id}: canvas_item = {canvas_item}")
-                print(f"DEBUG: Event:{event.event_id}: GItem = {g_item}")
-                print(f"DEBUG: Event:{event.event_id}: GObject = {g_object}, label = {g_object.label}, state = {g_object.state}")
-
-                if type(g_object) is GToggleSwitch:
-                    g_object.toggle()
-                    if g_object.state:
-                        state = "ON"
-                    else:
-                        state = "OFF"
-                    print(f"DEBUG: Event:{event.event_id}: event_handler(): {g_object.label} is {state}")
-
-            elif event.event_type == 'AddConnection':
-                from_canvas_item = event.event_data['from_canvas_item']
-                from_g_item = event.event_data['from_g_item']
-                from_g_object = event.event_data['from_g_object']
-                from_g_node = event.event_data['from_g_node']
-                to_canvas_item = event.event_data['to_canvas_item']
-                to_g_item = event.event_data['to_g_item']
-                to_g_object = event.event_data['to_g_object']
-                to_g_node = event.event_data['to_g_node']
-                print(f"DEBUG: Event:{event.event_id}: from_canvas_item = {from_canvas_item}")
-                print(f"DEBUG: Event:{event.event_id}: from_g_item = {from_g_item}")
-                print(f"DEBUG: Event:{event.event_id}: from_g_object = {from_g_object}, label = {from_g_object.label}")
-                print(f"DEBUG: Event:{event.event_id}: from_g_node = {from_g_node}, name = {from_g_node.name}")
-                print(f"DEBUG: Event:{event.event_id}: to_canvas_item = {to_canvas_item}")
-                print(f"DEBUG: Event:{event.event_id}: to_g_item = {to_g_item}")
-                print(f"DEBUG: Event:{event.event_id}: to_g_object = {to_g_object}, label = {to_g_object.label}")
-                print(f"DEBUG: Event:{event.event_id}: to_g_node = {to_g_node}, name = {to_g_node.name}")
-                # Now we can do something with the data that was passed to us via the GEvent...
-
-        print(f"DEBUG: Event Queue Size = {gcanvas.event_queue.get_qsize()}")
-
-
-# Demonstrate how we can receive virtual events from the tkshapes
-# library, and then handle each type of event appropriately. We
-# bind to the documented virtual event names, and then handle the
-# events using one or more handlers.  As we can check the event
-# type, we can use the same event_handler() in this case.
-gcanvas.canvas.bind("<<ClickableClicked>>", event_handler, "+")
-gcanvas.canvas.bind("<<AddConnection>>", event_handler, "+")
+    canvas_item = event.event_data.canvas_item
+    g_item = event.event_data.g_item
+    g_object = event.event_data.g_object
+    print(f"DEBUG: Event:{event.event_id}: canvas_item = {canvas_item}")
+    print(f"DEBUG: Event:{event.event_id}: GItem = {g_item}")
+    print(f"DEBUG: Event:{event.event_id}: GObject = {g_object}, label = {g_object.label}, state = {g_object.state}")
+
+
+def on_switch_clicked(event):
+    """ a GToggleSwitch was clicked """
+    g_object = event.event_data.g_object
+    g_object.toggle()
+    if g_object.state:
+        state = "ON"
+    else:
+        state = "OFF"
+    print(f"DEBUG: Event:{event.event_id}: on_switch_clicked(): {g_object.label} is {state}")
+
+    # light up whatever the switch is wired to
+    simulator.input_changed(g_object)
+
+
+def on_add_connection(event):
+    """ a new GWire connects two GNodes """
+    print("------------------------------------------------------------------------------")
+    data = event.event_data
+    print(f"DEBUG: Event:{event.event_id}: from_canvas_item = {data.from_canvas_item}")
+    print(f"DEBUG: Event:{event.event_id}: from_g_item = {data.from_g_item}")
+    print(f"DEBUG: Event:{event.event_id}: from_g_object = {data.from_g_object}, label = {data.from_g_object.label}")
+    print(f"DEBUG: Event:{event.event_id}: from_g_node = {data.from_g_node}, name = {data.from_g_node.name}")
+    print(f"DEBUG: Event:{event.event_id}: to_canvas_item = {data.to_canvas_item}")
+    print(f"DEBUG: Event:{event.event_id}: to_g_item = {data.to_g_item}")
+    print(f"DEBUG: Event:{event.event_id}: to_g_object = {data.to_g_object}, label = {data.to_g_object.label}")
+    print(f"DEBUG: Event:{event.event_id}: to_g_node = {data.to_g_node}, name = {data.to_g_node.name}")
+    # Now we can do something with the data that was passed to us via the GEvent...
+
+    # the circuit has changed, so re-build the simulator's netlist
+    simulator.compile()
+
+
+# Simulate the logic circuit, so wiring switches and gates to light bulbs lights them up
+simulator = GSimulator(gcanvas)
+
+# Demonstrate how we can receive events from the tkshapes library.  We
+# subscribe a handler to each type of event we're interested in, and a
+# handler can be limited to the events about one type of GObject (or to
+# one GObject, by its tag), so no handler has to check the event type.
+# (Events also go on gcanvas.event_queue, with a virtual event such as
+# <<ClickableClicked>> to bind to, unless a handler subscribes exclusively
+# -- as these do, since nothing here reads the queue.)
+gcanvas.subscribe(GEventType.CLICKABLE_CLICKED, on_clickable_clicked, exclusive=True)
+gcanvas.subscribe(GEventType.CLICKABLE_CLICKED, on_switch_clicked, gobject_type=GToggleSwitch, exclusive=True)
+gcanvas.subscribe(GEventType.ADD_CONNECTION, on_add_connection, exclusive=True)
 
 # Print some debug info
 gcanvas.known_types()
@@ -32,6 +32,9 @@ setuptools.setup(
     keywords='tkinter',
     packages=setuptools.find_packages(where="src", exclude=['contrib', 'docs', 'tests']),
     package_dir={"": "src"},
+    extras_require={
+        'numpy': ['numpy'],
+    },
     project_urls={
         'Bug Reports': 'https://github.com/bentlema/tkshapes/issues',
         'Source': 'https://github.com/bentlema/tkshapes/',
@@ -1,5 +1,7 @@
 
 from .gcanvas import GCanvas
+from .gevent import GEvent, GEventType
+from .gsim import GSimulator
 
 from .gobject import GObject
 
@@ -0,0 +1,116 @@
+import asyncio
+import tkinter as tk
+import weakref
+
+from .gevent import GEventType
+
+# How often the Tk and asyncio event loops take turns, when one drives the other
+FRAME_RATE = 60
+
+
+# Running tkshapes in an asyncio program
+#
+# Only one of the two event loops can be in charge, so the other one is given a turn every frame:
+#
+#   * asyncio in charge:   await run_tk(root) processes Tk's pending events every frame, until the window is closed
+#   * Tk in charge:        run_asyncio(root, loop) runs the asyncio loop's ready callbacks every frame, from mainloop()
+#
+# Either way both loops run on the same thread, so coroutines can use the GCanvas (and GObjects) directly, and
+# GEvents reach them through subscriptions (see GCanvas.subscribe()) without polling the GEventQueue:
+#
+#   async for event in gcanvas.events(GEventType.CLICKABLE_CLICKED):
+#       ...
+#
+#   event = await gcanvas.wait_for_connection(gate)
+
+
+async def run_tk(root, frame_rate=FRAME_RATE):
+    """ drive the Tk event loop from asyncio, processing its events frame_rate times a second until root is gone """
+    interval = 1 / frame_rate
+    while True:
+        try:
+            root.update()
+        except tk.TclError:
+            # the application has been destroyed
+            return
+        await asyncio.sleep(interval)
+
+
+def run_asyncio(widget, loop, frame_rate=FRAME_RATE):
+    """
+    drive loop (an asyncio event loop) from Tk's mainloop() instead, by giving it one pass frame_rate times a second.
+    Returns a function that stops driving it.  loop mustn't be running already:  if asyncio is in charge, use
+    run_tk() instead
+    """
+    if loop.is_running():
+        raise RuntimeError("run_asyncio() can't drive an event loop that is already running -- use run_tk() instead")
+    interval = max(1, round(1000 / frame_rate))
+    pending = [None]
+
+    def step():
+        # run the callbacks that are ready, and come straight back (unless something else has started the loop
+        # since, in which case it's already running them)
+        if not loop.is_running():
+            loop.call_soon(loop.stop)
+            loop.run_forever()
+        pending[0] = widget.after(interval, step)
+
+    def stop():
+        if pending[0] is not None:
+            widget.after_cancel(pending[0])
+            pending[0] = None
+
+    pending[0] = widget.after(interval, step)
+    return stop
+
+
+def events(gcanvas, *event_types):
+    """
+    return an async iterator over the GEvents of event_types (or of every GEventType) -- see GCanvas.events().
+    The subscriptions are made here, rather than when iterating starts, so no GEvent posted in between is missed
+    """
+    queue = asyncio.Queue()
+    tokens = [gcanvas.subscribe(event_type, queue.put_nowait) for event_type in event_types or GEventType.ALL]
+
+    def unsubscribe():
+        for token in tokens:
+            gcanvas.unsubscribe(token)
+
+    async def receive():
+        try:
+            while True:
+                yield await queue.get()
+        finally:
+            unsubscribe()
+
+    iterator = receive()
+    # an iterator that is never started doesn't run its finally clause, so also unsubscribe when it's thrown away
+    weakref.finalize(iterator, unsubscribe)
+    return iterator
+
+
+async def wait_for(gcanvas, event_type, predicate=None, gobject_type=None, tag=None, timeout=None):
+    """ return the next GEvent of event_type (that predicate(g_event) is true for), or raise TimeoutError """
+    future = asyncio.get_running_loop().create_future()
+
+    def handler(g_event):
+        if not future.done() and (predicate is None or predicate(g_event)):
+            future.set_result(g_event)
+
+    token = gcanvas.subscribe(event_type, handler, gobject_type=gobject_type, tag=tag)
+    try:
+        return await asyncio.wait_for(future, timeout)
+    finally:
+        gcanvas.unsubscribe(token)
+
+
+async def wait_for_connection(gcanvas, g_object=None, timeout=None):
+    """ return the next AddConnection GEvent (to or from g_object, if given) """
+    tag = None if g_object is None else g_object._tag
+    return await wait_for(gcanvas, GEventType.ADD_CONNECTION, tag=tag, timeout=timeout)
+
+
+async def wait_for_click(gcanvas, g_object=None, timeout=None):
+    """ return the next ClickableClicked GEvent (on g_object, if given) """
+    tag = None if g_object is None else g_object._tag
+    return await wait_for(gcanvas, GEventType.CLICKABLE_CLICKED, tag=tag, timeout=timeout)
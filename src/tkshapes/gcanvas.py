@@ -2,7 +2,15 @@
 import tkinter as tk
 import tkinter.ttk as ttk
 
-from .gevent import GEventQueue
+from . import gasync
+from .gcommand import GCommandQueue
+from .gdispatch import GDispatcher
+from .gevent import GEvent, GEventQueue, GEventType, SelectionChangedData, BLOCK, GROW
+from .ggeometry import scale, unscale
+from .ginteraction import GInteraction
+from .gspatial import GSpatialIndex
+from .gstore import GCoordStore
+from .gtcl import tcl_quote, create_command, coords_command, bind_command, build_script
 
 from .gobject import GObject
 
@@ -26,7 +34,8 @@ from .gobjects.glightbulb import GLightBulb
 
 class GCanvas(tk.Frame):
 
-    def __init__(self, parent, canvas_width=10000, canvas_height=10000):
+    def __init__(self, parent, canvas_width=10000, canvas_height=10000, virtualized=False, dispatch=False,
+                 native_highlight=False, event_queue_maxsize=1000, event_queue_policy=GROW):
 
         # Initialize parent class
         tk.Frame.__init__(self, parent)
@@ -40,25 +49,114 @@ class GCanvas(tk.Frame):
         # Since each GObject has a unique name_tag, we will use a Dictionary keyed off of that to store them
         self.gobjects = {}
 
+        # Index from canvas item ID to the (GObject, GItem) that owns it, so that we don't have to search all of
+        # the GObjects to find out what was clicked.  GItems add themselves when their canvas item is created,
+        # and remove themselves when it's deleted.
+        self.item_index = {}
+
+        # The model coordinates of all of the GItems on the canvas, in one buffer.  See GCoordStore
+        self.coord_store = GCoordStore()
+
+        # Spatial indexes over the bounding boxes of the GObjects and of their GNodes, in model coordinates.  These
+        # answer "what is at/near/inside ..." without asking Tk to search every canvas item.  GObjects keep their
+        # entries up to date as they are created and moved.  See GObject.update_bounds()
+        self.spatial_index = GSpatialIndex(cell_size=100)
+        self.node_index = GSpatialIndex(cell_size=50)
+
+        # The GObjects that are currently selected.  GObject.set_selected() and clear_selected() keep this up to
+        # date, and a selection box only touches the GObjects whose selection changes.  See update_selection()
+        self.selection = set()
+
+        # Canvas items that are part of an interaction in progress (the selection box, the preview of a connection
+        # being made).  They are created once per gesture, moved with coords(), and live in the "overlays" layer.
+        self.overlays = set()
+
+        # The drag or connection the mouse is making on one of my GObjects.  See GInteraction
+        self.interaction = GInteraction()
+
+        # Stacking order (Z-order) is managed in layers, from the bottom up.  Each layer has a hidden marker item,
+        # and the items in a layer (tagged "layer:<name>") are kept just below their layer's marker, so they are
+        # above everything in the layers below, whatever order the items were created in.  Bringing something to
+        # the front then means moving it to the top of its own layer.  See restack() and raise_tag()
+        self.layers = ['background', 'bodies', 'wires', 'nodes', 'overlays']
+        self._layer_markers = {}
+        self._restack_pending = None
+
+        # When dragging GObjects, motion events are collected and applied at most once every this many milliseconds
+        # (~60 frames per second), so a fast mouse or trackpad doesn't cost more than one move per frame
+        self.drag_frame_interval = 16
+
+        # How close (in pixels) the end of a new connection has to be to a GNode to snap to it
+        self.snap_radius = 15
+
+        # While create_many() is building, the GItems waiting for their canvas items to be created
+        self.bulk_items = None
+
+        # The Tcl commands that create_many() binds GObjects' mouse events to:  one per handler method, which is
+        # given the GObject's name tag, rather than one per binding of each GObject.  See bulk_handler()
+        self._bulk_handlers = {}
+
         # Registered GObject Types/Kinds
         # The key will be the type name (e.g. 'Rectangle') with the value being a reference to the corresponding object
         # These types are registered with the GCanvas using the register_gobject() method.
         self.gobject_types = {}
 
         # The GCanvas has an associated GEventQueue which is the primary method of communication between
-        # this library and the user's code
-        self.event_queue = GEventQueue('GCanvas_Event_Queue', maxsize=100)
+        # this library and the user's code.  GEvents are posted with post_event(), and their virtual events
+        # (e.g. <<ClickableClicked>>) are generated once per idle cycle, however many GEvents were posted, so user
+        # code should take everything off the queue (drain_all()) each time.  See flush_events()
+        # What happens to GEvents posted while the queue is full is up to event_queue_policy (see GEventQueue).  By
+        # default the queue just grows, so no GEvent is lost, and event_queue.stats has the high-water mark;  with one
+        # of the policies that drop GEvents, it counts the ones dropped.  GEvents are posted on the Tk thread, which
+        # is also the one that drains the queue, so 'block' would wait forever
+        if event_queue_policy == BLOCK:
+            raise ValueError("the GCanvas event queue can't use the 'block' overflow policy")
+        self.event_queue = GEventQueue('GCanvas_Event_Queue', maxsize=event_queue_maxsize, policy=event_queue_policy)
+        self._event_types_posted = {}
+        self._event_flush_pending = None
+
+        # GEvents that user code has subscribed to are also sent straight to the handlers -- and only to them, if
+        # a handler subscribed exclusively.  See subscribe() and post_event()
+        self.dispatcher = GDispatcher()
+
+        # Changes to make to the canvas, sent from other threads.  Nothing is run until commands.start() is called
+        # (on the Tk thread).  See GCommandQueue
+        self.commands = GCommandQueue(self, interval=self.drag_frame_interval)
 
         # Where to send status messages
         self.status_var = None
 
         # Zoom Level
         #
-        # TODO: Question:  should this be a float (as it is now), or should we use an integer?  A float has limited
-        # TODO: precision, and we may lose detail after repeated zoom in / zoom out.  If we store the zoom level
-        # TODO: as an integer we wouldn't lose detail, as the int in python is not limited, but we'd have to do
-        # TODO: a conversion every time we use the zoom level immediately before use.
-        self.zoom_level = 1.0
+        # The zoom level is kept as an integer number of zoom steps, and zoom_level (the scale factor) is always
+        # re-computed from it, so zooming in and back out again returns to exactly the same scale.  Zooming is
+        # a view transform:  GObjects live in model coordinates, and canvas_x = model_x * zoom_level.
+        self.zoom_step = 0
+        self.zoom_factor = 1.1
+
+        # Outline widths are also in model units, and each GItem tags its canvas item with its width class
+        # (e.g. "width:2") so a zoom can re-scale all items with the same width in one itemconfigure().
+        # This is the set of (option, model width) classes in use.  See GItem._configure()
+        self.width_classes = set()
+
+        # In virtualized mode we keep every GObject, but only create canvas items for the GObjects that are
+        # within cull_margin pixels of the visible area.  GObjects further than twice that are deleted from
+        # the canvas again (the gap stops objects near the edge from flickering in and out).
+        self.virtualized = virtualized
+        self.cull_margin = 500
+
+        # The GObjects that have been materialized (see GObject.materialize()), so culling only has to look at them
+        # and at the GObjects the spatial index finds near the viewport, rather than at every GObject
+        self.materialized_gobjects = set()
+
+        # In dispatch mode, GObjects don't bind their own mouse events.  Instead, we bind each event sequence once
+        # (on the "all" tag), and route the event to the GObject that owns the canvas item.  See dispatch_event()
+        self.dispatch = dispatch
+
+        # With native highlighting, hovering over a GItem is left to Tk (using the activeoutline and activewidth
+        # options every GItem has), rather than setting the outline and width from <Enter> and <Leave> handlers.
+        # GItems in a highlight group are still highlighted together by the handlers.
+        self.native_highlight = native_highlight
 
         # Remember our current canvas dimensions (as they will change when we zoom in/out)
         self.canvas_width = canvas_width
@@ -75,23 +173,34 @@ class GCanvas(tk.Frame):
 
         self.tag = "BACKGROUND"
         self.bg_color = "#99bbff"
-        self.canvas.create_rectangle(0, 0, self.canvas_width, self.canvas_height,
-                                     fill=self.bg_color, outline=self.bg_color, tag=self.tag)
+        self._bg_item = self.canvas.create_rectangle(0, 0, self.canvas_width, self.canvas_height,
+                                                     fill=self.bg_color, outline=self.bg_color, tag=self.tag)
 
         # Ensure the background rectangle is lowered to the lowest possible layer in the stacking order
         self.canvas.tag_lower(self.tag)
 
+        # The layer markers, created bottom layer first, so they are stacked in layer order
+        for layer in self.layers:
+            self._layer_markers[layer] = self.canvas.create_line(0, 0, 0, 0, state='hidden', tags=("layer_marker",))
+
         # Create the scrollbars and associate one with the canvas
         self.xsb = ttk.Scrollbar(self, orient="horizontal", command=self.canvas.xview, style='TScrollbar')
         self.ysb = ttk.Scrollbar(self, orient="vertical", command=self.canvas.yview, style='TScrollbar')
 
-        # When the canvas is moved by click and drag, we also update the scrollbars to match
-        self.canvas.config(yscrollcommand=self.ysb.set)
-        self.canvas.config(xscrollcommand=self.xsb.set)
+        # Callbacks to be notified when the visible area of the canvas changes (pan, zoom, resize)
+        # See register_viewport_callback() and schedule_viewport_update()
+        self.viewport_callbacks = []
+        self._viewport_update_pending = None
+
+        # When the canvas is moved by click and drag, we also update the scrollbars to match.  Tk calls
+        # the scroll commands whenever the view changes, so we also use them to notice pan and zoom.
+        self.canvas.config(yscrollcommand=self.on_yscroll)
+        self.canvas.config(xscrollcommand=self.on_xscroll)
 
         # Limit scrolling of the canvas to the area we've drawn on.  This prevents us from scrolling
-        # past the edges of the graph paper and exposing blank canvas space
-        self.canvas.config(scrollregion=self.canvas.bbox(self.tag))
+        # past the edges of the graph paper and exposing blank canvas space.  We only look at our own
+        # background rectangle, as a bbox() of the whole BACKGROUND tag can cover thousands of items.
+        self.canvas.config(scrollregion=self.canvas.coords(self._bg_item))
 
         # Control how fast you can scroll.  The larger the number, the faster the scrolling, but less smooth
         self.canvas.config(xscrollincrement=1, yscrollincrement=1)
@@ -111,6 +220,9 @@ class GCanvas(tk.Frame):
         # Bindings for panning/scrolling the canvas.  May use 2-finger swipe gesture on the trackpad
         self.canvas.bind("<MouseWheel>", self.on_mousewheel)
 
+        # Resizing the window changes the viewport too
+        self.canvas.bind("<Configure>", self.on_configure, add='+')
+
         # Bindings for Zooming in/out
         self.canvas.bind("<Control-MouseWheel>", self.on_zoom)
         self.canvas.bind('<Control-4>', self.on_zoom, add='+')
@@ -123,7 +235,8 @@ class GCanvas(tk.Frame):
             "start_x": 0,
             "start_y": 0,
             "end_x": 0,
-            "end_y": 0}
+            "end_y": 0,
+            "box": None}
 
         # Bindings for selecting groups of canvas items with a rectangular selection box
         self.canvas.tag_bind(self.tag, "<ButtonPress-1>", self.on_button_press)
@@ -134,6 +247,30 @@ class GCanvas(tk.Frame):
         self.canvas.xview_moveto(0.5)
         self.canvas.yview_moveto(0.5)
 
+        # In dispatch mode, one binding per event sequence for all GObjects
+        if self.dispatch:
+            self._dispatch_table = {}
+            for (suffix, sequence, method) in GObject.mouse_binding_table:
+                self._dispatch_table.setdefault(sequence, []).append((suffix, method))
+
+            # On each tag, Tk only runs the most specific binding that matches an event.  A GObject's own
+            # ":clickable" tag has no <Command-ButtonPress-1> binding, so a Command-click still runs its
+            # <ButtonPress-1> one, but on the "all" tag that is hidden by the Command binding.  So a sequence
+            # with modifiers also runs the handlers of the plain sequence for the tags that don't bind it themselves
+            for (sequence, handlers) in list(self._dispatch_table.items()):
+                plain = self.plain_sequence(sequence)
+                if plain != sequence:
+                    suffixes = {suffix for (suffix, method) in handlers}
+                    handlers += [(suffix, method) for (suffix, method) in self._dispatch_table.get(plain, ())
+                                 if suffix not in suffixes]
+            for sequence in self._dispatch_table:
+                self.canvas.tag_bind("all", sequence,
+                                     lambda event, sequence=sequence: self.dispatch_event(sequence, event))
+
+        # In virtualized mode, (de)materialize GObjects as the viewport changes
+        if self.virtualized:
+            self.register_viewport_callback(self.update_culling)
+
     def register_gobject(self, name, a_class):
         self.gobject_types[name] = a_class
 
@@ -149,23 +286,122 @@ class GCanvas(tk.Frame):
         for g in self.gobjects.keys():
             print(f"     id={self.gobjects[g].id} name={g} label={self.gobjects[g].label}")
 
+    @staticmethod
+    def canonical_id(id):
+        """ canvas item IDs come back from Tk as an int, a str, or a tuple (e.g. from find_withtag('current')) """
+        if isinstance(id, (tuple, list)):
+            if not id:
+                return None
+            id = id[0]
+        try:
+            return int(id)
+        except (TypeError, ValueError):
+            return None
+
+    def lookup_id(self, id):
+        """ return the (GObject, GItem) that owns canvas item id, or (None, None) """
+        return self.item_index.get(self.canonical_id(id), (None, None))
+
     def get_gobject_by_id(self, id):
-        for g_object in self.gobjects.values():
-            if g_object._tag == 'BACKGROUND':
-                continue
-            found = g_object.get_item_by_id(id)
-            if found:
-                return g_object
-        return None
+        (g_object, g_item) = self.lookup_id(id)
+        if g_object is None or g_object._tag == 'BACKGROUND':
+            return None
+        return g_object
 
     def get_item_by_id(self, id):
-        for g_object in self.gobjects.values():
-            if g_object._tag == 'BACKGROUND':
-                continue
-            found = g_object.get_item_by_id(id)
-            if found:
-                return found
-        return None
+        (g_object, g_item) = self.lookup_id(id)
+        if g_object is None or g_object._tag == 'BACKGROUND':
+            return None
+        return g_item
+
+    # Spatial queries.  These all take canvas coordinates (like the Tk canvas find_* methods), and return GObjects.
+
+    def find_gobjects_at(self, x, y):
+        """ return the GObjects whose bounding box contains the point x, y """
+        zl = self.zoom_level
+        return self.spatial_index.query_point(x / zl, y / zl)
+
+    def find_gobjects_near(self, x, y, radius):
+        """ return the GObjects within radius pixels of the point x, y, nearest first """
+        zl = self.zoom_level
+        return self.spatial_index.query_radius(x / zl, y / zl, radius / zl)
+
+    def find_gobjects_in(self, x0, y0, x1, y1, enclosed=False):
+        """ return the GObjects overlapping (or with enclosed=True, entirely inside) the rectangle x0, y0, x1, y1 """
+        return self.spatial_index.query_rect(self.canvas_to_model((x0, y0, x1, y1)), enclosed=enclosed)
+
+    def find_node_near(self, x, y, radius=None, accept=None):
+        """ return the GNode nearest to the point x, y within radius pixels (default snap_radius), or None """
+        if radius is None:
+            radius = self.snap_radius
+        zl = self.zoom_level
+        return self.node_index.nearest(x / zl, y / zl, radius / zl, accept=accept)
+
+    @staticmethod
+    def plain_sequence(sequence):
+        """ the event sequence without its modifiers, e.g. <ButtonPress-1> for <Command-ButtonPress-1> """
+        fields = sequence.strip("<>").split("-")
+        while len(fields) > 1 and fields[0] in ("Command", "Control", "Shift", "Alt", "Option", "Meta"):
+            fields.pop(0)
+        return "<" + "-".join(fields) + ">"
+
+    def dispatch_event(self, sequence, event):
+        """
+        (dispatch mode) call the handlers of the GObject owning the current canvas item, just as if the GObject
+        had made its own bindings.  A handler only applies if the GItem has the tag (e.g. "<name>:draggable") it
+        would have been bound to.
+        """
+        (g_object, g_item) = self.lookup_id(self.canvas.find_withtag('current'))
+        if g_object is None or g_object._tag == 'BACKGROUND' or not g_object.mouse_enabled:
+            return
+        for (suffix, method) in self._dispatch_table[sequence]:
+            if g_object._tag + suffix in g_item._tags:
+                getattr(g_object, method)(event)
+
+    def register_viewport_callback(self, f):
+        """ f() will be called (at most once per idle cycle) after the visible area of the canvas changes """
+        self.viewport_callbacks.append(f)
+
+    def viewport(self):
+        """ return the visible area as canvas coordinates (x0, y0, x1, y1) """
+        x0 = self.canvas.canvasx(0)
+        y0 = self.canvas.canvasy(0)
+        x1 = self.canvas.canvasx(self.canvas.winfo_width())
+        y1 = self.canvas.canvasy(self.canvas.winfo_height())
+        return x0, y0, x1, y1
+
+    def schedule_viewport_update(self):
+        """ coalesce viewport changes so that the callbacks run once after a burst of pan/zoom events """
+        if self._viewport_update_pending is None:
+            self._viewport_update_pending = self.after_idle(self.update_viewport)
+
+    def update_viewport(self):
+        self._viewport_update_pending = None
+        for f in self.viewport_callbacks:
+            f()
+
+    def on_xscroll(self, first, last):
+        self.xsb.set(first, last)
+        self.schedule_viewport_update()
+
+    def on_yscroll(self, first, last):
+        self.ysb.set(first, last)
+        self.schedule_viewport_update()
+
+    def on_configure(self, event):
+        self.schedule_viewport_update()
+
+    @property
+    def zoom_level(self):
+        return self.zoom_factor ** self.zoom_step
+
+    def model_to_canvas(self, coords):
+        """ convert flat model coordinates (x0, y0, x1, y1, ...) to canvas coordinates """
+        return scale(coords, self.zoom_level)
+
+    def canvas_to_model(self, coords):
+        """ convert flat canvas coordinates (x0, y0, x1, y1, ...) to model coordinates """
+        return unscale(coords, self.zoom_level)
 
     def create(self, a_type, *args, **kwargs):
         """ Create a new GObject and add it to the GCanvas """
@@ -176,14 +412,148 @@ class GCanvas(tk.Frame):
         # Tell the GObject that we are the GCanvas that "owns" it
         gobject.gcanvas = self
 
-        # Now that the GObject we just created knows what GCanvas to draw on, let's add it to the canvas
-        gobject.add()
-
-        # GCanvas will remember what GObjects it holds in gobjects Dictionary
+        # GCanvas will remember what GObjects it holds in gobjects Dictionary.  The GObject's GItems look
+        # themselves up here when they are added, so this needs to happen before add()
         self.gobjects[gobject._tag] = gobject
 
+        # In virtualized mode, the GItems only remember what they would draw until we know the GObject is visible
+        if self.virtualized and gobject._tag != 'BACKGROUND':
+            gobject.materialized = False
+
+        # Now that the GObject we just created knows what GCanvas to draw on, let's add it to the canvas.  Doing
+        # it in a batch means each canvas item is created once, with all of the options and tags the GObject gives it
+        with gobject.batch():
+            gobject.add()
+        gobject.update_bounds()
+
+        if not gobject.materialized and gobject.intersects(self.cull_area(self.cull_margin)):
+            gobject.materialize()
+
         return gobject
 
+    def create_many(self, specs, mouse_bindings=False):
+        """
+        Create many GObjects at once.  Each spec is (type, args) or (type, args, kwargs), as would be passed to
+        create(type, *args, **kwargs).  With mouse_bindings=True, also does add_mouse_bindings() on each GObject.
+
+        Rather than one Tcl call for every canvas item and binding, we generate a single Tcl script that creates
+        all of the canvas items (and binds all of the bindings), and run it with one tk.eval().  The item IDs it
+        returns are then handed back to the GItems.
+        """
+        gobjects = []
+        g_items = self.bulk_items = []
+        try:
+            for spec in specs:
+                if len(spec) == 2:
+                    (a_type, args), kwargs = spec, {}
+                else:
+                    (a_type, args, kwargs) = spec
+                gobjects.append(self.create(a_type, *args, **kwargs))
+            self.bulk_items = None
+
+            widget = str(self.canvas)
+            creates = []
+            for g_item in g_items:
+                (coords, tags, options) = g_item.create_args()
+                creates.append(create_command(widget, g_item.item_type, coords, tags, options))
+
+            binds = []
+            if mouse_bindings and self.dispatch:
+                # nothing to bind, as the GCanvas already has the bindings
+                for gobject in gobjects:
+                    gobject.add_mouse_bindings()
+            elif mouse_bindings:
+                # The same bindings add_mouse_bindings() makes, but calling the shared handler commands
+                for gobject in gobjects:
+                    gobject.mouse_enabled = True
+                    for (suffix, sequence, method) in gobject.mouse_binding_table:
+                        script = 'if {"[%s %s %s]" == "break"} break\n' % (
+                            self.bulk_handler(method), tcl_quote(gobject._tag), self.canvas._subst_format_str)
+                        binds.append(bind_command(widget, gobject._tag + suffix, sequence, script))
+
+            if creates or binds:
+                ids = self.canvas.tk.splitlist(self.canvas.tk.eval(build_script(creates, binds)))
+                for (g_item, canvas_item) in zip(g_items, ids):
+                    g_item.created(int(canvas_item))
+                # Put them into their layers now, rather than showing them on top of everything until idle
+                self.restack()
+        finally:
+            self.bulk_items = None
+            # If something went wrong, don't leave GItems waiting for canvas items that will never come.  Delete
+            # whatever the script did create (nothing else is tagged with the new GObjects' tags), and create their
+            # canvas items one at a time instead
+            pending = [g_item for g_item in g_items if g_item._bulk_pending]
+            if pending:
+                self.canvas.delete(*sorted({g_item._tag for g_item in pending}))
+                for g_item in pending:
+                    g_item._bulk_pending = False
+                    g_item.materialize()
+
+        return gobjects
+
+    def bulk_handler(self, method):
+        """
+        the Tcl command (registered once per GCanvas) that calls method (e.g. 'on_button_press') of the GObject with
+        the name tag it's given, with the event that follows, as tkinter does for a binding
+        """
+        command = self._bulk_handlers.get(method)
+        if command is None:
+            def handler(tag, *args):
+                gobject = self.gobjects.get(tag)
+                if gobject is not None:
+                    return getattr(gobject, method)(self.canvas._substitute(*args))
+            command = self._bulk_handlers[method] = self.canvas._register(handler, None, 1)
+        return command
+
+    def move_gobjects(self, gobjects, dx, dy):
+        """
+        Move gobjects by dx, dy model units.  Their model coords are moved in one pass over the coordinate store,
+        and then sent to Tk all at once (see sync_coords()).  GWires with only one end moving are re-drawn.
+        """
+        gobjects = set(gobjects)
+        slots = [slot for gobject in gobjects for slot in gobject.slots]
+        self.coord_store.translate(slots, dx, dy)
+        self.coord_store.dirty.update(slots)
+
+        wires_dirty = set()
+        for gobject in gobjects:
+            gobject.translated(dx, dy)
+            for g_node in gobject._nodes.values():
+                for conn in g_node.connections:
+                    if conn.g_object not in gobjects:
+                        wires_dirty.add(conn.g_object)
+
+        self.sync_coords()
+        for wire in wires_dirty:
+            wire.update()
+
+    def sync_coords(self):
+        """ send the model coords of the GItems in the dirty slots of the coordinate store to Tk, in one go """
+        store = self.coord_store
+        commands = []
+        for slot in store.dirty:
+            g_item = store.items[slot]
+            if g_item.materialized:
+                commands.append(coords_command(str(self.canvas), g_item.item, self.model_to_canvas(store.get(slot))))
+        store.dirty.clear()
+        if commands:
+            self.canvas.tk.eval('\n'.join(commands))
+
+    def cull_area(self, margin):
+        """ return the viewport plus margin pixels on each side, in model coordinates """
+        (x0, y0, x1, y1) = self.viewport()
+        return tuple(self.canvas_to_model((x0 - margin, y0 - margin, x1 + margin, y1 + margin)))
+
+    def update_culling(self):
+        """ create canvas items for GObjects coming into view, and delete them for GObjects far out of view """
+        near = self.cull_area(self.cull_margin)
+        far = self.cull_area(2 * self.cull_margin)
+        for gobject in self.materialized_gobjects.difference(self.spatial_index.query_rect(far)):
+            gobject.dematerialize()
+        for gobject in self.spatial_index.query_rect(near):
+            if not gobject.materialized:
+                gobject.materialize()
+
     # Setup Click-and-Drag to pan the canvas.  Tkinter canvas provides scan_mark() and scan_dragto()
     # to assist in click-and-drag events.  We use these to pan/scroll the canvas.
 
@@ -211,45 +581,187 @@ class GCanvas(tk.Frame):
 
     def on_zoom(self, event):
         """
-        We scale the canvas and all items on it to simulate a zoom in/out
+        Zoom in/out by one zoom step, keeping the point under the mouse pointer where it is
         """
 
         #print(f"DEBUG: on_zoom() delta={event.delta} num={event.num} state={event.state} x={event.x} y={event.y}")
 
-        sf = 1.0
         w = self.canvas.winfo_width()
-        h = self.canvas.winfo_height()
-        (x0, y0, x1, y1) = self.canvas.bbox(self.tag)
+        old_zoom_level = self.zoom_level
 
-        # convert from screen coordinates to canvas coordinates (we want to scale relative to canvas coordinates)
-        cx = self.canvas.canvasx(event.x)
-        cy = self.canvas.canvasy(event.y)
+        # convert from screen coordinates to model coordinates (we want to zoom relative to the model)
+        mx = self.canvas.canvasx(event.x) / old_zoom_level
+        my = self.canvas.canvasy(event.y) / old_zoom_level
 
         # Zoom In
-        if (event.delta > 0 or event.num == 4) and ((y1 - y0) <= 50000):
-            sf = 1.1  # Just a tad more than 1
+        if (event.delta > 0 or event.num == 4) and (self.canvas_height * old_zoom_level <= 50000):
+            self.zoom_step += 1
 
         # Zoom Out
-        elif (event.delta < 0 or event.num == 5) and ((x1 - x0) - 1000 >= w):
-            sf = 0.9  # Just a tad less than 1
+        elif (event.delta < 0 or event.num == 5) and (self.canvas_width * old_zoom_level - 1000 >= w):
+            self.zoom_step -= 1
 
-        if sf != 1.0:
-            self.zoom_level *= sf
-            for gobject in self.gobjects.values():
-                gobject.scale(cx, cy, sf, sf)
+        else:
+            return
 
-        # Adjust the scroll region based on new canvas background size.  All canvas objects, including
-        # the background, have been scaled up or down, and since it's that background that
-        # determines our scroll region, we have to adjust it every time we zoom in or out.
-        self.canvas.configure(scrollregion=self.canvas.bbox(self.tag))
+        zl = self.zoom_level
+
+        # Re-project everything currently on the canvas in one go.  The background (which determines our
+        # scroll region) is scaled along with everything else.
+        self.canvas.scale("all", 0, 0, zl / old_zoom_level, zl / old_zoom_level)
+        for (option, width) in self.width_classes:
+            self.canvas.itemconfigure(f"{option}:{width:g}", **{option: width * zl})
+
+        # Adjust the scroll region to the new size of the background, and then scroll so that the model point
+        # that was under the mouse pointer still is
+        self.canvas.configure(scrollregion=(0, 0, self.canvas_width * zl, self.canvas_height * zl))
+        self.canvas.xview_moveto((mx * zl - event.x) / (self.canvas_width * zl))
+        self.canvas.yview_moveto((my * zl - event.y) / (self.canvas_height * zl))
+        self.schedule_viewport_update()
 
         # Show current Zoom Level in the status bar
         if self.status_var:
-            self.status_var.set(f"Zoom Level: {self.zoom_level}")
+            self.status_var.set(f"Zoom Level: {zl}")
+
+    def update_selection(self, gobjects):
+        """
+        make gobjects the selection, calling set_selected()/clear_selected() only on the GObjects whose selection
+        status actually changes, and then announce the change
+        """
+        new_selection = set(g for g in gobjects if g.selectable)
+        added = new_selection - self.selection
+        removed = self.selection - new_selection
+        for gobject in removed:
+            gobject.clear_selected()
+        for gobject in added:
+            gobject.set_selected()
+        self.selection_changed(added=list(added), removed=list(removed))
+
+    def clear_selection(self):
+        self.update_selection([])
+
+    def selection_changed(self, added, removed):
+        """ post a SelectionChanged GEvent (if anything changed) """
+        if not added and not removed:
+            return
+
+        # construct event payload
+        event_data = SelectionChangedData(
+            added=added,
+            removed=removed,
+            selection=list(self.selection),
+        )
+
+        # send the GEvent to its subscribers, and to user code via the GEventQueue and virtual event
+        self.post_event(GEvent(GEventType.SELECTION_CHANGED, event_data))
+
+    def subscribe(self, event_type, handler, gobject_type=None, tag=None, exclusive=False):
+        """
+        Call handler(g_event) for each GEvent of event_type (see GEventType), optionally only for the GEvents about
+        GObjects of gobject_type (a GObject class or registered type name, e.g. 'GAndGate') or with name tag tag.
+        The GEvents still go on the GEventQueue, with their virtual events, unless the subscription is exclusive.
+        Returns a token to unsubscribe() with.  See GDispatcher
+        """
+        if isinstance(gobject_type, str):
+            gobject_type = self.gobject_types[gobject_type]
+        return self.dispatcher.subscribe(event_type, handler, gobject_type=gobject_type, tag=tag, exclusive=exclusive)
+
+    def unsubscribe(self, token):
+        self.dispatcher.unsubscribe(token)
+
+    def events(self, *event_types):
+        """
+        For asyncio:  an async iterator over the GEvents of event_types (or all of them) as they happen, e.g.
+            async for event in gcanvas.events(GEventType.CLICKABLE_CLICKED): ...
+        See gasync.py
+        """
+        return gasync.events(self, *event_types)
+
+    async def wait_for(self, event_type, predicate=None, gobject_type=None, tag=None, timeout=None):
+        """ For asyncio:  await the next GEvent of event_type.  See gasync.wait_for() """
+        return await gasync.wait_for(self, event_type, predicate, gobject_type=gobject_type, tag=tag, timeout=timeout)
+
+    async def wait_for_connection(self, g_object=None, timeout=None):
+        """ For asyncio:  await the next connection made (to or from g_object, if given) """
+        return await gasync.wait_for_connection(self, g_object, timeout=timeout)
+
+    async def wait_for_click(self, g_object=None, timeout=None):
+        """ For asyncio:  await the next click on a clickable GItem (of g_object, if given) """
+        return await gasync.wait_for_click(self, g_object, timeout=timeout)
+
+    def post_event(self, g_event):
+        """
+        Send g_event to the handlers subscribed to its type, put it on my GEventQueue, and generate its virtual
+        event (e.g. <<ClickableClicked>>) when idle.  A handler that subscribed exclusively takes it, though, and
+        then it isn't queued
+        """
+        if self.dispatcher.subscribed(g_event.event_type) and self.dispatcher.deliver(g_event)[1]:
+            return
+        self.event_queue.put_event(g_event)
+        # a dict, so the virtual events are generated in the order their first GEvent was posted
+        self._event_types_posted[g_event.event_type] = None
+        if self._event_flush_pending is None:
+            self._event_flush_pending = self.after_idle(self.flush_events)
+
+    def flush_events(self):
+        """ generate one virtual event for each type of GEvent posted since the last time """
+        self._event_flush_pending = None
+        (event_types, self._event_types_posted) = (self._event_types_posted, {})
+        for event_type in event_types:
+            self.canvas.event_generate(f"<<{event_type}>>")
+
+    def create_overlay(self, item_type, coords, tags=(), **options):
+        """ create a canvas item (e.g. 'rectangle') for an interaction in progress, on top of everything else """
+        tags = ("overlay", self.layer_tag('overlays')) + tuple(tags)
+        item = getattr(self.canvas, 'create_' + item_type)(coords, tags=tags, **options)
+        self.overlays.add(item)
+        return item
+
+    def delete_overlay(self, item):
+        if item in self.overlays:
+            self.overlays.discard(item)
+            self.canvas.delete(item)
+
+    @staticmethod
+    def layer_tag(layer):
+        """ the tag of the canvas items in layer """
+        return "layer:" + layer
+
+    def layer_marker(self, layer):
+        """ the canvas item that the items of layer are stacked just below """
+        return self._layer_markers[layer]
+
+    def schedule_restack(self):
+        """ put newly created canvas items into their layers once things go idle """
+        if self._restack_pending is None:
+            self._restack_pending = self.after_idle(self.restack)
+
+    def restack(self):
+        """
+        New canvas items are created on top of everything, so move every item just below its layer's marker.
+        This is one tag_lower() per layer, and keeps the stacking order of the items within each layer.
+        """
+        if self._restack_pending is not None:
+            self.after_cancel(self._restack_pending)
+            self._restack_pending = None
+        for layer in self.layers:
+            self.canvas.tag_lower(self.layer_tag(layer), self._layer_markers[layer])
+
+    def raise_tag(self, tag_expr, layers=('bodies', 'wires', 'nodes')):
+        """
+        Bring the canvas items matching tag_expr (a tag or tag search expression) to the front of their layers,
+        with one tag_lower() per layer, no matter how many items match
+        """
+        for layer in layers:
+            self.canvas.tag_lower(f"({tag_expr})&&{self.layer_tag(layer)}", self._layer_markers[layer])
+
+    def raise_gobjects(self, gobjects):
+        """ Bring gobjects to the front (of their layers), keeping their stacking order """
+        tags = {gobject._tag for gobject in gobjects}
+        if tags:
+            self.raise_tag("||".join(sorted(tags)))
 
     def on_button_press(self, event):
-        # Clear any current selection first
-        self.canvas.dtag("all", "selected")
         # Convert window coordinates into canvas coordinates
         x = self.canvas.canvasx(event.x)
         y = self.canvas.canvasy(event.y)
@@ -258,8 +770,10 @@ class GCanvas(tk.Frame):
         # Save the location of the initial click
         self._drag_data["start_x"] = x
         self._drag_data["start_y"] = y
-        # Create the selection rectangle
-        self.canvas.create_rectangle(x, y, x, y, tags="selection_box")
+        # Create the selection rectangle.  We re-use it until the button is released.
+        if self._drag_data["box"] is not None:
+            self.delete_overlay(self._drag_data["box"])
+        self._drag_data["box"] = self.create_overlay('rectangle', (x, y, x, y), tags=("selection_box",))
 
         if self.status_var:
             self.status_var.set("Starting selection...")
@@ -272,10 +786,24 @@ class GCanvas(tk.Frame):
         #print("DEBUG: Release ({},{})".format(x, y))
         self._drag_data["end_x"] = x
         self._drag_data["end_y"] = y
-        self.canvas.delete("selection_box")
-        # for all items within the selection box, add the "selected" tag, and then trigger the virtual <<Selection>> event
-        self.canvas.addtag_enclosed("selected", self._drag_data["start_x"], self._drag_data["start_y"],
-                                    self._drag_data["end_x"], self._drag_data["end_y"])
+        if self._drag_data["box"] is not None:
+            self.delete_overlay(self._drag_data["box"])
+            self._drag_data["box"] = None
+        # Select the GObjects with items within the selection box, and then trigger the virtual <<Selection>> event
+        # The spatial index gives us the GObjects that could have items in the box, and we only check their GItems
+        area = self.canvas_to_model((self._drag_data["start_x"], self._drag_data["start_y"],
+                                     self._drag_data["end_x"], self._drag_data["end_y"]))
+        (ax0, ay0, ax1, ay1) = (min(area[0], area[2]), min(area[1], area[3]),
+                                max(area[0], area[2]), max(area[1], area[3]))
+        enclosed = set()
+        for gobject in self.spatial_index.query_rect(area):
+            for g_item in gobject._items.values():
+                (x0, y0, x1, y1) = g_item.bounds
+                if x0 >= ax0 and y0 >= ay0 and x1 <= ax1 and y1 <= ay1:
+                    # If any part of a GObject is in the box, the whole GObject is selected
+                    enclosed.add(gobject)
+                    break
+        self.update_selection(enclosed)
         self.canvas.event_generate("<<Selection>>")
 
         if self.status_var:
@@ -285,9 +813,9 @@ class GCanvas(tk.Frame):
         # Convert window coordinates into canvas coordinates
         x = self.canvas.canvasx(event.x)
         y = self.canvas.canvasy(event.y)
-        # Handle resize of the rectangular selection box - Delete and re-draw the selection box
-        self.canvas.delete("selection_box")
-        self.canvas.create_rectangle(self._drag_data["start_x"], self._drag_data["start_y"], x, y, tags="selection_box")
+        # Handle resize of the rectangular selection box
+        if self._drag_data["box"] is not None:
+            self.canvas.coords(self._drag_data["box"], self._drag_data["start_x"], self._drag_data["start_y"], x, y)
 
         if self.status_var:
             self.status_var.set("Dragging Selection Box...")
@@ -0,0 +1,117 @@
+import threading
+from collections import OrderedDict
+
+
+class GCommandQueue:
+    """
+    Changes to a GCanvas sent from other threads.
+
+    Tk isn't thread-safe, so worker threads (a simulation, a file being loaded, ...) must not touch the canvas, or
+    the GObjects on it, themselves.  Instead they put commands here (create, move, set_state, set_color, ...), and
+    the Tk thread runs them:  once start() has been called (on the Tk thread), up to batch_size commands every
+    interval milliseconds, so a flood of commands can't stop the canvas from redrawing.
+
+    Commands that only set something wait under a key, e.g. (g_item, 'fill_color'), and a command put with the key
+    of one that's still waiting replaces it (keeping its place in line), so a GItem's color that changes a hundred
+    times between frames is only set once.  Moves of the same GObject are added up into one move, which goes to the
+    back of the line with the latest of them, so it still runs after any command put between them.
+    """
+
+    def __init__(self, gcanvas, batch_size=500, interval=16):
+        self.gcanvas = gcanvas
+        self.batch_size = batch_size
+        self.interval = interval
+
+        # key -> (function, args), in the order they are to be run
+        self._commands = OrderedDict()
+        self._lock = threading.Lock()
+
+        # a key for each command that doesn't have one
+        self._next_key = 0
+
+        # the pending after() callback, while started
+        self._pending = None
+
+        # counters
+        self.executed = 0
+        self.coalesced = 0
+
+    def __len__(self):
+        return len(self._commands)
+
+    def put(self, function, *args, key=None):
+        """ (from any thread) run function(*args) on the Tk thread, instead of any command still waiting with key """
+        with self._lock:
+            if key is None:
+                self._next_key += 1
+                key = self._next_key
+            elif key in self._commands:
+                self.coalesced += 1
+            self._commands[key] = (function, args)
+
+    def create(self, a_type, *args, callback=None, **kwargs):
+        """ (from any thread) create a GObject, and then call callback(gobject) if given, e.g. to show it """
+        def create():
+            gobject = self.gcanvas.create(a_type, *args, **kwargs)
+            if callback is not None:
+                callback(gobject)
+        self.put(create)
+
+    def move(self, gobject, dx, dy):
+        """ (from any thread) move gobject by dx, dy model units """
+        key = (gobject, 'move')
+        with self._lock:
+            if key in self._commands:
+                (function, (gobjects, dx0, dy0)) = self._commands[key]
+                (dx, dy) = (dx0 + dx, dy0 + dy)
+                self.coalesced += 1
+                self._commands.move_to_end(key)
+            self._commands[key] = (self.gcanvas.move_gobjects, ([gobject], dx, dy))
+
+    def set_state(self, gobject, state):
+        """ (from any thread) set the state of e.g. a GToggleSwitch or GLightBulb """
+        self.set_property(gobject, 'state', state)
+
+    def set_color(self, g_item, color):
+        """ (from any thread) set the fill color of a GItem """
+        self.set_property(g_item, 'fill_color', color)
+
+    def set_property(self, target, name, value):
+        """ (from any thread) set a property of a GItem or GObject """
+        self.put(setattr, target, name, value, key=(target, name))
+
+    def drain(self, limit=None):
+        """ (on the Tk thread) run the commands waiting, or the first limit of them, and return how many ran """
+        with self._lock:
+            count = len(self._commands) if limit is None else min(limit, len(self._commands))
+            batch = [self._commands.popitem(last=False) for i in range(count)]
+        ran = 0
+        try:
+            for (key, (function, args)) in batch:
+                ran += 1
+                function(*args)
+        finally:
+            self.executed += ran
+            if ran < count:
+                # a command raised an exception, so put back the ones after it (unless they've been replaced)
+                with self._lock:
+                    for (key, command) in reversed(batch[ran:]):
+                        if key not in self._commands:
+                            self._commands[key] = command
+                            self._commands.move_to_end(key, last=False)
+        return ran
+
+    def start(self):
+        """ (on the Tk thread) start running the commands as they come in """
+        if self._pending is None:
+            self._pending = self.gcanvas.after(self.interval, self._run)
+
+    def stop(self):
+        if self._pending is not None:
+            self.gcanvas.after_cancel(self._pending)
+            self._pending = None
+
+    def _run(self):
+        # schedule the next batch first, so one bad command doesn't stop the rest
+        self._pending = self.gcanvas.after(self.interval, self._run)
+        self.drain(self.batch_size)
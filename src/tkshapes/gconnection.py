@@ -3,6 +3,8 @@ class GConnection:
 
     gconn_id = 1_000_000_000
 
+    __slots__ = ('id', 'name', 'g_object', 'g_nodes', 'max_nodes')
+
     def __init__(self, name, g_object):
         self.id = self.next_id()
         self.name = name
@@ -0,0 +1,108 @@
+import sys
+
+from .gevent import GEventData
+
+
+class GDispatcher:
+    """
+    Routes each GEvent to the handlers subscribed to its event type.
+
+    A subscription can be narrowed down to GObjects of a type (a GObject class, including its sub-classes) and/or
+    to a single GObject (by its name tag).  Those filters are checked against the GObjects the event is about (see
+    GEventData.gobject_fields), so an event that isn't about a GObject only goes to unfiltered subscriptions.
+
+    A subscription can also be exclusive:  an event delivered to an exclusive subscription is taken by it, and
+    deliver() says so, so the GCanvas doesn't put it on its GEventQueue as well.  See GCanvas.post_event()
+
+    The handlers for an event type and a GObject class are worked out the first time they are needed and kept in a
+    table, so dispatching an event is a dictionary lookup or two, however many other handlers there are.  The table
+    is thrown away whenever the subscriptions change.
+    """
+
+    def __init__(self):
+        # token -> (event type, handler, GObject type, tag, exclusive)
+        self._subscriptions = {}
+        self._next_token = 0
+
+        # event type -> [(handler, GObject type, exclusive)] for the subscriptions without a tag
+        self._by_type = {}
+
+        # event type -> tag -> [(handler, GObject type, exclusive)]
+        self._by_tag = {}
+
+        # (event type, GObject class) -> [(handler, exclusive)].  See subscriptions()
+        self._table = {}
+
+    def __len__(self):
+        return len(self._subscriptions)
+
+    def subscribe(self, event_type, handler, gobject_type=None, tag=None, exclusive=False):
+        """ call handler(g_event) for each GEvent of event_type, and return a token to unsubscribe() with """
+        self._next_token += 1
+        self._subscriptions[self._next_token] = (sys.intern(str(event_type)), handler, gobject_type, tag, exclusive)
+        self._rebuild()
+        return self._next_token
+
+    def unsubscribe(self, token):
+        if self._subscriptions.pop(token, None) is not None:
+            self._rebuild()
+
+    def _rebuild(self):
+        self._by_type = {}
+        self._by_tag = {}
+        self._table = {}
+        for (event_type, handler, gobject_type, tag, exclusive) in self._subscriptions.values():
+            if tag is None:
+                self._by_type.setdefault(event_type, []).append((handler, gobject_type, exclusive))
+            else:
+                self._by_tag.setdefault(event_type, {}).setdefault(tag, []).append((handler, gobject_type, exclusive))
+
+    def subscribed(self, event_type):
+        """ if anything is subscribed to event_type """
+        return event_type in self._by_type or event_type in self._by_tag
+
+    def subscriptions(self, event_type, gobject=None):
+        """ the (handler, exclusive) pairs for an event of event_type about gobject (or about no GObject at all) """
+        cls = None if gobject is None else type(gobject)
+        subscriptions = self._table.get((event_type, cls))
+        if subscriptions is None:
+            subscriptions = tuple((handler, exclusive)
+                                  for (handler, gobject_type, exclusive) in self._by_type.get(event_type, ())
+                                  if gobject_type is None or (cls is not None and issubclass(cls, gobject_type)))
+            self._table[(event_type, cls)] = subscriptions
+        if gobject is not None and event_type in self._by_tag:
+            tagged = self._by_tag[event_type].get(gobject._tag)
+            if tagged:
+                subscriptions += tuple((handler, exclusive) for (handler, gobject_type, exclusive) in tagged
+                                       if gobject_type is None or isinstance(gobject, gobject_type))
+        return subscriptions
+
+    def handlers(self, event_type, gobject=None):
+        """ the handlers for an event of event_type about gobject (or about no GObject at all) """
+        return tuple(handler for (handler, exclusive) in self.subscriptions(event_type, gobject))
+
+    def deliver(self, g_event):
+        """
+        call the handlers interested in g_event, and return how many there were, and whether any of them was
+        subscribed exclusively (so nothing else should get it)
+        """
+        data = g_event.event_data
+        gobjects = data.gobjects() if isinstance(data, GEventData) else []
+        if not gobjects:
+            subscriptions = self.subscriptions(g_event.event_type)
+        else:
+            # an event about two GObjects (e.g. a connection) goes to each handler once
+            handlers = {}
+            for gobject in gobjects:
+                for (handler, exclusive) in self.subscriptions(g_event.event_type, gobject):
+                    handlers[handler] = handlers.get(handler, False) or exclusive
+            subscriptions = handlers.items()
+        taken = False
+        for (handler, exclusive) in subscriptions:
+            handler(g_event)
+            taken = taken or exclusive
+        return (len(subscriptions), taken)
+
+    def dispatch(self, g_event):
+        """ call the handlers interested in g_event, and return how many there were """
+        return self.deliver(g_event)[0]
@@ -1,18 +1,91 @@
 import queue
+import sys
+import threading
+
+# GEventQueue overflow policies
+DROP_NEWEST = 'drop_newest'
+DROP_OLDEST = 'drop_oldest'
+BLOCK = 'block'
+COALESCE = 'coalesce'
+GROW = 'grow'
+
+
+class GEventType:
+    """
+    The types of GEvent the library posts.  Event types are interned strings, so they can be used (and compared,
+    and hashed) as the plain strings they always were, e.g. event.event_type == 'ClickableClicked'
+    """
+    CLICKABLE_CLICKED = sys.intern('ClickableClicked')
+    ADD_CONNECTION = sys.intern('AddConnection')
+    SELECTION_CHANGED = sys.intern('SelectionChanged')
+
+    # all of the above
+    ALL = (CLICKABLE_CLICKED, ADD_CONNECTION, SELECTION_CHANGED)
+
+
+class GEventData:
+    """
+    The payload of a GEvent.  Each type of payload lists its fields in __slots__, and they can be read as attributes
+    (event_data.g_object) or by key (event_data['g_object']), like the dicts payloads used to be
+    """
+
+    __slots__ = ()
+
+    # the fields that hold the GObjects the event is about.  See GDispatcher
+    gobject_fields = ()
+
+    def __init__(self, **fields):
+        for (name, value) in fields.items():
+            setattr(self, name, value)
+
+    def __getitem__(self, key):
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def keys(self):
+        return self.__slots__
+
+    def gobjects(self):
+        """ the GObjects the event is about """
+        return [getattr(self, name) for name in self.gobject_fields]
+
+    def __repr__(self):
+        fields = ", ".join(f"{name}={getattr(self, name, None)!r}" for name in self.__slots__)
+        return f"{type(self).__name__}({fields})"
+
+
+class ClickableClickedData(GEventData):
+    __slots__ = ('canvas_item', 'g_item', 'g_object')
+    gobject_fields = ('g_object',)
+
+
+class AddConnectionData(GEventData):
+    __slots__ = ('from_canvas_item', 'from_g_item', 'from_g_object', 'from_g_node',
+                 'to_canvas_item', 'to_g_item', 'to_g_object', 'to_g_node')
+    gobject_fields = ('from_g_object', 'to_g_object')
+
+
+class SelectionChangedData(GEventData):
+    __slots__ = ('added', 'removed', 'selection')
+
 
 class GEvent:
-    """ docstring """
+    """ A message from the library to the user's code:  an event type (see GEventType) and its data """
 
     g_event_id = 1_000_000_000
 
+    __slots__ = ('event_id', 'event_type', 'event_data')
+
     def __init__(self, event_type, event_data):
         """ Initialize a GEvent given event_type and event_data """
 
         # A unique numerical identifier assigned to the event
         self.event_id = self.next_id()
 
-        # A string identifying the event type
-        self.event_type = str(event_type)
+        # A string identifying the event type (interned, see GEventType)
+        self.event_type = sys.intern(str(event_type))
 
         # Each event_type can have it's own associated data
         self.event_data = event_data
@@ -25,35 +98,164 @@ class GEvent:
 
 
 class GEventQueue:
-    """ the event queue can hold GEvent objects """
+    """
+    A ring buffer of GEvents, first in first out.
+
+    What happens when a GEvent is put on a full queue is up to the overflow policy:
 
-    def __init__(self, name, maxsize=100):
+        'drop_newest'  the new GEvent is dropped, and put_event() returns False (the default)
+        'drop_oldest'  the oldest GEvent waiting is dropped to make room for it
+        'block'        put_event() waits for room -- for producers on other threads only, as the Tk thread is the
+                       one that drains the queue
+        'coalesce'     a GEvent with the same key as one already waiting replaces it, keeping its place in line, so
+                       a burst of them leaves only the latest.  The key is the event type, unless a key function is
+                       given.  A GEvent with a new key that doesn't fit is dropped, as with 'drop_newest'
+        'grow'         the ring buffer doubles in size, so no GEvent is ever lost.  maxsize is only where it starts,
+                       and the high-water mark says how big a backlog there has been
+
+    The queue can be used from more than one thread.  It counts the GEvents enqueued, dropped and coalesced, and the
+    most it has held at once (the high-water mark).  See stats
+    """
+
+    policies = (DROP_NEWEST, DROP_OLDEST, BLOCK, COALESCE, GROW)
+
+    def __init__(self, name, maxsize=100, policy=DROP_NEWEST, key=None):
+        if policy not in self.policies:
+            raise ValueError(f"unknown overflow policy {policy!r}")
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
         self.name = str(name)
-        self.events = queue.Queue(maxsize=maxsize)
+        self.maxsize = maxsize
+        self.policy = policy
+        self._key = key or (lambda g_event: g_event.event_type)
+
+        # the ring buffer:  _count GEvents, the oldest at _head
+        self._events = [None] * maxsize
+        self._head = 0
+        self._count = 0
+
+        # when coalescing, where the GEvent waiting with each key is in the ring buffer
+        self._positions = {}
+
+        self._lock = threading.Lock()
+        self._not_full = threading.Condition(self._lock)
+
+        # counters.  See stats
+        self.enqueued = 0
+        self.dropped = 0
+        self.coalesced = 0
+        self.high_water = 0
+
+    def __len__(self):
+        return self._count
+
+    def _pop(self):
+        """ take the oldest GEvent out of the ring buffer (with the lock held) """
+        g_event = self._events[self._head]
+        self._events[self._head] = None
+        if self.policy == COALESCE:
+            del self._positions[self._key(g_event)]
+        self._head = (self._head + 1) % self.maxsize
+        self._count -= 1
+        self._not_full.notify()
+        return g_event
+
+    def _grow(self):
+        """ double the size of the ring buffer, oldest GEvent first (with the lock held) """
+        events = [self._events[(self._head + i) % self.maxsize] for i in range(self._count)]
+        self.maxsize *= 2
+        self._events = events + [None] * (self.maxsize - self._count)
+        self._head = 0
 
     def get_event(self):
-        try:
-            return self.events.get_nowait()
-        except queue.Empty:
-            pass
-        return None
+        """ return the oldest GEvent, or None if there aren't any """
+        with self._lock:
+            if not self._count:
+                return None
+            return self._pop()
 
-    def put_event(self, g_event):
+    def drain_all(self):
+        """ return all of the GEvents waiting, oldest first, and empty the queue """
+        with self._lock:
+            return [self._pop() for i in range(self._count)]
+
+    def put_event(self, g_event, timeout=None):
+        """ add g_event to the queue, and return True, or False if it was dropped (see the overflow policies) """
         if type(g_event) != GEvent:
             raise TypeError
-        try:
-            self.events.put_nowait(g_event)
+        with self._lock:
+            if self.policy == COALESCE:
+                key = self._key(g_event)
+                position = self._positions.get(key)
+                if position is not None:
+                    self._events[position] = g_event
+                    self.coalesced += 1
+                    return True
+
+            if self._count == self.maxsize:
+                if self.policy == GROW:
+                    self._grow()
+                elif self.policy == DROP_OLDEST:
+                    self._pop()
+                    self.dropped += 1
+                elif self.policy == BLOCK:
+                    if not self._not_full.wait_for(lambda: self._count < self.maxsize, timeout):
+                        self.dropped += 1
+                        return False
+                else:
+                    self.dropped += 1
+                    return False
+
+            position = (self._head + self._count) % self.maxsize
+            self._events[position] = g_event
+            if self.policy == COALESCE:
+                self._positions[key] = position
+            self._count += 1
+            self.enqueued += 1
+            self.high_water = max(self.high_water, self._count)
             return True
-        except queue.Full:
-            pass
-        return False
+
+    @property
+    def stats(self):
+        """ the counters, and how many GEvents are waiting now """
+        return {
+            'size': self._count,
+            'enqueued': self.enqueued,
+            'dropped': self.dropped,
+            'coalesced': self.coalesced,
+            'high_water': self.high_water,
+        }
 
     def get_qsize(self):
-        return self.events.qsize()
+        return self._count
 
     def is_empty(self):
-        return self.events.empty()
+        return self._count == 0
 
     def is_full(self):
-        return self.events.full()
+        return self.policy != GROW and self._count == self.maxsize
+
+    # GEventQueue used to keep its GEvents in a queue.Queue, as .events.  This is that API, for code that still uses it
+
+    @property
+    def events(self):
+        return self
+
+    def qsize(self):
+        return self.get_qsize()
+
+    def empty(self):
+        return self.is_empty()
+
+    def full(self):
+        return self.is_full()
+
+    def get_nowait(self):
+        with self._lock:
+            if not self._count:
+                raise queue.Empty
+            return self._pop()
 
+    def put_nowait(self, g_event):
+        if not self.put_event(g_event):
+            raise queue.Full
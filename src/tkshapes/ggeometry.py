@@ -0,0 +1,85 @@
+
+import math
+
+# NumPy is optional.  When it's installed, the functions below work on whole coordinate arrays at once, and
+# when it isn't, they fall back to plain Python loops (with the same results).
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# Below this many coordinates, converting to and from a NumPy array costs more than it saves
+NUMPY_THRESHOLD = 64
+
+
+# All of the coordinates here are flat lists:  [x0, y0, x1, y1, ...]
+# The results are always lists of Python floats, which is what the canvas wants
+
+
+def use_numpy(n):
+    return numpy is not None and n >= NUMPY_THRESHOLD
+
+
+def arc(cx, cy, rx, ry, start, stop):
+    """
+    The points of an arc of the ellipse centered on cx, cy with radii rx, ry, with one point per degree from
+    start up to (not including) stop
+    See Also: https://en.wikipedia.org/wiki/Unit_circle
+    """
+    if use_numpy(2 * (stop - start)):
+        angles = numpy.radians(numpy.arange(start, stop, dtype=float))
+        points = numpy.empty(2 * len(angles))
+        points[0::2] = numpy.cos(angles) * rx + cx
+        points[1::2] = numpy.sin(angles) * ry + cy
+        return points.tolist()
+    points = []
+    for angle in range(start, stop):
+        points.extend(((math.cos(math.radians(angle)) * rx) + cx, (math.sin(math.radians(angle)) * ry) + cy))
+    return points
+
+
+def transform(coords, dx=0, dy=0, factor=1.0):
+    """ scale coords by factor (about 0, 0), then move them by dx, dy """
+    if use_numpy(len(coords)):
+        points = numpy.asarray(coords, dtype=float) * factor
+        points[0::2] += dx
+        points[1::2] += dy
+        return points.tolist()
+    points = list(coords)
+    points[0::2] = [dx + v * factor for v in coords[0::2]]
+    points[1::2] = [dy + v * factor for v in coords[1::2]]
+    return points
+
+
+def scale(coords, factor):
+    """ scale coords by factor (about 0, 0) """
+    if use_numpy(len(coords)):
+        return (numpy.asarray(coords, dtype=float) * factor).tolist()
+    return [v * factor for v in coords]
+
+
+def unscale(coords, factor):
+    """ undo scale(coords, factor) """
+    if use_numpy(len(coords)):
+        return (numpy.asarray(coords, dtype=float) / factor).tolist()
+    return [v / factor for v in coords]
+
+
+def rotate(coords, angle, cx=0, cy=0):
+    """ rotate coords by angle radians (clockwise on the canvas, where y is down) about cx, cy """
+    cos = math.cos(angle)
+    sin = math.sin(angle)
+    if use_numpy(len(coords)):
+        points = numpy.asarray(coords, dtype=float)
+        xs = points[0::2] - cx
+        ys = points[1::2] - cy
+        rotated = numpy.empty(len(points))
+        rotated[0::2] = xs * cos - ys * sin + cx
+        rotated[1::2] = xs * sin + ys * cos + cy
+        return rotated.tolist()
+    rotated = []
+    for i in range(0, len(coords) - 1, 2):
+        x = coords[i] - cx
+        y = coords[i + 1] - cy
+        rotated.extend((x * cos - y * sin + cx, x * sin + y * cos + cy))
+    return rotated
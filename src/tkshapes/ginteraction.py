@@ -0,0 +1,34 @@
+
+class GInteraction:
+    """
+    The scratch state of the drag or connection the mouse is in the middle of.  There's only one mouse, so a
+    GCanvas keeps one of these for all of its GObjects, rather than each GObject carrying its own.
+    """
+
+    __slots__ = ('drag', 'connection')
+
+    def __init__(self):
+
+        # Keep track of a canvas object being dragged.  Motion events only add to dx/dy, and the move is applied
+        # at most once per frame (frame is the pending after() callback).  See GObject.on_button_motion()
+        # The GObjects and GWires that move with it are worked out when the drag starts.  See GObject.start_drag()
+        self.drag = {
+            "x": 0,
+            "y": 0,
+            "item": None,
+            "dx": 0,
+            "dy": 0,
+            "frame": None,
+            "moving": [],
+            "slots": [],
+            "wires_moving": [],
+            "wires_dirty": [],
+        }
+
+        # Keep track of a connection as we are selecting the starting and ending points
+        self.connection = {
+            "start_x": 0,
+            "start_y": 0,
+            "line1": None,
+            "line2": None,
+        }
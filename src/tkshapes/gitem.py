@@ -1,9 +1,42 @@
 
+from contextlib import contextmanager
+
+
+def flatten(points):
+    """ turn [(x0, y0), (x1, y1), ...] or (x0, y0, x1, y1, ...) into a flat list [x0, y0, x1, y1, ...] """
+    flat = []
+    for p in points:
+        if isinstance(p, (list, tuple)):
+            flat.extend(p)
+        else:
+            flat.append(p)
+    return flat
+
+
 class GItem:
     """
     A wrapper around a single canvas item
     """
 
+    # The kind of canvas item I manage (as reported by canvas.type()) -- set by each sub-class
+    item_type = None
+
+    # The GCanvas layer my canvas item goes in, unless I'm told otherwise
+    default_layer = 'bodies'
+
+    # A drawing can have hundreds of thousands of GItems, so they don't each get a __dict__.  A sub-class that
+    # needs more attributes adds them to its own __slots__
+    __slots__ = (
+        '_x', '_y', '_gcanvas', '_tag', '_owner', '_canvas_item', '_slot', '_options', '_tags',
+        '_batch', '_create_pending', '_pending_options', '_pending_tags', '_bulk_pending',
+        '_hidden', '_item_state', '_selected',
+        '_fill_color', '_selected_fill_color', '_current_fill_color',
+        '_outline_width', '_outline_color', '_active_outline_width', '_active_outline_color',
+        '_highlighted', '_highlight_group',
+        '_show_selection', '_show_highlight', '_draggable', '_clickable', '_highlightable', '_raisable',
+        '_always_on_top', '_connectable_initiator', '_connectable_terminator', '_layer',
+    )
+
     def __init__(self, gcanvas, initial_x, initial_y, name_tag=None):
 
         # Remember where I'm drawn on the canvas
@@ -17,13 +50,36 @@ class GItem:
         self._tag = name_tag
 
         # I should keep track of my owning GObject in case I want to refer back to its properties
-        # but it'd need to pass that info in when I create the GItem (this is not used yet)
+        # It's looked up from the GCanvas (by name tag) when I'm added
         self._owner = None
 
         # my canvas item - this will get set to something in the sub-class that inherits from me
         # Each GItem manages a SINGLE canvas item, but a GObject can own multiple GItems
         self._canvas_item = None
 
+        # My geometry in model coordinates (see GCanvas.model_to_canvas()), set by each sub-class from the
+        # coordinates I'm constructed with.  The coordinates are kept in my slot of the GCanvas coordinate store
+        # (see GCoordStore), which is the authority on where I am:  everything that moves my canvas item moves
+        # my coordinates in the store too.  See model_coords
+        self._slot = gcanvas.coord_store.allocate(self)
+
+        # Every option and tag I've given my canvas item, so that the item can be deleted when it scrolls out of
+        # view (see GCanvas virtualized mode) and re-created later exactly as it was
+        self._options = {}
+        self._tags = [name_tag]
+
+        # Inside a batch() (mine, or my GObject's), property changes are only recorded, and are sent to the canvas
+        # in one go when the batch ends:  creating my canvas item is put off until then (so it's created with all of
+        # its options and tags at once), or if it already exists, the changed options and tags are sent in a single
+        # itemconfigure().  See flush()
+        self._batch = 0
+        self._create_pending = False
+        self._pending_options = {}
+        self._pending_tags = False
+
+        # If my canvas item is waiting to be created by a bulk build.  See GCanvas.create_many()
+        self._bulk_pending = False
+
         # if I'm hidden or not
         self._hidden = True               # controlled by self.hidden property
         self._item_state = 'hidden'       # defaults to 'hidden', but will change according to self.hidden property
@@ -38,7 +94,8 @@ class GItem:
         # will reflect either fill_color or selected_fill_color depending on selection status
         self._current_fill_color = 'red'
 
-        # current line width and active line width (changes when zooming in/out to maintain proper ratio)
+        # current line width and active line width, in model units (the canvas item's width is scaled by the
+        # GCanvas zoom level to maintain the proper ratio)
         self._outline_width = 2
         self._outline_color = 'blue'
         self._active_outline_width = 5
@@ -59,13 +116,116 @@ class GItem:
         self._connectable_initiator = False   # if the GItem can be the initiator of a connector
         self._connectable_terminator = False  # if the GItem can be the termination point of a connector
 
+        # the GCanvas layer my canvas item is stacked in (see GCanvas.layers)
+        self._layer = None
+        self.layer = 'background' if name_tag == 'BACKGROUND' else self.default_layer
+
     def add(self):
-        """ overridden by each individual GItem """
-        pass
+        """ create my canvas item, unless my GObject is culled from the viewport (GCanvas virtualized mode) """
+        self._owner = self._gcanvas.gobjects.get(self._tag)
+        if self._owner is None or self._owner.materialized:
+            self.materialize()
+
+    @contextmanager
+    def batch(self):
+        """ record property changes, and send them to the canvas in one go at the end """
+        self._batch += 1
+        try:
+            yield self
+        finally:
+            self._batch -= 1
+            if not self.batching:
+                self.flush()
+
+    @property
+    def batching(self):
+        return self._batch > 0 or (self._owner is not None and self._owner._batch > 0)
+
+    def flush(self):
+        """ create my canvas item if that was put off, or send it the options and tags changed during a batch """
+        if self._create_pending:
+            self._create_pending = False
+            self.materialize()
+        elif self._canvas_item is not None and (self._pending_options or self._pending_tags):
+            options = self._zoomed(self._pending_options)
+            if self._pending_tags:
+                options['tags'] = tuple(self._tags)
+            self._gcanvas.canvas.itemconfigure(self._canvas_item, **options)
+        self._pending_options = {}
+        self._pending_tags = False
+
+    def materialize(self):
+        """ (re)create my canvas item from my model coords, options and tags """
+        if self._canvas_item is None:
+            if self.batching:
+                self._create_pending = True
+                return
+            if self._gcanvas.bulk_items is not None:
+                # GCanvas.create_many() will create all of the canvas items in one go
+                if not self._bulk_pending:
+                    self._bulk_pending = True
+                    self._gcanvas.bulk_items.append(self)
+                return
+            create = getattr(self._gcanvas.canvas, 'create_' + self.item_type)
+            (coords, tags, options) = self.create_args()
+            self.created(create(coords, tags=tags, **options))
+
+    def create_args(self):
+        """ the coords, tags and options to create my canvas item with """
+        return self._gcanvas.model_to_canvas(self.model_coords), tuple(self._tags), self._zoomed(self._options)
+
+    def created(self, canvas_item):
+        """ my canvas item has been created """
+        self._bulk_pending = False
+        self._canvas_item = canvas_item
+        self._gcanvas.item_index[canvas_item] = (self._owner, self)
+        self._gcanvas.schedule_restack()
+
+    def dematerialize(self):
+        """ delete my canvas item -- my model coords remember where it was, so materialize() can bring it back """
+        if self._canvas_item is not None:
+            self._gcanvas.canvas.delete(self._canvas_item)
+            self._gcanvas.item_index.pop(self._canvas_item, None)
+            self._canvas_item = None
+
+    @property
+    def materialized(self):
+        return self._canvas_item is not None
+
+    @property
+    def slot(self):
+        """ where my coordinates are kept in the GCanvas coordinate store """
+        return self._slot
+
+    @property
+    def model_coords(self):
+        return self._gcanvas.coord_store.get(self._slot)
+
+    @model_coords.setter
+    def model_coords(self, coords):
+        self._gcanvas.coord_store.set(self._slot, coords)
+
+    @property
+    def coords(self):
+        """ my model coords as points [(x0, y0), (x1, y1), ...] """
+        c = self.model_coords
+        return list(zip(c[0::2], c[1::2]))
+
+    @coords.setter
+    def coords(self, points):
+        self.model_coords = flatten(points)
+
+    @property
+    def bounds(self):
+        """ my bounding box (x0, y0, x1, y1) in model coordinates """
+        return self._gcanvas.coord_store.bounds((self._slot,))
 
     def delete(self):
-        """ delete the canvas item from existence """
-        self._gcanvas.canvas.delete(self._canvas_item)
+        """ delete the canvas item from existence, and give back my slot in the coordinate store """
+        self.dematerialize()
+        if self._slot is not None:
+            self._gcanvas.coord_store.free(self._slot)
+            self._slot = None
 
     def hide(self):
         # Setting my own property
@@ -79,10 +239,88 @@ class GItem:
         pass
 
     def raise_up(self):
-        self._gcanvas.canvas.tag_raise(self._canvas_item)
+        """ bring my canvas item to the front of its layer """
+        if self._canvas_item is not None:
+            self._gcanvas.canvas.tag_lower(self._canvas_item, self._gcanvas.layer_marker(self._layer))
+
+    def move(self, dx, dy):
+        """ move by dx, dy canvas pixels """
+        if self._canvas_item is not None:
+            self._gcanvas.canvas.move(self._canvas_item, dx, dy)
+        zl = self._gcanvas.zoom_level
+        self.translate(dx / zl, dy / zl)
+
+    def translate(self, dx, dy):
+        """ shift my model coords by dx, dy model units (after my canvas item has been moved by someone else) """
+        self._gcanvas.coord_store.translate((self._slot,), dx, dy)
+
+    def _configure(self, **options):
+        """ remember the options, and apply them to my canvas item if it exists """
+        # _options is exactly what my canvas item has been given, so only the options that change need sending
+        options = {k: v for k, v in options.items() if k not in self._options or self._options[k] != v}
+        if not options:
+            return
+        for option in ('width', 'activewidth'):
+            if option in options:
+                self._set_width_class(option, options[option])
+        self._options.update(options)
+        if self._canvas_item is not None:
+            if self.batching:
+                self._pending_options.update(options)
+            else:
+                self._gcanvas.canvas.itemconfigure(self._canvas_item, **self._zoomed(options))
+
+    def _zoomed(self, options):
+        """ options as they should be sent to the canvas:  widths are scaled from model units by the zoom level """
+        if 'width' in options or 'activewidth' in options:
+            zl = self._gcanvas.zoom_level
+            options = dict(options)
+            for option in ('width', 'activewidth'):
+                if option in options:
+                    options[option] = float(options[option]) * zl
+        return options
+
+    def _set_width_class(self, option, width):
+        """ tag my canvas item with its width class, so GCanvas.on_zoom() can re-scale it along with its class """
+        width = float(width)
+        tag = f"{option}:{width:g}"
+        if tag not in self._tags:
+            for old_tag in [t for t in self._tags if t.startswith(option + ":")]:
+                self._remove_tag(old_tag)
+            self._gcanvas.width_classes.add((option, width))
+            self._add_tag(tag)
+
+    def _add_tag(self, tag):
+        # _tags is exactly what my canvas item is tagged with, so there's nothing to do if I already have the tag
+        if tag in self._tags:
+            return
+        self._tags.append(tag)
+        if self._canvas_item is not None:
+            if self.batching:
+                self._pending_tags = True
+            else:
+                self._gcanvas.canvas.addtag_withtag(tag, self._canvas_item)
+
+    def _remove_tag(self, tag):
+        if tag not in self._tags:
+            return
+        self._tags.remove(tag)
+        if self._canvas_item is not None:
+            if self.batching:
+                self._pending_tags = True
+            else:
+                self._gcanvas.canvas.dtag(self._canvas_item, tag)
 
     def center_point(self):
         """ return center point of the GItem based on bbox """
+        if self._canvas_item is None:
+            # No canvas item to ask, so work it out from where we'd draw it
+            coords = self._gcanvas.model_to_canvas(self.model_coords)
+            x1 = min(coords[0::2])
+            y1 = min(coords[1::2])
+            x2 = max(coords[0::2])
+            y2 = max(coords[1::2])
+            return (x1 + (x2 - x1) // 2, y1 + (y2 - y1) // 2)
         bbox = self._gcanvas.canvas.bbox(self._canvas_item)
         x1 = bbox[0]
         y1 = bbox[1]
@@ -101,16 +339,38 @@ class GItem:
     @highlighted.setter
     def highlighted(self, value):
         self._highlighted = bool(value)
-        if value:
-            self._gcanvas.canvas.itemconfigure(
-                self._canvas_item,
-                outline=self.active_outline_color,
-                width=self.active_outline_width)
+        self._configure(**self.highlight_options(value))
+
+    def highlight_options(self, highlighted):
+        """ the options that show me (de)highlighted """
+        if highlighted:
+            return {self.outline_option: self.active_outline_color, 'width': self.active_outline_width}
         else:
-            self._gcanvas.canvas.itemconfigure(
-                self._canvas_item,
-                outline=self.outline_color,
-                width=self.outline_width)
+            return {self.outline_option: self.outline_color, 'width': self.outline_width}
+
+    @property
+    def outline_option(self):
+        """ the option that colours my outline (a line is all outline, so that's its fill) """
+        return 'fill' if self.item_type == 'line' else 'outline'
+
+    @property
+    def options(self):
+        return self._options
+
+    def configured(self, highlighted=None, **options):
+        """
+        Someone else has already given my canvas item these options (e.g. with one itemconfigure of a tag shared
+        by several GItems), so just remember them, along with the width class tags that go with them
+        """
+        if highlighted is not None:
+            self._highlighted = bool(highlighted)
+        for option in ('width', 'activewidth'):
+            if option in options:
+                width = float(options[option])
+                self._tags = [t for t in self._tags if not t.startswith(option + ":")]
+                self._tags.append(f"{option}:{width:g}")
+                self._gcanvas.width_classes.add((option, width))
+        self._options.update(options)
 
     @property
     def highlight_group(self):
@@ -118,10 +378,32 @@ class GItem:
 
     @highlight_group.setter
     def highlight_group(self, name):
+        # Tag the canvas item with its highlight group, and with its highlight group and outline option (the items
+        # of a group that take the same options can be (de)highlighted with one itemconfigure).  See
+        # GObject.highlight_group()
+        if self._highlight_group:
+            self._remove_tag(self._tag + ":highlight_group:" + self._highlight_group)
+            self._remove_tag(self._tag + ":highlight_group:" + self._highlight_group + ":" + self.outline_option)
         self._highlight_group = name
-        # we dont need to add the tag, as we are moving away from this rogue communication path
-        #print(f"Adding {name} tag to {self._canvas_item}")
-        #self._gcanvas.canvas.addtag_withtag("highlight_group:" + name, self._canvas_item)
+        if name:
+            #print(f"Adding {name} tag to {self._canvas_item}")
+            self._add_tag(self._tag + ":highlight_group:" + name)
+            self._add_tag(self._tag + ":highlight_group:" + name + ":" + self.outline_option)
+
+    @property
+    def layer(self):
+        return self._layer
+
+    @layer.setter
+    def layer(self, name):
+        if name == self._layer:
+            return
+        if self._layer:
+            self._remove_tag(self._gcanvas.layer_tag(self._layer))
+        self._layer = name
+        self._add_tag(self._gcanvas.layer_tag(name))
+        if self._canvas_item is not None:
+            self._gcanvas.schedule_restack()
 
     @property
     def item(self):
@@ -140,10 +422,10 @@ class GItem:
 
         if bool(value):
             print(f"DEBUG: Setting hidden = True")
-            self._gcanvas.canvas.itemconfigure(self._canvas_item, state="hidden")
+            self._configure(state="hidden")
             self._item_state = 'hidden'
         else:
-            self._gcanvas.canvas.itemconfigure(self._canvas_item, state="normal")
+            self._configure(state="normal")
             self._item_state = 'normal'
 
         # set property to new value
@@ -156,11 +438,10 @@ class GItem:
     @outline_color.setter
     def outline_color(self, value):
         self._outline_color = value
-        if self._canvas_item:
-            if self._gcanvas.canvas.type(self._canvas_item) == 'line':
-                self._gcanvas.canvas.itemconfigure(self._canvas_item, fill=value)
-            else:
-                self._gcanvas.canvas.itemconfigure(self._canvas_item, outline=value)
+        if self.item_type == 'line':
+            self._configure(fill=value)
+        else:
+            self._configure(outline=value)
 
     @property
     def active_outline_color(self):
@@ -169,11 +450,10 @@ class GItem:
     @active_outline_color.setter
     def active_outline_color(self, value):
         self._active_outline_color = value
-        if self._canvas_item:
-            if self._gcanvas.canvas.type(self._canvas_item) == 'line':
-                self._gcanvas.canvas.itemconfigure(self._canvas_item, fill=value)
-            else:
-                self._gcanvas.canvas.itemconfigure(self._canvas_item, activeoutline=value)
+        if self.item_type == 'line':
+            self._configure(fill=value)
+        else:
+            self._configure(activeoutline=value)
 
     @property
     def selected(self):
@@ -184,9 +464,9 @@ class GItem:
         self._selected = bool(value)
 
         if value:
-            self._gcanvas.canvas.addtag_withtag("selected", self._canvas_item)
+            self._add_tag("selected")
         else:
-            self._gcanvas.canvas.dtag(self._canvas_item, "selected")
+            self._remove_tag("selected")
 
         if self.show_selection:
             if value:
@@ -201,8 +481,7 @@ class GItem:
     @current_fill_color.setter
     def current_fill_color(self, value):
         self._current_fill_color = value
-        if self._canvas_item:
-            self._gcanvas.canvas.itemconfigure(self._canvas_item, fill=value)
+        self._configure(fill=value)
 
     @property
     def fill_color(self):
@@ -228,8 +507,7 @@ class GItem:
     @outline_width.setter
     def outline_width(self, value):
         self._outline_width = value
-        if self._canvas_item:
-            self._gcanvas.canvas.itemconfigure(self._canvas_item, width=value)
+        self._configure(width=value)
 
     @property
     def active_outline_width(self):
@@ -238,8 +516,7 @@ class GItem:
     @active_outline_width.setter
     def active_outline_width(self, value):
         self._active_outline_width = value
-        if self._canvas_item:
-            self._gcanvas.canvas.itemconfigure(self._canvas_item, activewidth=value)
+        self._configure(activewidth=value)
 
     @property
     def show_selection(self):
@@ -269,9 +546,9 @@ class GItem:
         """ Tag the canvas item as "draggable" so that we can initiate a click-drag from it """
         self._draggable = bool(value)
         if value:
-            self._gcanvas.canvas.addtag_withtag(self._tag + ":draggable", self._canvas_item)
+            self._add_tag(self._tag + ":draggable")
         else:
-            self._gcanvas.canvas.dtag(self._canvas_item, self._tag + ":draggable")
+            self._remove_tag(self._tag + ":draggable")
 
     @property
     def clickable(self):
@@ -281,9 +558,9 @@ class GItem:
     def clickable(self, value):
         self._clickable = bool(value)
         if value:
-            self._gcanvas.canvas.addtag_withtag(self._tag + ":clickable", self._canvas_item)
+            self._add_tag(self._tag + ":clickable")
         else:
-            self._gcanvas.canvas.dtag(self._canvas_item, self._tag + ":clickable")
+            self._remove_tag(self._tag + ":clickable")
 
     @property
     def connectable_initiator(self):
@@ -293,9 +570,11 @@ class GItem:
     def connectable_initiator(self, value):
         self._connectable_initiator = bool(value)
         if value:
-            self._gcanvas.canvas.addtag_withtag(self._tag + ":connectable_initiator", self._canvas_item)
+            self._add_tag(self._tag + ":connectable_initiator")
+            # connection points are drawn above the wires connected to them
+            self.layer = 'nodes'
         else:
-            self._gcanvas.canvas.dtag(self._canvas_item, self._tag + ":connectable_initiator")
+            self._remove_tag(self._tag + ":connectable_initiator")
 
     @property
     def connectable_terminator(self):
@@ -305,9 +584,11 @@ class GItem:
     def connectable_terminator(self, value):
         self._connectable_terminator = bool(value)
         if value:
-            self._gcanvas.canvas.addtag_withtag(self._tag + ":connectable_terminator", self._canvas_item)
+            self._add_tag(self._tag + ":connectable_terminator")
+            # connection points are drawn above the wires connected to them
+            self.layer = 'nodes'
         else:
-            self._gcanvas.canvas.dtag(self._canvas_item, self._tag + ":connectable_terminator")
+            self._remove_tag(self._tag + ":connectable_terminator")
 
     @property
     def raisable(self):
@@ -319,10 +600,10 @@ class GItem:
         self._raisable = bool(value)
         if value:
             #print(f"Setting 'raisable' on canvas item {self._canvas_item}")
-            self._gcanvas.canvas.addtag_withtag("raisable", self._canvas_item)
+            self._add_tag("raisable")
         else:
             #print(f"Deleting 'raisable' on canvas item {self._canvas_item}")
-            self._gcanvas.canvas.dtag(self._canvas_item, "raisable")
+            self._remove_tag("raisable")
 
     @property
     def always_on_top(self):
@@ -334,10 +615,10 @@ class GItem:
         self._always_on_top = bool(value)
         if value:
             #print(f"Setting 'always_on_top' on canvas item {self._canvas_item}")
-            self._gcanvas.canvas.addtag_withtag("always_on_top", self._canvas_item)
+            self._add_tag("always_on_top")
         else:
             #print(f"Deleting 'always_on_top' on canvas item {self._canvas_item}")
-            self._gcanvas.canvas.dtag(self._canvas_item, "always_on_top")
+            self._remove_tag("always_on_top")
 
     @property
     def highlightable(self):
@@ -347,14 +628,17 @@ class GItem:
     def highlightable(self, value):
         self._highlightable = bool(value)
         if value:
-            self._gcanvas.canvas.addtag_withtag("highlightable", self._canvas_item)
+            self._add_tag("highlightable")
         else:
-            self._gcanvas.canvas.dtag(self._canvas_item, "highlightable")
+            self._remove_tag("highlightable")
 
 
 class GHorzLineItem(GItem):
     """ Single-segment Horizontal line draws itself on a GCanvas """
 
+    item_type = 'line'
+    __slots__ = ('length',)
+
     def __init__(self, gcanvas, initial_x, initial_y, length, name_tag=None):
         super().__init__(gcanvas, initial_x, initial_y, name_tag)
 
@@ -368,22 +652,25 @@ class GHorzLineItem(GItem):
         self.coords = [(self._x, self._y), (self._x + self.length, self._y)]
 
     def add(self):
-        self._canvas_item = self._gcanvas.canvas.create_line(
-            self.coords,
+        self._configure(
             fill=self._outline_color,
             width=self.outline_width,
-            activewidth=self.outline_width,
-            state=self._item_state,
-            tags=self._tag)
+            activewidth=self.active_outline_width,
+            state=self._item_state)
 
         # the item should NOT be raisable by default unless overridden in the GObject
         self.raisable = False
         self.highlightable = False
 
+        super().add()
+
 
 class GVertLineItem(GItem):
     """ Single-segment Vertical line draws itself on a GCanvas """
 
+    item_type = 'line'
+    __slots__ = ('length',)
+
     def __init__(self, gcanvas, initial_x, initial_y, length, name_tag=None):
         super().__init__(gcanvas, initial_x, initial_y, name_tag)
 
@@ -397,21 +684,24 @@ class GVertLineItem(GItem):
         self.coords = [(self._x, self._y), (self._x, self._y + self.length)]
 
     def add(self):
-        self._canvas_item = self._gcanvas.canvas.create_line(
-            self.coords,
+        self._configure(
             fill=self._outline_color,
             width=self.outline_width,
-            activewidth=self.outline_width,
-            state=self._item_state,
-            tags=self._tag)
+            activewidth=self.active_outline_width,
+            state=self._item_state)
 
         # the item should NOT be raisable by default unless overridden in the GObject
         self.raisable = False
         self.highlightable = False
 
+        super().add()
+
 class GLineItem(GItem):
     """ Multi-segment line defined by list of points draws itself on a GCanvas """
 
+    item_type = 'line'
+    __slots__ = ()
+
     def __init__(self, gcanvas, points, name_tag=None):
         initial_x, initial_y = points[0]
         super().__init__(gcanvas, initial_x, initial_y, name_tag)
@@ -424,21 +714,25 @@ class GLineItem(GItem):
         self.show_highlight = False
 
     def add(self):
-        self._canvas_item = self._gcanvas.canvas.create_line(
-            self.coords,
+        self._configure(
             fill=self._outline_color,
             width=self.outline_width,
-            activewidth=self.outline_width,
-            state=self._item_state,
-            tags=self._tag)
+            activewidth=self.active_outline_width,
+            state=self._item_state)
 
         # the item should NOT be raisable by default unless overridden in the GObject
         self.raisable = False
         self.highlightable = False
 
+        super().add()
+
 class GWireItem(GItem):
     """ Multi-segment Wire defined by list of points draws itself on a GCanvas """
 
+    item_type = 'line'
+    default_layer = 'wires'
+    __slots__ = ()
+
     def __init__(self, gcanvas, points, name_tag=None):
         #initial_x, initial_y = points[0]
         super().__init__(gcanvas, 0, 0, name_tag)
@@ -451,43 +745,45 @@ class GWireItem(GItem):
         self.show_highlight = False
 
     def add(self):
-        self._canvas_item = self._gcanvas.canvas.create_line(
-            self.coords,
+        self._configure(
             fill=self._outline_color,
             width=self.outline_width,
-            activewidth=self.outline_width,
+            activewidth=self.active_outline_width,
             state=self._item_state,
-            capstyle="round", smooth=True, splinesteps=20,
-            tags=self._tag)
+            capstyle="round", smooth=True, splinesteps=20)
 
         # the item should NOT be raisable by default unless overridden in the GObject
         self.raisable = False
         self.highlightable = False
 
+        super().add()
+
     def redraw(self):
-        self._gcanvas.canvas.coords(self._canvas_item, self.coords)
+        if self._canvas_item is not None:
+            self._gcanvas.canvas.coords(self._canvas_item, self._gcanvas.model_to_canvas(self.model_coords))
 
 
 class GRectItem(GItem):
     """ Draw Square or Rectangle on a GCanvas """
 
+    item_type = 'rectangle'
+    __slots__ = ('width', 'height')
+
     def __init__(self, gcanvas, initial_x, initial_y, width, height, name_tag=None):
         super().__init__(gcanvas, initial_x, initial_y, name_tag)
 
         self.width = width
         self.height = height
+        self.model_coords = [self._x, self._y, self._x + self.width, self._y + self.height]
 
     def add(self):
-        self._canvas_item = self._gcanvas.canvas.create_rectangle(
-            self._x, self._y,
-            self._x + self.width, self._y + self.height,
+        self._configure(
             outline=self._outline_color,
-            activeoutline=self._outline_color,
+            activeoutline=self._active_outline_color,
             fill=self.fill_color,            # property
             width=self.outline_width,        # property
-            activewidth=self.outline_width,  # property
-            state=self._item_state,
-            tags=self._tag)
+            activewidth=self.active_outline_width,  # property
+            state=self._item_state)
 
         # the item should be raisable by default unless overridden in the GObject
         self.raisable = True
@@ -496,27 +792,30 @@ class GRectItem(GItem):
         #self._gcanvas.canvas.addtag_withtag(self._tag + "activate_together", self._canvas_item)
         self.highlightable = True
 
+        super().add()
+
 
 class GOvalItem(GItem):
     """ Draw Oval or Circle on a GCanvas """
 
+    item_type = 'oval'
+    __slots__ = ('width', 'height')
+
     def __init__(self, gcanvas, initial_x, initial_y, width, height, name_tag=None):
         super().__init__(gcanvas, initial_x, initial_y, name_tag)
 
         self.width = width
         self.height = height
+        self.model_coords = [self._x, self._y, self._x + self.width, self._y + self.height]
 
     def add(self):
-        self._canvas_item = self._gcanvas.canvas.create_oval(
-            self._x, self._y,
-            self._x + self.width, self._y + self.height,
+        self._configure(
             outline=self._outline_color,
-            activeoutline=self._outline_color,
+            activeoutline=self._active_outline_color,
             fill=self.fill_color,            # property
             width=self.outline_width,        # property
-            activewidth=self.outline_width,  # property
-            state=self._item_state,
-            tags=self._tag)
+            activewidth=self.active_outline_width,  # property
+            state=self._item_state)
 
         # the item should be raisable by default unless overridden in the GObject
         self.raisable = True
@@ -525,10 +824,15 @@ class GOvalItem(GItem):
         #self._gcanvas.canvas.addtag_withtag(self._tag + "activate_together", self._canvas_item)
         self.highlightable = True
 
+        super().add()
+
 
 class GPolygonItem(GItem):
     """ Draw Polygon on a GCanvas """
 
+    item_type = 'polygon'
+    __slots__ = ('_extra_kwargs',)
+
     def __init__(self, gcanvas, coords, name_tag=None, **kwargs):
 
         initial_x = coords[0]
@@ -537,18 +841,16 @@ class GPolygonItem(GItem):
 
         super().__init__(gcanvas, initial_x, initial_y, name_tag)
 
-        self._coords = coords
+        self.model_coords = flatten(coords)
 
     def add(self):
-        self._canvas_item = self._gcanvas.canvas.create_polygon(
-            self._coords,
+        self._configure(
             outline=self._outline_color,
-            activeoutline=self._outline_color,
+            activeoutline=self._active_outline_color,
             fill=self.fill_color,            # property
             width=self.outline_width,        # property
-            activewidth=self.outline_width,  # property
+            activewidth=self.active_outline_width,  # property
             state=self._item_state,
-            tags=self._tag,
             **self._extra_kwargs)
 
         # the item should be raisable by default unless overridden in the GObject
@@ -557,3 +859,4 @@ class GPolygonItem(GItem):
         # Tag the specific canvas items we want to activate (highlight) together
         self.highlightable = True
 
+        super().add()
@@ -3,6 +3,8 @@ class GNode:
 
     gnode_id = 1_000_000_000
 
+    __slots__ = ('id', 'name', 'g_object', 'g_item', 'connections', 'max_connections', '_anchor')
+
     def __init__(self, name, g_object, g_item):
         self.id = self.next_id()
         self.name = name
@@ -11,6 +13,21 @@ class GNode:
         self.connections = []
         self.max_connections = 1
 
+        # Where connections attach to me (the center of my GItem) in model coordinates.  This is kept up to date
+        # by my GObject as it moves (see GObject.update_bounds()), so drawing a GWire never has to ask the canvas.
+        self._anchor = None
+
+    @property
+    def anchor(self):
+        if self._anchor is None:
+            self.update_anchor()
+        return self._anchor
+
+    def update_anchor(self):
+        """ re-compute my anchor from my GItem's model coordinates """
+        (x0, y0, x1, y1) = self.g_item.bounds
+        self._anchor = ((x0 + x1) / 2, (y0 + y1) / 2)
+
     def next_id(self):
         GNode.gnode_id += 1
         return GNode.gnode_id
@@ -1,4 +1,6 @@
-from .gevent import GEvent
+from contextlib import contextmanager
+
+from .gevent import GEvent, GEventType, ClickableClickedData, AddConnectionData
 
 class GObject:
     """
@@ -7,6 +9,55 @@ class GObject:
 
     gobject_id = 1_000_000_000
 
+    # The mouse bindings every GObject gets:  (tag suffix, event sequence, handler method name).  Each binding is
+    # made on my name tag plus the suffix, e.g. "GObject:1000000001:draggable", which my GItems are tagged with
+    # when the GItem property of the same name (draggable, clickable, ...) is True.
+    # See add_mouse_bindings(), and GCanvas dispatch mode which routes these events without per-GObject bindings
+    mouse_binding_table = [
+        # add bindings for selection toggle on/off using Command-Click
+        (":draggable", "<Command-ButtonPress-1>", 'on_command_button_press'),
+
+        # add bindings for clickable GItems (those we can click but not drag)
+        (":clickable", "<ButtonPress-1>", 'on_button_click'),
+
+        # add bindings for click and hold to drag an object
+        (":draggable", "<ButtonPress-1>", 'on_button_press'),
+        (":draggable", "<ButtonRelease-1>", 'on_button_release'),
+        (":draggable", "<B1-Motion>", 'on_button_motion'),
+
+        # add bindings for making connections
+        (":connectable_initiator", "<ButtonPress-1>", 'on_start_connection'),
+        (":connectable_initiator", "<ButtonRelease-1>", 'on_end_connection'),
+        (":connectable_initiator", "<B1-Motion>", 'on_making_connection'),
+
+        # add bindings for right-click (could eventually be used for context-sensitive menus)
+        # TODO: not used yet, but we may want to use different callbacks to keep the code separate from
+        # TODO: the click-drag-release code.  Otherwise use event.num to detect what button is being pressed.
+        (":draggable", "<ButtonPress-2>", 'on_button_press'),
+        (":draggable", "<ButtonRelease-2>", 'on_button_release'),
+
+        # add bindings for <Enter> and <Leave> events
+        ("", "<Enter>", 'on_enter'),
+        ("", "<Leave>", 'on_leave'),
+    ]
+
+    # The GTemplate my GItems and GNodes are stamped out from, for shapes that are always drawn the same way
+    # (see gtemplate.py).  Shapes that work out their own GItems override add() instead.
+    template = None
+
+    # What I am to the logic simulator (see gsim.py):  the function my 'output' GNode computes from my other GNodes
+    # (e.g. 'and'), 'switch' for an input to the circuit, 'bulb' for an output of it, or None to be left out
+    logic = None
+
+    # GObjects don't each get a __dict__ (see GItem.__slots__).  The built-in GObjects list their own attributes in
+    # __slots__ too, while a user's sub-class without __slots__ simply gets a __dict__ as usual
+    __slots__ = (
+        'id', 'label', '_x', '_y', 'gcanvas', 'materialized', '_bounds', '_tag', '_items', '_nodes', 'connection',
+        '_selected', 'outline_width', 'outline_color', 'active_outline_width', 'active_outline_color',
+        '_selectable', '_highlightable', '_draggable', '_clickable', '_connectable', '_connector',
+        'mouse_enabled', '_batch', '_state', 'callbacks',
+    )
+
     # TODO: re-do how args are passed in.  Instead of using positional args for initial_x/y
     # TODO: lets use kwargs, and support the ability to pass in different key words for different
     # TODO: GObject types.  Some take coords (4-tuple of a pair of coordinates), while others
@@ -26,6 +77,13 @@ class GObject:
         # Remember my GCanvas
         self.gcanvas = None
 
+        # If my GItems currently have canvas items.  In GCanvas virtualized mode, GObjects far from the
+        # viewport are dematerialized:  their GItems remember everything, but their canvas items are deleted.
+        self.materialized = True
+
+        # My bounding box (x0, y0, x1, y1) in model coordinates.  Used to decide if I'm in view.
+        self._bounds = None
+
         # TODO:  self._tag should not be private, and I also want to rename it to be self.name
         # my primary name tag
         if name == 'BACKGROUND':
@@ -46,21 +104,6 @@ class GObject:
         # For "Connector" types, we can have a GConnection object
         self.connection = None
 
-        # Keep track of a canvas object being dragged
-        self._drag_data = {
-            "x": 0,
-            "y": 0,
-            "item": None
-        }
-
-        # Keep track of a connection as we are selecting the starting and ending points
-        self._connection_data = {
-            "start_x": 0,
-            "start_y": 0,
-            "line1": None,
-            "line2": None,
-        }
-
         # NOTE: selection is done at the GObject level, but we also keep track of each GItem's
         # NOTE: selection status.
         #
@@ -90,11 +133,17 @@ class GObject:
         self._connectable = False     # if the GObject can be connected to another connectable GObject
         self._connector = False       # if the GObject is a connector, such as a GWire
 
+        # If add_mouse_bindings() has been done (so that I respond to the mouse)
+        self.mouse_enabled = False
+
+        # While > 0, changes to my GItems are collected and sent to the canvas when the batch ends.  See batch()
+        self._batch = 0
+
         # Some GObjects can have a True/False state
         self._state = None
 
-        # Callbacks to user code
-        self.callbacks = []
+        # Callbacks to user code -- most GObjects never have any, so the list is only made by register_callback()
+        self.callbacks = ()
 
     @staticmethod
     def factory(a_class, *args, **kwargs):
@@ -107,43 +156,108 @@ class GObject:
 
     def register_callback(self, f):
         print(f"DEBUG: Adding function {f} to callbacks for {self}")
-        self.callbacks.append(f)
+        self.callbacks = list(self.callbacks) + [f]
+
+    @property
+    def _drag_data(self):
+        """ the drag in progress -- kept by my GCanvas, as only one thing is dragged at a time (see GInteraction) """
+        return self.gcanvas.interaction.drag
+
+    @property
+    def _connection_data(self):
+        """ the connection being made -- kept by my GCanvas (see GInteraction) """
+        return self.gcanvas.interaction.connection
 
     def screen_to_canvas_coords(self, screen_x, screen_y):
         canvas_x = self.gcanvas.canvas.canvasx(screen_x)
         canvas_y = self.gcanvas.canvas.canvasy(screen_y)
         return canvas_x, canvas_y
 
-    # as GItems will be tagged with the parent name tag, we can continue to scale in the same way (i think)
-    def scale(self, x_offset, y_offset, x_scale, y_scale):
-        """ scale by scale factor x_scale and y_scale relative to point (x_offset, y_offset) """
-
-        # scale the canvas items associated with self._tag
-        self.gcanvas.canvas.scale(self._tag, x_offset, y_offset, x_scale, y_scale)
-
-        # in theory, we could scale at different rates horizontally vs vertically, but
-        # line widths are constant across the whole item, so we just pick the x_scale
-        sf = x_scale
-
-        # TODO: Figure out a way to speed this up.  As we get lots of GItems, zooming
-        # TODO: slows down, and is choppy because of this for loop.  The background
-        # TODO: GraphPaper adds a ton of GItems, so consider how we might get around
-        # TODO: that.  Maybe we should write a special GCanvasBackground object, and
-        # TODO: then we could optimize zooming by keeping all of those GItems out of
-        # TODO: the dictionary of GItems. For now, let's skip scaling the BACKGROUND
-        # TODO: items.
-
-        if self._tag != "BACKGROUND":  #  <-- Temp hack to speed up zooming
-            # scale my outline and active_outline widths
-            for gitem_name in self._items:
-                gitem = self._items[gitem_name]
-                current_width = gitem.outline_width
-                current_activewidth = gitem.active_outline_width
-                new_width = float(current_width) * sf
-                new_activewidth = float(current_activewidth) * sf
-                gitem.outline_width = new_width
-                gitem.active_outline_width = new_activewidth
-                #print(f"{sf} {gitem_name}({gitem.item}) new width {new_width} new active width {new_activewidth}")
+    def add(self):
+        """ create my GItems (and GNodes) """
+        if self.template is not None:
+            self.template.stamp(self)
+
+    @contextmanager
+    def batch(self):
+        """
+        Collect the property changes made to my GItems (including ones created inside the batch), and send them
+        to the canvas when the batch ends:  one create, or one itemconfigure, per canvas item
+        """
+        self._batch += 1
+        try:
+            yield self
+        finally:
+            self._batch -= 1
+            if self._batch == 0:
+                for g_item in self._items.values():
+                    if not g_item.batching:
+                        g_item.flush()
+
+    def materialize(self):
+        """ create canvas items for all of my GItems """
+        for g_item in self._items.values():
+            g_item.materialize()
+        self.materialized = True
+        self.gcanvas.materialized_gobjects.add(self)
+
+    def dematerialize(self):
+        """ delete the canvas items for all of my GItems, but keep the GItems so we can materialize() again """
+        for g_item in self._items.values():
+            g_item.dematerialize()
+        self.materialized = False
+        self.gcanvas.materialized_gobjects.discard(self)
+        # my bounds stay as they are, as they come from my GItems' model coords, which outlive the canvas items
+
+    @property
+    def slots(self):
+        """ my GItems' slots in the GCanvas coordinate store (deleted GItems don't have one) """
+        return [g_item.slot for g_item in self._items.values() if g_item.slot is not None]
+
+    def update_bounds(self):
+        """ re-compute my bounding box from my GItems' model coordinates, and update the GCanvas spatial indexes """
+        if self.gcanvas is None:
+            return
+        self._bounds = self.gcanvas.coord_store.bounds(self.slots)
+
+        # The background is never hit-tested or selected, so we leave it out of the index
+        if self._tag == 'BACKGROUND':
+            return
+        if self._bounds is None:
+            self.gcanvas.spatial_index.remove(self)
+        else:
+            self.gcanvas.spatial_index.update(self, self._bounds)
+        for g_node in self._nodes.values():
+            g_node.update_anchor()
+            self.gcanvas.node_index.update(g_node, g_node.g_item.bounds)
+
+    @property
+    def bounds(self):
+        return self._bounds
+
+    def intersects(self, area):
+        """ True if my bounding box overlaps area (x0, y0, x1, y1), both in model coordinates """
+        if self._bounds is None:
+            return False
+        (x0, y0, x1, y1) = self._bounds
+        return x0 <= area[2] and x1 >= area[0] and y0 <= area[3] and y1 >= area[1]
+
+    def move(self, dx, dy):
+        """ move me by dx, dy canvas pixels """
+        self.gcanvas.canvas.move(self._tag, dx, dy)
+        self.translate_bounds(dx, dy)
+
+    def translate_bounds(self, dx, dy):
+        """ my canvas items have been dragged by dx, dy canvas pixels, so keep my model coords and bounds in step """
+        zl = self.gcanvas.zoom_level
+        self.gcanvas.coord_store.translate(self.slots, dx / zl, dy / zl)
+        self.translated(dx / zl, dy / zl)
+
+    def translated(self, dx, dy):
+        """ my GItems' model coords have been moved by dx, dy model units, so catch up with them """
+        self._x += dx
+        self._y += dy
+        self.update_bounds()
 
     def add_mouse_bindings(self):
         # TODO: Currently, it is assumed that if something is draggable, it is also selectable.  Not sure we want this.
@@ -154,34 +268,22 @@ class GObject:
         # TODO: the input and output components would not be draggable.  Same goes for "selectable", so the current
         # TODO: assumption works for now, so I'll leave it until a case comes up where this doesn't work.
 
-        # add bindings for selection toggle on/off using Command-Click
-        self.gcanvas.canvas.tag_bind(self._tag + ":draggable", "<Command-ButtonPress-1>", self.on_command_button_press)
-
-        # add bindings for clickable GItems (those we can click but not drag)
-        self.gcanvas.canvas.tag_bind(self._tag + ":clickable", "<ButtonPress-1>", self.on_button_click)
-
-        # add bindings for click and hold to drag an object
-        self.gcanvas.canvas.tag_bind(self._tag + ":draggable", "<ButtonPress-1>", self.on_button_press)
-        self.gcanvas.canvas.tag_bind(self._tag + ":draggable", "<ButtonRelease-1>", self.on_button_release)
-        self.gcanvas.canvas.tag_bind(self._tag + ":draggable", "<B1-Motion>", self.on_button_motion)
+        self.mouse_enabled = True
 
-        # add bindings for making connections
-        self.gcanvas.canvas.tag_bind(self._tag + ":connectable_initiator", "<ButtonPress-1>", self.on_start_connection)
-        self.gcanvas.canvas.tag_bind(self._tag + ":connectable_initiator", "<ButtonRelease-1>", self.on_end_connection)
-        self.gcanvas.canvas.tag_bind(self._tag + ":connectable_initiator", "<B1-Motion>", self.on_making_connection)
+        # In dispatch mode, the GCanvas has a fixed set of bindings that route events to us, so we don't bind anything
+        if self.gcanvas.dispatch:
+            return
 
-        # add bindings for right-click (could eventually be used for context-sensitive menus)
-        # TODO: not used yet, but we may want to use different callbacks to keep the code separate from
-        # TODO: the click-drag-release code.  Otherwise use event.num to detect what button is being pressed.
-        self.gcanvas.canvas.tag_bind(self._tag + ":draggable", "<ButtonPress-2>", self.on_button_press)
-        self.gcanvas.canvas.tag_bind(self._tag + ":draggable", "<ButtonRelease-2>", self.on_button_release)
+        for (tag, sequence, func) in self.mouse_bindings():
+            self.gcanvas.canvas.tag_bind(tag, sequence, func)
 
-        # add bindings for <Enter> and <Leave> events
-        self.gcanvas.canvas.tag_bind(self._tag, "<Enter>", self.on_enter)
-        self.gcanvas.canvas.tag_bind(self._tag, "<Leave>", self.on_leave)
+        # NOTE: Selection with a selection box is handled by the GCanvas, which calls set_selected()/clear_selected()
+        # NOTE: on just the GObjects whose selection changed.  See GCanvas.update_selection()
 
-        # add binding to handle Selection virtual events from a selection box
-        self.gcanvas.canvas.bind("<<Selection>>", self.on_selection_event, "+")
+    def mouse_bindings(self):
+        """ the (tag, sequence, function) canvas tag bindings that add_mouse_bindings() makes """
+        return [(self._tag + suffix, sequence, getattr(self, method))
+                for (suffix, sequence, method) in self.mouse_binding_table]
 
     def on_button_click(self, event):
         #print(f"DEBUG: CLICKABLE ITEM -- CLICK   Button-{event.num} Item: {event.widget.find_withtag('current')}")
@@ -196,20 +298,17 @@ class GObject:
                 f(g_object)
 
             # construct event payload
-            event_data = {
-                'canvas_item': canvas_item,
-                'g_item': g_item,
-                'g_object': g_object,
-            }
+            event_data = ClickableClickedData(
+                canvas_item=canvas_item,
+                g_item=g_item,
+                g_object=g_object,
+            )
 
             # create a GEvent and populate event_data
-            g_event = GEvent('ClickableClicked', event_data)
-
-            # put GEvent on GEventQueue
-            self.gcanvas.event_queue.put_event(g_event)
+            g_event = GEvent(GEventType.CLICKABLE_CLICKED, event_data)
 
-            # generate virtual event which can be handled in user code
-            self.gcanvas.canvas.event_generate("<<ClickableClicked>>")
+            # send the GEvent to its subscribers, and to user code via the GEventQueue and virtual event
+            self.gcanvas.post_event(g_event)
 
     def on_start_connection(self, event):
         """ Initiate connection """
@@ -230,10 +329,12 @@ class GObject:
         """ Terminate connection """
 
         if self._connection_data["line1"] is not None:
-            self.gcanvas.canvas.delete(self._connection_data["line1"])
+            self.gcanvas.delete_overlay(self._connection_data["line1"])
+            self._connection_data["line1"] = None
 
         if self._connection_data["line2"] is not None:
-            self.gcanvas.canvas.delete(self._connection_data["line2"])
+            self.gcanvas.delete_overlay(self._connection_data["line2"])
+            self._connection_data["line2"] = None
 
         # Get start data
         connect_from_item = self._drag_data["item"]
@@ -248,27 +349,21 @@ class GObject:
 
         x, y = self.screen_to_canvas_coords(event.x, event.y)
 
-        # TODO: we need to check for the closest, but also check for closest that is a GNode, otherwise if there is
-        # TODO: another GWire close by, it could find that one instead.  This is less of an issue when the GNode
-        # TODO: circle is raised above the GWire, which is what we are doing, so maybe wont worry about it for now.
-        connect_to_item = self.gcanvas.canvas.find_closest(x, y)
+        # Snap to the nearest GNode that can terminate a connection, if there is one close enough to where the
+        # mouse button was released.  (Only GNodes are in the node index, so a GWire close by can't get in the way.)
+        to_g_node = self.gcanvas.find_node_near(x, y, accept=lambda g_node: g_node.g_item.connectable_terminator)
 
-        if connect_to_item:
-            to_g_object = self.gcanvas.get_gobject_by_id(connect_to_item)
+        if to_g_node:
+            to_g_object = to_g_node.g_object
+            to_g_item = to_g_node.g_item
+            to_node_name = to_g_object.get_node_name_by_g_item(to_g_item)
+            connect_to_item = (to_g_item.item,)
         else:
+            #print(f"DEBUG: No connection_terminator nearby")
             to_g_object = None
-
-        if to_g_object:
-            to_g_item = to_g_object.get_item_by_id(connect_to_item)
-        else:
             to_g_item = None
-
-        if to_g_item and to_g_item.connectable_terminator:
-            to_node_name = to_g_object.get_node_name_by_g_item(to_g_item)
-        else:
-            #print(f"DEBUG: GItem is NOT a connection_terminator")
-            # reject the GItem
             to_node_name = None
+            connect_to_item = None
 
         # TODO: We need to check and enforce max_connections for GNode objects, and
         # TODO: max_nodes for GConnection objects.
@@ -280,12 +375,12 @@ class GObject:
             #print(f"       -->   GNode: {to_node_name}")
             #print(f"       -->     End: {int(x)} x {int(y)}")
 
-            coords = (
+            coords = self.gcanvas.canvas_to_model((
                 int(self._connection_data['start_x']),
                 int(self._connection_data['start_y']),
                 int(x),
                 int(y),
-            )
+            ))
 
             new_wire = self.gcanvas.create('GWire', coords, name="GWire")
 
@@ -300,25 +395,22 @@ class GObject:
                 f(new_wire)
 
             # construct event payload
-            event_data = {
-                'from_canvas_item': connect_from_item,
-                'from_g_item': from_g_item,
-                'from_g_object': from_g_object,
-                'from_g_node': from_g_object.node(from_node_name),
-                'to_canvas_item': connect_to_item,
-                'to_g_item': to_g_item,
-                'to_g_object': to_g_object,
-                'to_g_node': to_g_object.node(to_node_name),
-            }
+            event_data = AddConnectionData(
+                from_canvas_item=connect_from_item,
+                from_g_item=from_g_item,
+                from_g_object=from_g_object,
+                from_g_node=from_g_object.node(from_node_name),
+                to_canvas_item=connect_to_item,
+                to_g_item=to_g_item,
+                to_g_object=to_g_object,
+                to_g_node=to_g_object.node(to_node_name),
+            )
 
             # create a GEvent and populate event_data
-            g_event = GEvent('AddConnection', event_data)
-
-            # put GEvent on GEventQueue
-            self.gcanvas.event_queue.put_event(g_event)
+            g_event = GEvent(GEventType.ADD_CONNECTION, event_data)
 
-            # generate virtual event which can be handled by the library's user
-            self.gcanvas.canvas.event_generate("<<AddConnection>>")
+            # send the GEvent to its subscribers, and to the library's user via the GEventQueue and virtual event
+            self.gcanvas.post_event(g_event)
         else:
             #print(f"DEBUG: END CONNECTION - Button-{event.num}")
             #print(f"       --> Where?")
@@ -360,22 +452,20 @@ class GObject:
         line_width1 = zl * 5.0
         line_width2 = zl * 2.0
 
-        if self._connection_data["line1"] is not None:
-            self.gcanvas.canvas.delete(self._connection_data["line1"])
-
-        if self._connection_data["line2"] is not None:
-            self.gcanvas.canvas.delete(self._connection_data["line2"])
-
         # These are the points we will use to draw our lines
         points = (int(self._connection_data["start_x"]), int(self._connection_data["start_y"]), int(x), int(y))
-        points = self.smooth_coords(points)
-
-        self._connection_data["line1"] = self.gcanvas.canvas.create_line(
-            points, width=line_width1, fill='blue', capstyle="round", smooth=True, splinesteps=20)
+        points = self.gcanvas.model_to_canvas(self.smooth_coords(self.gcanvas.canvas_to_model(points)))
 
-        self._connection_data["line2"] = self.gcanvas.canvas.create_line(
-            points, width=line_width2, fill='white', capstyle="round", smooth=True, splinesteps=20)
+        # The preview lines are created on the first motion event, and then just moved until the connection ends
+        if self._connection_data["line1"] is None:
+            self._connection_data["line1"] = self.gcanvas.create_overlay(
+                'line', points, width=line_width1, fill='blue', capstyle="round", smooth=True, splinesteps=20)
 
+            self._connection_data["line2"] = self.gcanvas.create_overlay(
+                'line', points, width=line_width2, fill='white', capstyle="round", smooth=True, splinesteps=20)
+        else:
+            self.gcanvas.canvas.coords(self._connection_data["line1"], points)
+            self.gcanvas.canvas.coords(self._connection_data["line2"], points)
 
     def on_button_press(self, event):
         """ Beginning drag of an object - record the item and its location """
@@ -384,13 +474,21 @@ class GObject:
         self._drag_data["item"] = event.widget.find_withtag('current')
         self._drag_data["x"] = event.x
         self._drag_data["y"] = event.y
+        self.start_drag()
 
     def on_button_release(self, event):
-        """ End drag of an object - reset the drag information """
+        """ End drag of an object - apply any outstanding movement, and reset the drag information """
         #print(f"DEBUG: RELEASE Button-{event.num} Item: {event.widget.find_withtag('current')}")
+        if self._drag_data["frame"] is not None:
+            self.gcanvas.after_cancel(self._drag_data["frame"])
+            self.apply_drag()
         self._drag_data["item"] = None
         self._drag_data["x"] = 0
         self._drag_data["y"] = 0
+        self._drag_data["moving"] = []
+        self._drag_data["slots"] = []
+        self._drag_data["wires_moving"] = []
+        self._drag_data["wires_dirty"] = []
 
     def on_button_motion(self, event):
         """ Handle dragging of an object """
@@ -399,63 +497,81 @@ class GObject:
         if self._drag_data["item"] is None:
             return
 
-        # compute how much the mouse has moved
-        delta_x = event.x - self._drag_data["x"]
-        delta_y = event.y - self._drag_data["y"]
+        # Motion events can arrive much faster than the screen is redrawn, so we just add up how much the mouse
+        # has moved, and apply it all in one go on the next frame
+        self._drag_data["dx"] += event.x - self._drag_data["x"]
+        self._drag_data["dy"] += event.y - self._drag_data["y"]
 
-        # Let's start by getting the list of canvas items I'm composed of
-        items_im_composed_of = self.gcanvas.canvas.find_withtag(self._tag)
-        # Another way to get the list of items I'm composed of:
-        #items_im_composed_of = [i.item for i in self._items.values()]
-        #print("DEBUG: self._tag={} items_im_composed_of={}".format(self._tag, items_im_composed_of))
+        # record the new position
+        self._drag_data["x"] = event.x
+        self._drag_data["y"] = event.y
 
-        #
-        # We want to move all sub-objects/items, not just the one we clicked on.  So we
-        # move all canvas items tagged with self._tag, which would be the whole GObject
-        #
-        # We also want to move any items tagged as "selected" which may have been selected
-        # by the selection box.  However, if self._tag is contained within the selected set,
-        # we dont want to move it twice, otherwise we end up with it moving twice as far on
-        # the canvas.
-        #
-        # We have 2 cases to consider:
-        #   1) Are we moving an item that is NOT selected?  If so, just move it.
-        #   2) Or Are we moving an item that IS selected? If so, then move all "selected" items,
-        #      which will already include the one we click-dragged
-        #
+        if self._drag_data["frame"] is None:
+            self._drag_data["frame"] = self.gcanvas.after(self.gcanvas.drag_frame_interval, self.apply_drag)
+
+    def start_drag(self):
+        """
+        Work out (once per drag) what moves along with me, and which GWires will need to follow
 
-        # get all tags on the 1st item in the list/tuple
-        tags_on_1st_item = self.gcanvas.canvas.gettags(items_im_composed_of[0])
+        We have 2 cases to consider:
+          1) Are we moving a GObject that is NOT selected?  If so, just move it.
+          2) Or Are we moving a GObject that IS selected? If so, then move all selected GObjects,
+             which will already include the one we click-dragged
 
-        # If one of the items in the GObject has the "selected" tag, they all will.
-        # So, we can just check the 1st item to determine selection status.
-        if "selected" in tags_on_1st_item:
+        GWires connected to the GObjects that are moving either have both ends moving too (so we can just move
+        them along with everything else), or have one end left behind, so they have to be re-drawn every frame.
+        """
+        if self._selected:
+            moving = set(self.gcanvas.selection)
+            moving.add(self)
             self.raise_with_tag("selected")
-            self.gcanvas.canvas.move("selected", delta_x, delta_y)  # Case #1
-
-            # TODO:  THIS WHOLE SECTION NEEDS TO BE DRY'ed OUT
-            # TODO:  vvv
-            # deal with updating connections - get any and all GObjects on the canvas that are selected,
-            # and make sure we update any connections to any of them as we drag one.
-            # first get list of all GObjects involved
-            items_selected = self.gcanvas.canvas.find_withtag("selected")
-            # of the selected items, which ones have active connections?
-            # first we need to get the GObject that corresponds to the canvas item
-            for c_item in items_selected:
-                g_object = self.gcanvas.get_gobject_by_id((c_item,))
-                if g_object._nodes:
-                    #print(f"DEBUG: GObject {g_object} has nodes {g_object._nodes}")
-                    for g_node_name in g_object._nodes:
-                        g_node = g_object._nodes[g_node_name]
-                        # check if our g_node has connections
-                        if g_node.connections:
-                            for conn in g_node.connections:
-                                # if we have any connections, update the location of the connection g_object
-                                conn.g_object.update()
-            # TODO:  ^^^
-            # TODO:  THIS WHOLE SECTION NEEDS TO BE DRY'ed OUT
         else:
-            self.gcanvas.canvas.move(self._tag, delta_x, delta_y)   # Case #2
+            moving = {self}
+
+        wires_moving = set()
+        wires_dirty = set()
+        for g_object in moving:
+            for g_node in g_object._nodes.values():
+                for conn in g_node.connections:
+                    wire = conn.g_object
+                    if wire in moving:
+                        # a selected GWire is already moved with the selection
+                        continue
+                    if all(n.g_object in moving for n in conn.g_nodes):
+                        wires_moving.add(wire)
+                    else:
+                        wires_dirty.add(wire)
+
+        self._drag_data["moving"] = list(moving)
+        self._drag_data["slots"] = [slot for g_object in moving for slot in g_object.slots]
+        self._drag_data["wires_moving"] = list(wires_moving)
+        self._drag_data["wires_dirty"] = list(wires_dirty)
+
+    def apply_drag(self):
+        """ Move the dragged GObject (or the selection) by however far the mouse has moved since the last frame """
+
+        self._drag_data["frame"] = None
+
+        delta_x = self._drag_data["dx"]
+        delta_y = self._drag_data["dy"]
+        self._drag_data["dx"] = 0
+        self._drag_data["dy"] = 0
+
+        if delta_x == 0 and delta_y == 0:
+            return
+
+        # We want to move all sub-objects/items, not just the one we clicked on.  So we
+        # move all canvas items tagged with self._tag, which would be the whole GObject,
+        # or if I'm selected, all items tagged as "selected" (which includes mine)
+        if self._selected:
+            self.gcanvas.canvas.move("selected", delta_x, delta_y)  # Case #2
+        else:
+            self.gcanvas.canvas.move(self._tag, delta_x, delta_y)   # Case #1
+        # ...and move their model coords to match, in one pass over the coordinate store
+        zl = self.gcanvas.zoom_level
+        self.gcanvas.coord_store.translate(self._drag_data["slots"], delta_x / zl, delta_y / zl)
+        for g_object in self._drag_data["moving"]:
+            g_object.translated(delta_x / zl, delta_y / zl)
 
         # TODO: Something to think about -
         # TODO:
@@ -475,29 +591,15 @@ class GObject:
         # TODO: a "for each GItem do..." loop, and then implementing a move() method on each GItem, which seems...?
         # TODO:
 
-        # If we are moving a GObject that is connectable, we need to ensure we send a message to any
-        # connected GObjects to update themselves (re-draw)
-        #
-        # This means that we need to know what GObject(s) we are connected to
-        # As we are dragging an entire GObject, we shouldn't need to know the exact GItems that need to be updated
-        # rather, we just send a message to any connected GObjects to redraw themselves.
-
-        # if we have a connection, make sure to update them too
-        # first check if we have any GNodes, and if those GNodes have connections
-        if self._nodes:
-            for g_node_name in self._nodes:
-                g_node = self._nodes[g_node_name]
-                # check if our g_node has connections
-                if g_node.connections:
-                    for conn in g_node.connections:
-                        # if we have any connections, update the location of the connection g_object
-                        conn.g_object.update()
-
-        # record the new position
-        self._drag_data["x"] = event.x
-        self._drag_data["y"] = event.y
+        # If we are moving GObjects that are connectable, the GWires connected to them have to follow.  GWires
+        # with both ends moving are simply moved, and the others are re-drawn (once each, however many of the
+        # moving GObjects they are connected to).
+        for wire in self._drag_data["wires_moving"]:
+            wire.move(delta_x, delta_y)
+        for wire in self._drag_data["wires_dirty"]:
+            wire.update()
 
-        x, y = self.screen_to_canvas_coords(event.x, event.y)
+        x, y = self.screen_to_canvas_coords(self._drag_data["x"], self._drag_data["y"])
 
         # update status var
         if self.gcanvas.status_var:
@@ -516,51 +618,56 @@ class GObject:
             pass
 
     def raise_up(self):
-        for g_item_name in self._items:
-            g_item = self._items[g_item_name]
-            g_item.raise_up()
-            if g_item.raisable:
-                g_item.raise_up()
+        # All of my canvas items have my name tag, so they can be raised together (keeping their stacking order)
+        self.gcanvas.raise_gobjects([self])
+
+    def neighbors(self):
+        """ the GWires connected to my GNodes, and the GObjects on the other end of them """
+        neighbors = []
+        for g_node in self._nodes.values():
+            for g_conn in g_node.connections:
+                neighbors.append(g_conn.g_object) # The GWire
+                for neighbor_g_node in g_conn.g_nodes:
+                    neighbors.append(neighbor_g_node.g_object)
+        return neighbors
 
     def raise_up_neighbors(self):
-        if self._nodes:
-            for g_node_name in self._nodes:
-                g_node = self._nodes[g_node_name]
-                for g_conn in g_node.connections:
-                    g_conn.g_object.raise_up() # The GWire
-                    for neighbor_g_node in g_conn.g_nodes:
-                        neighbor_g_node.g_object.raise_up()
+        self.gcanvas.raise_gobjects(self.neighbors())
 
     def raise_with_tag(self, tag):
-        items = self.gcanvas.canvas.find_withtag(tag)
-        #print(f"Items found with tag: {tag} = {items}")
-        for item in items:
-            tags_on_item = self.gcanvas.canvas.gettags(item)
-            #print(f"    --> Tags on item {item} = {tags_on_item}")
-            if "raisable" in tags_on_item:
-                self.gcanvas.canvas.tag_raise(item)
+        # raise the "raisable" items with tag, with one tag search expression per layer
+        self.gcanvas.raise_tag(f"{tag}&&raisable")
 
     def set_selected(self):
         if self.selectable:
             self._selected = True
-            for item in self._items.values():
-                #print(f"DEBUG: set_selected(): item = {item}")
-                item.selected = True
+            with self.batch():
+                for item in self._items.values():
+                    #print(f"DEBUG: set_selected(): item = {item}")
+                    item.selected = True
+            self.gcanvas.selection.add(self)
 
     def clear_selected(self):
         if self.selectable:
             self._selected = False
-            for item in self._items.values():
-                #print(f"DEBUG: clear_selected(): item = {item}")
-                item.selected = False
+            with self.batch():
+                for item in self._items.values():
+                    #print(f"DEBUG: clear_selected(): item = {item}")
+                    item.selected = False
+            self.gcanvas.selection.discard(self)
 
     def toggle_selected(self):
         if self.selectable:
             self._selected = not self._selected
             if self._selected:
                 self.set_selected()
+                self.gcanvas.selection_changed(added=[self], removed=[])
             else:
                 self.clear_selected()
+                self.gcanvas.selection_changed(added=[], removed=[self])
+
+    # NOTE: on_selection_event() and update_selection_status() are no longer bound to <<Selection>> (the GCanvas
+    # NOTE: works out what's selected itself), but are kept for user code that calls them.
 
     def on_selection_event(self, event):
         #print("Selection event triggered {}".format(self._tag))
@@ -586,21 +693,12 @@ class GObject:
 
     def get_item_by_id(self, id):
         """
-        find the key in self._items that has value.item == id
-        This allows us to map canvas item ID to the actual GItem object
-        In other words, "Get GItem object ref by canvas item ID"
+        Get GItem object ref by canvas item ID, if the canvas item is one of mine
+        The id can be an int, or a tuple as returned by find_withtag() and find_closest()
         """
-
-        # TODO: make this more forgiving, so that id can come in as
-        # TODO: an int or a tuple
-        for i in self._items:
-            current_id = self._items[i].item
-            #print(f"DEBUG: get_item_by_id({id}) --> Checking {current_id}")
-            if current_id in id or current_id == id:
-                #print(f"DEBUG: get_item_by_id({id}) --> Found")
-                return self._items[i]
-        # if we get here, it wasn't found
-        #print(f"DEBUG: get_item_by_id({id}) --> Not found")
+        (g_object, g_item) = self.gcanvas.lookup_id(id)
+        if g_object is self:
+            return g_item
         return None
 
     def get_node_name_by_g_item(self, g_item):
@@ -622,29 +720,63 @@ class GObject:
             # get the GItem from item_id
             g_item = self.get_item_by_id(canvas_item_id)
 
-            #if g_item:
-            #    if direction is "enter":
-            #        print(f"DEBUG: Entered GItem: {g_item} with id {g_item.item}")
-            #    else:
-            #        print(f"DEBUG: Leaving GItem: {g_item} with id {g_item.item}")
+            if g_item is None:
+                return
 
-            if direction is "enter" and g_item.raisable:
-                self.raise_up_neighbors()
-                self.raise_up()
+            #if direction == "enter":
+            #    print(f"DEBUG: Entered GItem: {g_item} with id {g_item.item}")
+            #else:
+            #    print(f"DEBUG: Leaving GItem: {g_item} with id {g_item.item}")
+
+            if direction == "enter" and g_item.raisable:
+                # bring me and my neighbors to the front together, in a few tag searches (one per layer)
+                self.gcanvas.raise_gobjects(self.neighbors() + [self])
 
             # (de)highlight the item where the event was triggered by manually setting outline and width
             if g_item.highlightable:
-                if direction is "enter":  # <Enter>
+                if direction == "enter":  # <Enter>
                     highlighted = True
                 else:                     # <Leave>
                     highlighted = False
 
                 if not g_item.highlight_group:
-                    g_item.highlighted = highlighted
+                    # With native highlighting, Tk's activeoutline and activewidth already highlight the item
+                    if not self.gcanvas.native_highlight:
+                        g_item.highlighted = highlighted
                 else:
-                    for sibling_g_item in self._items.values():
-                        if sibling_g_item.highlightable and sibling_g_item.highlight_group == g_item.highlight_group:
-                            sibling_g_item.highlighted = highlighted
+                    self.highlight_group(g_item.highlight_group, highlighted)
+
+    def highlight_group(self, name, highlighted):
+        """ (de)highlight all of my highlightable GItems in highlight group name """
+        members = [g_item for g_item in self._items.values()
+                   if g_item.highlightable and g_item.highlight_group == name]
+        if not members:
+            return
+
+        # Members that take the same options (see GItem.outline_option) and all look the same change the same way, so
+        # one itemconfigure of their highlight group tag does them all.  Otherwise, each member has to be configured
+        # separately.
+        kinds = {}
+        for g_item in members:
+            kinds.setdefault(g_item.outline_option, []).append(g_item)
+        for (outline_option, members) in kinds.items():
+            first = members[0]
+            options = first.highlight_options(highlighted)
+            if all(m.materialized and not m.batching and m.highlight_options(highlighted) == options and
+                   all(m.options.get(k) == first.options.get(k) for k in options) for m in members):
+                tag = self._tag + ":highlight_group:" + name + ":" + outline_option
+                canvas = self.gcanvas.canvas
+                for option in ('width', 'activewidth'):
+                    if option in options and first.options.get(option) != options[option]:
+                        # keep the width class tags (see GCanvas.on_zoom()) right for the whole group too
+                        canvas.dtag(tag, f"{option}:{float(first.options[option]):g}")
+                        canvas.addtag_withtag(f"{option}:{float(options[option]):g}", tag)
+                canvas.itemconfigure(tag, **first._zoomed(options))
+                for m in members:
+                    m.configured(highlighted=highlighted, **options)
+            else:
+                for m in members:
+                    m.highlighted = highlighted
 
     def hide(self):
         for item in self._items.values():
@@ -682,9 +814,8 @@ class GObject:
         # the max settings, and if the things we're trying to connect are valid
 
     def smooth_coords(self, coords):
-        """ takes a 4-tuple of coordinates and returns the augmented coords """
+        """ takes a 4-tuple of model coordinates and returns the augmented coords """
 
-        zl = self.gcanvas.zoom_level
         x1 = coords[0]
         y1 = coords[1]
         x2 = coords[2]
@@ -693,8 +824,8 @@ class GObject:
         # Insert a couple mid-points so our line is nice and smooth
         new_coords = (
             x1, y1,
-            x1 + (zl * 20), y1,
-            x2 - (zl * 20), y2,
+            x1 + 20, y1,
+            x2 - 20, y2,
             x2, y2,
         )
         return new_coords
@@ -1,3 +1,4 @@
+import math
 
 from ..gobject import GObject
 from ..gitem import GLineItem, GRectItem
@@ -6,6 +7,18 @@ from ..gitem import GLineItem, GRectItem
 class GGraphPaper(GObject):
     """ Draw Graph Paper """
 
+    __slots__ = (
+        '_width', '_height', '_bg_color', '_viewport_only',
+        '_grid_lines', '_grid_colors', '_grid_shown', '_grid_state', '_grid_drawn',
+    )
+
+    # In viewport_only mode, never draw grid lines closer together than this many pixels.  When zoomed out far
+    # enough that the 10px grid would be denser than this, we switch to every 10th line, then every 100th, etc.
+    min_line_spacing = 6
+
+    # In viewport_only mode, how far (in pixels) beyond the visible area we draw, so small pans are free
+    viewport_margin = 200
+
     def __init__(self, *args, **kwargs):
 
         initial_x = args[0]
@@ -14,6 +27,9 @@ class GGraphPaper(GObject):
         height = args[3]
         #name_tag = kwargs['name']
 
+        # Only draw the grid lines that are visible (rather than one GItem per line for the whole sheet)
+        viewport_only = kwargs.pop('viewport_only', False)
+
         # Initialize parent GObject class
         super().__init__(initial_x, initial_y, **kwargs)
 
@@ -21,7 +37,23 @@ class GGraphPaper(GObject):
         self._height = height
         self._bg_color = "#eeffee"
 
+        self._viewport_only = viewport_only
+
+        # Used by viewport_only mode:  a pool of canvas line items that we re-position as the view changes,
+        # the color each pooled line currently has, and how many of them are currently shown
+        self._grid_lines = []
+        self._grid_colors = []
+        self._grid_shown = 0
+        self._grid_state = 'normal'
+
+        # The area (canvas coordinates) and line spacing the pooled lines were last drawn for
+        self._grid_drawn = None
+
     def add(self):
+        if self._viewport_only:
+            self.add_viewport_only()
+            return
+
         # Draw the Graph Paper background rectangle using a greenish-white tint
         self._items['background_rect'] = GRectItem(
             self.gcanvas, self._x, self._y, self._x + self._width, self._y + self._height, self._tag)
@@ -31,7 +63,7 @@ class GGraphPaper(GObject):
         self._items['background_rect'].hidden = False
         self._items['background_rect'].raisable = False
         self._items['background_rect'].draggable = False
-        self._items['background_rect'].selectable = False
+        self._items['background_rect'].show_selection = False
 
         # Draw the Graph Paper lines.  We draw all of the vertical lines, followed by all of the
         # horizontal lines.  Every 100 pixels (or every 10th line) we draw using a DARKER green, to
@@ -52,7 +84,7 @@ class GGraphPaper(GObject):
             self._items['graph_paper_vline'+str(i)].hidden = False
             self._items['graph_paper_vline'+str(i)].raisable = False
             self._items['graph_paper_vline'+str(i)].draggable = False
-            self._items['graph_paper_vline'+str(i)].selectable = False
+            self._items['graph_paper_vline'+str(i)].show_selection = False
 
         # Creates all horizontal lines
         for i in range(self._y, self._y + self._height, 10):
@@ -69,5 +101,110 @@ class GGraphPaper(GObject):
             self._items['graph_paper_hline'+str(i)].hidden = False
             self._items['graph_paper_hline'+str(i)].raisable = False
             self._items['graph_paper_hline'+str(i)].draggable = False
-            self._items['graph_paper_hline'+str(i)].selectable = False
+            self._items['graph_paper_hline'+str(i)].show_selection = False
+
+    def add_viewport_only(self):
+        """ Draw just the background rectangle now, and the grid lines whenever the viewport changes """
+        self._items['background_rect'] = GRectItem(
+            self.gcanvas, self._x, self._y, self._width, self._height, self._tag)
+        self._items['background_rect'].add()
+        self._items['background_rect'].fill_color = self._bg_color
+        self._items['background_rect'].outline_color = self._bg_color
+        self._items['background_rect'].hidden = False
+        self._items['background_rect'].raisable = False
+        self._items['background_rect'].draggable = False
+
+        self.gcanvas.register_viewport_callback(self.redraw)
+        self.gcanvas.schedule_viewport_update()
+
+    def redraw(self):
+        """ Re-position the pooled grid lines to cover the visible area (viewport_only mode) """
+        if not self._viewport_only:
+            return
+
+        canvas = self.gcanvas.canvas
+
+        # Where the sheet is on the canvas, from the background rectangle's model coords.  (Its canvas item can't
+        # be asked, as in virtualized mode it's deleted while the sheet is out of view.)
+        scale = self.gcanvas.zoom_level
+        (rx0, ry0, rx1, ry1) = self.gcanvas.model_to_canvas(self._items['background_rect'].model_coords)
+
+        # Pick the line spacing for this zoom level
+        step = 10
+        while step * scale < self.min_line_spacing:
+            step *= 10
+
+        # If we've already drawn lines for a larger area than we can see at this spacing, there is nothing to do
+        (vx0, vy0, vx1, vy1) = self.gcanvas.viewport()
+        if self._grid_drawn:
+            (dx0, dy0, dx1, dy1, drawn_scale, drawn_step) = self._grid_drawn
+            if (drawn_scale == scale and drawn_step == step and
+                    dx0 <= max(vx0, rx0) and dy0 <= max(vy0, ry0) and dx1 >= min(vx1, rx1) and dy1 >= min(vy1, ry1)):
+                return
+
+        # The area we'll draw: the viewport plus a margin, clipped to the sheet
+        x0 = max(vx0 - self.viewport_margin, rx0)
+        y0 = max(vy0 - self.viewport_margin, ry0)
+        x1 = min(vx1 + self.viewport_margin, rx1)
+        y1 = min(vy1 + self.viewport_margin, ry1)
+        self._grid_drawn = (x0, y0, x1, y1, scale, step)
+
+        lines = []
+        spacing = step * scale
+
+        # Vertical lines.  Every 10th line (counting from the edge of the sheet) is darker.
+        i = max(0, math.ceil((x0 - rx0) / spacing))
+        while rx0 + i * spacing <= x1:
+            x = rx0 + i * spacing
+            lines.append(((x, y0, x, y1), "#aaffaa" if i % 10 == 0 else "#ccffcc"))
+            i += 1
+
+        # Horizontal lines
+        i = max(0, math.ceil((y0 - ry0) / spacing))
+        while ry0 + i * spacing <= y1:
+            y = ry0 + i * spacing
+            lines.append(((x0, y, x1, y), "#aaffaa" if i % 10 == 0 else "#ccffcc"))
+            i += 1
+
+        # Re-use the lines we already have, and only create more if the pool is too small
+        grew = False
+        for i, (points, line_color) in enumerate(lines):
+            if i < len(self._grid_lines):
+                canvas.coords(self._grid_lines[i], points)
+                if self._grid_colors[i] != line_color:
+                    canvas.itemconfigure(self._grid_lines[i], fill=line_color)
+                    self._grid_colors[i] = line_color
+                if i >= self._grid_shown:
+                    canvas.itemconfigure(self._grid_lines[i], state=self._grid_state)
+            else:
+                self._grid_lines.append(canvas.create_line(
+                    points, fill=line_color, width=1.0, state=self._grid_state,
+                    tags=(self._tag, self._tag + ":grid", self.gcanvas.layer_tag('background'))))
+                self._grid_colors.append(line_color)
+                grew = True
+
+        # Hide any left-over lines we don't need right now
+        for i in range(len(lines), self._grid_shown):
+            canvas.itemconfigure(self._grid_lines[i], state='hidden')
+        self._grid_shown = len(lines)
+
+        # New lines must sit just above the sheet, but below everything else on the canvas
+        if grew:
+            if self._items['background_rect'].item is not None:
+                canvas.tag_raise(self._tag + ":grid", self._items['background_rect'].item)
+            else:
+                canvas.tag_lower(self._tag + ":grid", self.gcanvas.layer_marker('background'))
+
+    def hide(self):
+        super().hide()
+        self._set_grid_state('hidden')
+
+    def show(self):
+        super().show()
+        self._set_grid_state('normal')
 
+    def _set_grid_state(self, state):
+        self._grid_state = state
+        if self._grid_shown:
+            for line in self._grid_lines[:self._grid_shown]:
+                self.gcanvas.canvas.itemconfigure(line, state=state)
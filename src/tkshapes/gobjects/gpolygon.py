@@ -7,6 +7,8 @@ from ..gnode import GNode
 class GPolygon(GObject):
     """ Draw Polygon given coords GCanvas """
 
+    __slots__ = ('_coords',)
+
     def __init__(self, *args, **kwargs):
         super().__init__(0, 0, **kwargs)
 
@@ -1,129 +1,60 @@
-
-import math
-import cmath
 import itertools
 
 from ..gobject import GObject
-from ..gitem import GPolygonItem
+from ..ggeometry import arc, rotate
+from ..gtemplate import GTemplate
+
+
+def blue_snake():
+    points = [0, 68]  # first point in polygon
+
+    # starting at top left snake mouth
+    points += arc(29, 30, 30, 30, -180, -90)
+    points += arc(126, 30, 30, 30, -90, 0)
+    points += arc(126, 122, 30, 30, 0, 90)
+    points += arc(30, 194, -42, 42, -90, 0)
+    points += [-12, 238]
+    points += arc(-50, 208, 30, 30, 90, 180)
+    points += arc(-50, 110, 30, 30, -180, -90)
+    points += [78, 80, 78, 68, 32, 68, 32, 50]
+    points += arc(32, 32, 15, 15, -270, 90)
+    points += [32, 68]
+    return points
+
+
+def orange_snake():
+    # The second snake is the first one rotated 180 degrees about the center of the logo
+    angle = 3.14159  # 3.14159 radians = 180 degrees
+    return rotate(blue_snake(), angle, 78, 158)
+
+
+def snake_style(color):
+    return {
+        'fill_color': color,
+        'outline_color': color,
+        'active_outline_color': color,
+        'outline_width': 1.0,
+        'active_outline_width': 1.0,
+        'hidden': False,
+        'draggable': True,
+        'show_selection': False,
+        'show_highlight': False,
+    }
+
+
+# Note: there's no need to scale the points for the current zoom level, as the GCanvas does that when
+# it draws our GItems (the points are model coordinates)
+PYTHON_LOGO = GTemplate('GPythonLogo')
+PYTHON_LOGO.polygon('blue_snake', blue_snake, snake_style('#4B8BBE'))
+PYTHON_LOGO.polygon('orange_snake', orange_snake, snake_style('#FFD43B'))
 
 
 class GPythonLogo(GObject):
     """ Draw Python Logo on the GCanvas """
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-
-        self._points = []
-        self._rotated_points = []
-        self._zoomed_points = []
-        self._zoomed_rotated_points = []
-
-    def add(self):
-
-        x = self._x
-        y = self._y
-
-        self._points.extend((x, y + 68))  # first point in polygon
-
-        # starting at top left snake mouth
-        for angle in range(-180, -90):
-            arc_x = (math.cos(math.radians(angle)) * 30) + (x + 29)
-            arc_y = (math.sin(math.radians(angle)) * 30) + (y + 30)
-            self._points.extend((arc_x, arc_y))
-
-        for angle in range(-90, 0):
-            arc_x = (math.cos(math.radians(angle)) * 30) + (x + 126)
-            arc_y = (math.sin(math.radians(angle)) * 30) + (y + 30)
-            self._points.extend((arc_x, arc_y))
-
-        for angle in range(0, 90):
-            arc_x = (math.cos(math.radians(angle)) * 30) + (x + 126)
-            arc_y = (math.sin(math.radians(angle)) * 30) + (y + 122)
-            self._points.extend((arc_x, arc_y))
-
-        for angle in range(-90, 0):
-            arc_x = (math.cos(math.radians(angle)) * -42) + (x + 30)
-            arc_y = (math.sin(math.radians(angle)) * 42) + (y + 194)
-            self._points.extend((arc_x, arc_y))
-
-        self._points.extend((x - 12, y + 238))
-
-        for angle in range(90, 180):
-            arc_x = (math.cos(math.radians(angle)) * 30) + (x - 50)
-            arc_y = (math.sin(math.radians(angle)) * 30) + (y + 208)
-            self._points.extend((arc_x, arc_y))
-
-        for angle in range(-180, -90):
-            arc_x = (math.cos(math.radians(angle)) * 30) + (x - 50)
-            arc_y = (math.sin(math.radians(angle)) * 30) + (y + 110)
-            self._points.extend((arc_x, arc_y))
-
-        self._points.extend((x + 78, y + 80))
-        self._points.extend((x + 78, y + 68))
-        self._points.extend((x + 32, y + 68))
-        self._points.extend((x + 32, y + 50))
-
-        for angle in range(-270, 90):
-            arc_x = (math.cos(math.radians(angle)) * 15) + (x + 32)
-            arc_y = (math.sin(math.radians(angle)) * 15) + (y + 32)
-            self._points.extend((arc_x, arc_y))
-
-        self._points.extend((x + 32, y + 68))
-
-        # the mathematical formulas to scale a point (x,y) by a factor of S relative to the point (cx, cy) are:
-        # x_new = (S * (x - cx)) + cx
-        # y_new = (S * (y - cy)) + cy
-
-        cx = x + 78
-        cy = y + 158
-
-        self._zoomed_points = []
-        for xx, yy in grouper(self._points, 2):
-            x_new = (self.gcanvas.zoom_level * (xx - cx)) + cx
-            y_new = (self.gcanvas.zoom_level * (yy - cy)) + cy
-            self._zoomed_points.extend((x_new, y_new))
-
-        self._items['blue_snake'] = GPolygonItem(self.gcanvas, self._zoomed_points, self._tag)
-        self._items['blue_snake'].add()
-        self._items['blue_snake'].fill_color = '#4B8BBE'
-        self._items['blue_snake'].outline_color = '#4B8BBE'
-        self._items['blue_snake'].active_outline_color = '#4B8BBE'
-        self._items['blue_snake'].outline_width = 1.0
-        self._items['blue_snake'].active_outline_width = 1.0
-        self._items['blue_snake'].hidden = False
-        self._items['blue_snake'].draggable = True
-        self._items['blue_snake'].show_selection = False
-        self._items['blue_snake'].show_highlight = False
-
-        # I want to make a second snake rotated 180 degrees
-        # See: http://effbot.org/zone/tkinter-complex-canvas.htm
-        angle = 3.14159  # 3.14159 radians = 180 degrees
-        cangle = cmath.exp(angle * 1j)
-
-        # we will rotate about x,y
-        center = complex(cx, cy)
-        self._rotated_points = []
-        for xx, yy in grouper(self._points, 2):
-            v = cangle * (complex(xx, yy) - center) + center
-            self._rotated_points.extend((v.real, v.imag))
-
-        self._zoomed_rotated_points = []
-        for xx, yy in grouper(self._rotated_points, 2):
-            x_new = (self.gcanvas.zoom_level * (xx - cx)) + cx
-            y_new = (self.gcanvas.zoom_level * (yy - cy)) + cy
-            self._zoomed_rotated_points.extend((x_new, y_new))
-
-        self._items['orange_snake'] = GPolygonItem(self.gcanvas, self._zoomed_rotated_points, self._tag)
-        self._items['orange_snake'].add()
-        self._items['orange_snake'].fill_color = '#FFD43B'
-        self._items['orange_snake'].outline_color = '#FFD43B'
-        self._items['orange_snake'].active_outline_color = '#FFD43B'
-        self._items['orange_snake'].outline_width = 1.0
-        self._items['orange_snake'].active_outline_width = 1.0
-        self._items['orange_snake'].hidden = False
-        self._items['orange_snake'].draggable = True
-        self._items['orange_snake'].show_selection = False
-        self._items['orange_snake'].show_highlight = False
+    __slots__ = ()
+
+    template = PYTHON_LOGO
 
 
 def grouper(iterable, n, fillvalue=None):
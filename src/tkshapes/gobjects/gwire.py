@@ -7,6 +7,8 @@ from ..gconnection import GConnection
 class GWire(GObject):
     """ Draw Wire connecting two connectable GObjects """
 
+    __slots__ = ('_coords',)
+
     def __init__(self, *args, **kwargs):
         initial_coords = args[0]  # should be a 4-tuple
 
@@ -33,7 +35,7 @@ class GWire(GObject):
         self._items['fat_line'] = GWireItem(self.gcanvas, coords, self._tag)
         self._items['fat_line'].add()
         self._items['fat_line'].outline_color = 'blue'
-        self._items['fat_line'].outline_width = 5.0 * self.gcanvas.zoom_level
+        self._items['fat_line'].outline_width = 5.0
         self._items['fat_line'].hidden = False
         self._items['fat_line'].draggable = False
         self._items['fat_line'].always_on_top = True
@@ -41,7 +43,7 @@ class GWire(GObject):
         self._items['thin_line'] = GWireItem(self.gcanvas, coords, self._tag)
         self._items['thin_line'].add()
         self._items['thin_line'].outline_color = 'white'
-        self._items['thin_line'].outline_width = 2.0 * self.gcanvas.zoom_level
+        self._items['thin_line'].outline_width = 2.0
         self._items['thin_line'].hidden = False
         self._items['thin_line'].draggable = False
         self._items['thin_line'].always_on_top = True
@@ -55,9 +57,15 @@ class GWire(GObject):
             g_item.coords = self.smooth_coords(self._coords)
             g_item.redraw()
 
+    def translated(self, dx, dy):
+        """ my GItems have been moved by dx, dy model units, so move my end points too """
+        self._coords = [v + (dx if i % 2 == 0 else dy) for i, v in enumerate(self._coords)]
+        super().translated(dx, dy)
+
     def move_to(self, coords):
         self.coords(coords)
         self.redraw()
+        self.update_bounds()
 
     def update(self):
         """ check if we have any GNode connections, update our coords, and redraw """
@@ -69,8 +77,7 @@ class GWire(GObject):
             for g_node in self.connection.g_nodes:
                 #print(f"** DEBUG:      g_node.name: {g_node.name}")
                 #print(f"** DEBUG:      g_node.g_item: {g_node.g_item} {g_node.g_item.item}")
-                (x, y) = g_node.g_item.center_point()
-                coords.extend([x, y])
+                coords.extend(g_node.anchor)
             #print(f"DEBUG: update(): Calculated new coords for GWire {coords}")
             self.move_to(coords)
 
@@ -0,0 +1,224 @@
+from array import array
+from heapq import heappush, heappop
+
+
+# The logic functions, by operation code.  Each takes the values (0 or 1) of a gate's inputs
+OPERATIONS = ['and', 'or', 'xor', 'nand', 'nor', 'xnor', 'not', 'buffer']
+FUNCTIONS = [
+    lambda v: int(all(v)),
+    lambda v: int(any(v)),
+    lambda v: sum(v) & 1,
+    lambda v: 1 - all(v),
+    lambda v: 1 - any(v),
+    lambda v: 1 - (sum(v) & 1),
+    lambda v: 1 - v[0],
+    lambda v: v[0],
+]
+
+# Not driven by anything (the value stays 0), or driven by a switch rather than a gate.  See GSimulator.driver
+UNDRIVEN = -1
+SWITCH = -2
+
+
+class GSimulator:
+    """
+    Simulates the logic circuit drawn on a GCanvas:  the gates, GToggleSwitches and GLightBulbs (the GObjects with
+    logic set), and the GWires connecting their GNodes.
+
+    compile() turns the drawing into a netlist.  GNodes joined by wires make up a net, and each net is numbered and
+    has a value (0 or 1) in a flat array.  The gates are numbered in level order (a gate comes after the gates that
+    drive its inputs), with their operation, input nets and output net in flat arrays too, and each net knows the
+    gates it fans out to.
+
+    When a switch changes (see input_changed()), only the gates in its fan-out cone are evaluated, in level order,
+    and only as far as outputs keep changing.  Then the GLightBulbs on the nets that changed are updated.
+
+    The netlist doesn't follow changes to the drawing, so compile() again after connections are made.
+    """
+
+    def __init__(self, gcanvas):
+        self.gcanvas = gcanvas
+
+        # how many gate evaluations have been done, in total
+        self.evaluations = 0
+
+        self.compile()
+
+    def compile(self):
+        """ build the netlist from the GObjects and GWires on the GCanvas, and settle the circuit """
+        gobjects = list(self.gcanvas.gobjects.values())
+
+        # Join the GNodes at either end of each wire into nets (union-find)
+        parent = {}
+
+        def find(g_node):
+            root = g_node
+            while parent.get(root, root) is not root:
+                root = parent[root]
+            while g_node is not root:
+                (parent[g_node], g_node) = (root, parent[g_node])
+            return root
+
+        for gobject in gobjects:
+            if gobject.connection is not None and len(gobject.connection.g_nodes) == 2:
+                (a, b) = (find(gobject.connection.g_nodes[0]), find(gobject.connection.g_nodes[1]))
+                if a is not b:
+                    parent[a] = b
+
+        # Number the nets
+        self.node_net = {}
+        nets = {}
+        for gobject in gobjects:
+            if gobject.logic is not None:
+                for g_node in gobject._nodes.values():
+                    self.node_net[g_node] = nets.setdefault(find(g_node), len(nets))
+        n_nets = len(nets)
+
+        self.values = bytearray(n_nets)
+        self.driver = array('l', [UNDRIVEN]) * n_nets
+        self.switch_net = {}
+        self.bulbs = {}
+        gates = []
+        for gobject in gobjects:
+            if gobject.logic == 'switch':
+                net = self.node_net[gobject._nodes['output']]
+                self.switch_net[gobject] = net
+                self.driver[net] = SWITCH
+                self.values[net] = 1 if gobject.state else 0
+            elif gobject.logic == 'bulb':
+                self.bulbs.setdefault(self.node_net[gobject._nodes['input']], []).append(gobject)
+            elif gobject.logic is not None:
+                gates.append(gobject)
+
+        # The nets each gate's output drives (a net with more than one driver follows the first one)
+        driven_by = {}
+        for gate in gates:
+            net = self.node_net[gate._nodes['output']]
+            if self.driver[net] == UNDRIVEN and net not in driven_by:
+                driven_by[net] = gate
+
+        self.gates = self._levelize(gates, driven_by)
+
+        # Flat arrays over the gates, in level order
+        self.operation = array('B')
+        self.output = array('l')
+        self.input_start = array('l', [0])
+        self.inputs = array('l')
+        fanout = [[] for i in range(n_nets)]
+        for (i, gate) in enumerate(self.gates):
+            self.operation.append(OPERATIONS.index(gate.logic))
+            net = self.node_net[gate._nodes['output']]
+            self.output.append(net)
+            if driven_by.get(net) is gate:
+                self.driver[net] = i
+            for name in sorted(gate._nodes):
+                if name != 'output':
+                    self.inputs.append(self.node_net[gate._nodes[name]])
+                    fanout[self.inputs[-1]].append(i)
+            self.input_start.append(len(self.inputs))
+
+        # The gates each net is an input of, all in one array:  net n's are fanout[fanout_start[n]:fanout_start[n + 1]]
+        self.fanout_start = array('l', [0])
+        self.fanout = array('l')
+        for gates_of_net in fanout:
+            self.fanout.extend(sorted(set(gates_of_net)))
+            self.fanout_start.append(len(self.fanout))
+
+        # Settle the whole circuit, and show the result on every bulb
+        self._propagate(range(len(self.gates)), set())
+        self._update_bulbs(self.bulbs)
+
+    def _levelize(self, gates, driven_by):
+        """ gates in level order:  each gate after the gates that drive its inputs (gates in a loop go last) """
+        # the gates each gate feeds, and how many of the gates feeding it haven't been placed yet (Kahn's algorithm)
+        feeds = {gate: [] for gate in gates}
+        waiting = {}
+        for gate in gates:
+            drivers = {driven_by.get(self.node_net[g_node])
+                       for (name, g_node) in gate._nodes.items() if name != 'output'}
+            drivers.discard(None)
+            waiting[gate] = len(drivers)
+            for driver in drivers:
+                feeds[driver].append(gate)
+
+        level = {}
+        ready = [gate for gate in gates if not waiting[gate]]
+        for gate in ready:
+            level[gate] = 0
+        while ready:
+            gate = ready.pop()
+            for fed in feeds[gate]:
+                level[fed] = max(level.get(fed, 0), level[gate] + 1)
+                waiting[fed] -= 1
+                if not waiting[fed]:
+                    ready.append(fed)
+
+        # the gates in a loop are never ready
+        top = max(level.values(), default=0) + 1
+        return sorted(gates, key=lambda gate: level.get(gate, top))
+
+    def _evaluate(self, gate):
+        values = self.values
+        inputs = [values[net] for net in self.inputs[self.input_start[gate]:self.input_start[gate + 1]]]
+        if not inputs:
+            return 0
+        return FUNCTIONS[self.operation[gate]](inputs)
+
+    def _propagate(self, gates, changed):
+        """ evaluate gates, and the gates downstream of outputs that change.  Adds the nets that change to changed """
+        values = self.values
+        output = self.output
+        driver = self.driver
+        fanout = self.fanout
+        fanout_start = self.fanout_start
+        queued = bytearray(len(self.gates))
+        heap = []
+        for gate in gates:
+            if not queued[gate]:
+                queued[gate] = 1
+                heappush(heap, gate)
+
+        # the gates are numbered in level order, so taking the lowest numbered gate first evaluates each gate once
+        # its inputs are settled.  Only a loop in the circuit can make a gate come round again
+        limit = 100 * (len(self.gates) + 1)
+        evaluations = 0
+        while heap:
+            gate = heappop(heap)
+            queued[gate] = 0
+            evaluations += 1
+            if evaluations > limit:
+                raise RuntimeError("the circuit doesn't settle (it has a loop that oscillates)")
+            value = self._evaluate(gate)
+            net = output[gate]
+            if driver[net] == gate and values[net] != value:
+                values[net] = value
+                changed.add(net)
+                for i in range(fanout_start[net], fanout_start[net + 1]):
+                    if not queued[fanout[i]]:
+                        queued[fanout[i]] = 1
+                        heappush(heap, fanout[i])
+        self.evaluations += evaluations
+        return changed
+
+    def _update_bulbs(self, nets):
+        for net in nets:
+            for bulb in self.bulbs.get(net, ()):
+                bulb.state = bool(self.values[net])
+
+    def set_input(self, switch, value):
+        """ set the net a GToggleSwitch drives to value, and propagate the change """
+        net = self.switch_net[switch]
+        value = 1 if value else 0
+        if self.values[net] == value:
+            return
+        self.values[net] = value
+        changed = self._propagate(self.fanout[self.fanout_start[net]:self.fanout_start[net + 1]], {net})
+        self._update_bulbs(changed)
+
+    def input_changed(self, switch):
+        """ a GToggleSwitch has been toggled """
+        self.set_input(switch, switch.state)
+
+    def value(self, g_node):
+        """ the value (True or False) of the net g_node is on """
+        return bool(self.values[self.node_net[g_node]])
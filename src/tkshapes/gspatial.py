@@ -0,0 +1,157 @@
+
+import math
+
+
+class GSpatialIndex:
+    """
+    A uniform grid of buckets over bounding boxes, so we can find what is near a point or inside an area without
+    looking at everything.
+
+    Each key (usually a GObject or GNode) is stored with its bounding box (x0, y0, x1, y1), and is put in every
+    grid cell its bounding box touches.  Queries only look at the keys in the cells they touch.  Bounding boxes
+    are in model coordinates, so zooming in/out never changes the index, and moving a key only touches the
+    cells it left and the cells it entered.
+    """
+
+    def __init__(self, cell_size=100):
+        self.cell_size = cell_size
+
+        # key -> bounding box
+        self._bounds = {}
+
+        # (column, row) -> set of keys whose bounding box touches that cell
+        self._cells = {}
+
+        # key -> the (column, row) range of cells the key is in, so we know where to remove it from
+        self._key_cells = {}
+
+    def __len__(self):
+        return len(self._bounds)
+
+    def __contains__(self, key):
+        return key in self._bounds
+
+    def bounds(self, key):
+        """ return the bounding box of key, or None if it's not in the index """
+        return self._bounds.get(key)
+
+    def _cell_range(self, bounds):
+        (x0, y0, x1, y1) = bounds
+        c = self.cell_size
+        return (math.floor(min(x0, x1) / c), math.floor(min(y0, y1) / c),
+                math.floor(max(x0, x1) / c), math.floor(max(y0, y1) / c))
+
+    def _cells_in(self, cell_range):
+        (c0, r0, c1, r1) = cell_range
+        for col in range(c0, c1 + 1):
+            for row in range(r0, r1 + 1):
+                yield col, row
+
+    def insert(self, key, bounds):
+        """ add key with bounding box (x0, y0, x1, y1), or move it there if it's already in the index """
+        if key in self._bounds:
+            self.update(key, bounds)
+            return
+        bounds = (min(bounds[0], bounds[2]), min(bounds[1], bounds[3]),
+                  max(bounds[0], bounds[2]), max(bounds[1], bounds[3]))
+        cell_range = self._cell_range(bounds)
+        self._bounds[key] = bounds
+        self._key_cells[key] = cell_range
+        for cell in self._cells_in(cell_range):
+            self._cells.setdefault(cell, set()).add(key)
+
+    def remove(self, key):
+        """ forget key (it's not an error if it's not in the index) """
+        if key not in self._bounds:
+            return
+        for cell in self._cells_in(self._key_cells[key]):
+            bucket = self._cells.get(cell)
+            if bucket is not None:
+                bucket.discard(key)
+                if not bucket:
+                    del self._cells[cell]
+        del self._bounds[key]
+        del self._key_cells[key]
+
+    def update(self, key, bounds):
+        """ key has a new bounding box.  If it's still in the same cells, we only need to remember the new box """
+        if key not in self._bounds:
+            self.insert(key, bounds)
+            return
+        bounds = (min(bounds[0], bounds[2]), min(bounds[1], bounds[3]),
+                  max(bounds[0], bounds[2]), max(bounds[1], bounds[3]))
+        if self._cell_range(bounds) == self._key_cells[key]:
+            self._bounds[key] = bounds
+        else:
+            self.remove(key)
+            self.insert(key, bounds)
+
+    def translate(self, key, dx, dy):
+        """ move key's bounding box by dx, dy """
+        bounds = self._bounds.get(key)
+        if bounds is not None:
+            (x0, y0, x1, y1) = bounds
+            self.update(key, (x0 + dx, y0 + dy, x1 + dx, y1 + dy))
+
+    def _candidates(self, area):
+        keys = set()
+        for cell in self._cells_in(self._cell_range(area)):
+            bucket = self._cells.get(cell)
+            if bucket:
+                keys.update(bucket)
+        return keys
+
+    def query_rect(self, area, enclosed=False):
+        """
+        return the keys whose bounding box overlaps area (x0, y0, x1, y1), or with enclosed=True, only the keys
+        whose bounding box is entirely inside area
+        """
+        (ax0, ay0, ax1, ay1) = (min(area[0], area[2]), min(area[1], area[3]),
+                                max(area[0], area[2]), max(area[1], area[3]))
+        found = []
+        for key in self._candidates((ax0, ay0, ax1, ay1)):
+            (x0, y0, x1, y1) = self._bounds[key]
+            if enclosed:
+                if x0 >= ax0 and y0 >= ay0 and x1 <= ax1 and y1 <= ay1:
+                    found.append(key)
+            elif x0 <= ax1 and x1 >= ax0 and y0 <= ay1 and y1 >= ay0:
+                found.append(key)
+        return found
+
+    def query_point(self, x, y):
+        """ return the keys whose bounding box contains the point x, y """
+        return self.query_rect((x, y, x, y))
+
+    def distance(self, key, x, y):
+        """ distance from the point x, y to key's bounding box (0 if the point is inside it) """
+        (x0, y0, x1, y1) = self._bounds[key]
+        dx = max(x0 - x, 0, x - x1)
+        dy = max(y0 - y, 0, y - y1)
+        return math.hypot(dx, dy)
+
+    def query_radius(self, x, y, radius):
+        """ return the keys whose bounding box is within radius of the point x, y, nearest first """
+        found = []
+        for key in self._candidates((x - radius, y - radius, x + radius, y + radius)):
+            d = self.distance(key, x, y)
+            if d <= radius:
+                found.append((d, key))
+        found.sort(key=lambda pair: pair[0])
+        return [key for (d, key) in found]
+
+    def nearest(self, x, y, radius, accept=None):
+        """
+        return the key nearest to the point x, y within radius (or None).  If given, accept(key) can reject keys
+        we're not interested in.
+        """
+        best = None
+        best_distance = None
+        for key in self._candidates((x - radius, y - radius, x + radius, y + radius)):
+            d = self.distance(key, x, y)
+            if d > radius or (best_distance is not None and d >= best_distance):
+                continue
+            if accept is not None and not accept(key):
+                continue
+            best = key
+            best_distance = d
+        return best
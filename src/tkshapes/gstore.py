@@ -0,0 +1,145 @@
+
+from array import array
+
+from . import ggeometry
+
+
+class GCoordStore:
+    """
+    The model coordinates of every GItem on a GCanvas, kept in one contiguous array of doubles
+
+    Each GItem is given a slot when it's created, which is where its coordinates (x0, y0, x1, y1, ...) live in
+    the buffer.  Moving many GItems is then one pass over the buffer (vectorized when NumPy is installed, see
+    ggeometry), rather than a new list per GItem, and the GCanvas sends the slots that have changed to Tk in one
+    go.  See GCanvas.move_gobjects() and GCanvas.sync_coords()
+    """
+
+    def __init__(self):
+        self.coords = array('d')
+
+        # where each slot's coordinates start in coords, and how many there are
+        self._start = array('q')
+        self._length = array('q')
+
+        # the GItem each slot belongs to (None for a slot that has been freed), and the freed slots to re-use
+        self.items = []
+        self._free = []
+
+        # coordinates left behind in the buffer by slots that have changed size or been freed.  See set() and free()
+        self._unused = 0
+
+        # the slots whose canvas items need their coords sent to Tk
+        self.dirty = set()
+
+    def __len__(self):
+        """ the number of slots in use """
+        return len(self.items) - len(self._free)
+
+    def allocate(self, item, coords=()):
+        """ give item a slot (with coords), re-using a freed one if there is one, and return it """
+        if self._free:
+            slot = self._free.pop()
+            self.items[slot] = item
+            self._start[slot] = len(self.coords)
+            self._length[slot] = len(coords)
+        else:
+            slot = len(self.items)
+            self.items.append(item)
+            self._start.append(len(self.coords))
+            self._length.append(len(coords))
+        self.coords.extend(coords)
+        return slot
+
+    def free(self, slot):
+        """ give back slot, whose GItem has been deleted, so allocate() can re-use it """
+        if self.items[slot] is None:
+            return
+        self.items[slot] = None
+        self._free.append(slot)
+        self.dirty.discard(slot)
+        self._unused += self._length[slot]
+        self._length[slot] = 0
+        if self._unused > len(self.coords) // 2:
+            self.compact()
+
+    def get(self, slot):
+        start = self._start[slot]
+        return self.coords[start:start + self._length[slot]].tolist()
+
+    def set(self, slot, coords):
+        n = len(coords)
+        if n == self._length[slot]:
+            start = self._start[slot]
+            self.coords[start:start + n] = array('d', coords)
+            return
+        # a different number of coordinates won't fit in place, so move the slot to the end of the buffer
+        self._unused += self._length[slot]
+        self._start[slot] = len(self.coords)
+        self._length[slot] = n
+        self.coords.extend(coords)
+        if self._unused > len(self.coords) // 2:
+            self.compact()
+
+    def compact(self):
+        """ close up the gaps left by slots that have moved or been freed """
+        coords = array('d')
+        for slot in range(len(self.items)):
+            start = self._start[slot]
+            self._start[slot] = len(coords)
+            coords.extend(self.coords[start:start + self._length[slot]])
+        self.coords = coords
+        self._unused = 0
+
+    def _indices(self, slots):
+        """ the positions in the buffer of the coordinates of slots, as NumPy arrays (x positions, y positions) """
+        numpy = ggeometry.numpy
+        slots = numpy.asarray(slots, dtype=numpy.int64)
+        starts = numpy.frombuffer(self._start, dtype=numpy.int64)[slots]
+        lengths = numpy.frombuffer(self._length, dtype=numpy.int64)[slots]
+        # number every coordinate in the slots, then shift each slot's numbers to where the slot starts
+        offsets = numpy.cumsum(lengths) - lengths
+        indices = numpy.arange(lengths.sum()) + numpy.repeat(starts - offsets, lengths)
+        return indices[0::2], indices[1::2]
+
+    def _size(self, slots):
+        return sum(self._length[slot] for slot in slots)
+
+    def translate(self, slots, dx, dy):
+        """ move the coordinates of slots by dx, dy """
+        slots = list(slots)
+        c = self.coords
+        if ggeometry.use_numpy(self._size(slots)):
+            (xs, ys) = self._indices(slots)
+            buffer = ggeometry.numpy.frombuffer(c, dtype=float)
+            buffer[xs] += dx
+            buffer[ys] += dy
+            # let go of the buffer, so the array can grow again
+            del buffer
+            return
+        for slot in slots:
+            start = self._start[slot]
+            for i in range(start, start + self._length[slot], 2):
+                c[i] += dx
+                c[i + 1] += dy
+
+    def bounds(self, slots):
+        """ the bounding box (x0, y0, x1, y1) of the coordinates of slots, or None if they don't have any """
+        slots = list(slots)
+        if not self._size(slots):
+            return None
+        c = self.coords
+        if ggeometry.use_numpy(self._size(slots)):
+            (xs, ys) = self._indices(slots)
+            buffer = ggeometry.numpy.frombuffer(c, dtype=float)
+            bounds = (float(buffer[xs].min()), float(buffer[ys].min()),
+                      float(buffer[xs].max()), float(buffer[ys].max()))
+            del buffer
+            return bounds
+        xs = []
+        ys = []
+        for slot in slots:
+            start = self._start[slot]
+            end = start + self._length[slot]
+            xs.extend(c[start:end:2])
+            ys.extend(c[start + 1:end:2])
+        return min(xs), min(ys), max(xs), max(ys)
@@ -0,0 +1,61 @@
+
+import re
+
+# Characters that mean something to the Tcl parser, and need a backslash in front of them in a Tcl word
+_TCL_SPECIAL = re.compile(r'([\\\[\]{}"$; \t])')
+
+
+def tcl_quote(value):
+    """
+    return value as a single Tcl word, so it can be pasted into a generated Tcl script.  A tuple or list (e.g. a
+    dash pattern, dash=(4, 2)) becomes a Tcl list, as tkinter would make it
+    """
+    if isinstance(value, (tuple, list)):
+        return tcl_list(value)
+    if isinstance(value, float):
+        s = repr(value)
+    else:
+        s = str(value)
+    if not s:
+        return '{}'
+    s = _TCL_SPECIAL.sub(r'\\\1', s)
+    return s.replace('\n', '\\n').replace('\r', '\\r')
+
+
+def tcl_list(values):
+    """ return values as a Tcl list, quoted as a single Tcl word """
+    return tcl_quote(' '.join(tcl_quote(v) for v in values))
+
+
+def create_command(widget, item_type, coords, tags=(), options=None):
+    """ a Tcl command that creates a canvas item, like canvas.create_<item_type>(coords, tags=tags, **options) """
+    words = [widget, 'create', item_type]
+    words.extend(tcl_quote(v) for v in coords)
+    words.extend(('-tags', tcl_list(tags)))
+    if options:
+        for option, value in options.items():
+            words.extend(('-' + option, tcl_quote(value)))
+    return ' '.join(words)
+
+
+def coords_command(widget, item, coords):
+    """ a Tcl command that moves a canvas item to coords, like canvas.coords(item, coords) """
+    return ' '.join([widget, 'coords', tcl_quote(item)] + [tcl_quote(v) for v in coords])
+
+
+def bind_command(widget, tag, sequence, script):
+    """ a Tcl command that binds script to sequence on the canvas items tagged with tag """
+    return ' '.join((widget, 'bind', tcl_quote(tag), tcl_quote(sequence), tcl_quote(script)))
+
+
+def build_script(create_commands, other_commands=()):
+    """
+    Wrap the commands up into one Tcl script that runs them all, and evaluates to the list of item IDs returned
+    by the create commands (in order)
+    """
+    lines = ['apply {{} {', 'set ids {}']
+    lines.extend('lappend ids [' + command + ']' for command in create_commands)
+    lines.extend(other_commands)
+    lines.append('return $ids')
+    lines.append('}}')
+    return '\n'.join(lines)
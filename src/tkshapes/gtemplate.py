@@ -0,0 +1,113 @@
+
+from .ggeometry import transform
+from .gitem import GHorzLineItem, GVertLineItem, GOvalItem, GPolygonItem
+from .gnode import GNode
+
+
+# Styles shared by most shapes:  the GItem properties to set, in the order they are set
+
+# the short lines that connect a shape to its node dots
+LINE_STYLE = {
+    'hidden': False,
+    'draggable': False,
+}
+
+# the dots that wires connect to
+NODE_STYLE = {
+    'fill_color': 'white',
+    'outline_color': 'blue',
+    'active_outline_color': 'orange',
+    'outline_width': 2.0,
+    'active_outline_width': 5.0,
+    'hidden': False,
+    'draggable': False,
+    'show_selection': False,
+}
+
+# the body of a shape, which is what gets clicked and dragged
+BODY_STYLE = {
+    'fill_color': 'white',
+    'outline_color': 'blue',
+    'active_outline_color': 'orange',
+    'outline_width': 2.0,
+    'active_outline_width': 5.0,
+    'hidden': False,
+    'draggable': True,
+    'show_selection': True,
+}
+
+
+class GTemplate:
+    """
+    A shape described once:  the GItems that draw it (in drawing order) with their geometry relative to the
+    GObject's initial x, y, the properties (style) to give each of them, and the GNodes they make.
+
+    Polygon points may be given as a function, which is called the first time the template is stamped, and the
+    result kept, so the trigonometry for a shape is done once per class rather than once per instance.
+    """
+
+    def __init__(self, name):
+        self.name = name
+
+        # (item name, kind, geometry, style, extra options for the GItem), in drawing order
+        self._items = []
+
+        # (node name, item name, node label)
+        self._nodes = []
+
+        # polygon points worked out from the item geometry, keyed by item name.  See geometry
+        self._geometry = None
+
+    def polygon(self, name, points, style, **kwargs):
+        self._items.append((name, 'polygon', points, style, kwargs))
+
+    def oval(self, name, x, y, width, height, style):
+        self._items.append((name, 'oval', (x, y, width, height), style, {}))
+
+    def hline(self, name, x, y, length, style=LINE_STYLE):
+        self._items.append((name, 'hline', (x, y, length), style, {}))
+
+    def vline(self, name, x, y, length, style=LINE_STYLE):
+        self._items.append((name, 'vline', (x, y, length), style, {}))
+
+    def node(self, name, item_name, label):
+        self._nodes.append((name, item_name, label))
+
+    @property
+    def geometry(self):
+        """ the points of each polygon relative to 0, 0 -- computed the first time they are asked for """
+        if self._geometry is None:
+            self._geometry = {}
+            for (name, kind, points, style, kwargs) in self._items:
+                if kind == 'polygon':
+                    self._geometry[name] = tuple(points() if callable(points) else points)
+        return self._geometry
+
+    def stamp(self, gobject, scale=1.0):
+        """ create my GItems and GNodes for gobject, translated to its initial x, y and scaled by scale """
+        geometry = self.geometry
+        gcanvas = gobject.gcanvas
+        tag = gobject._tag
+        x = gobject._x
+        y = gobject._y
+
+        for (name, kind, args, style, kwargs) in self._items:
+            if kind == 'polygon':
+                g_item = GPolygonItem(gcanvas, transform(geometry[name], x, y, scale), tag, **kwargs)
+            elif kind == 'oval':
+                (ox, oy, width, height) = args
+                g_item = GOvalItem(gcanvas, x + ox * scale, y + oy * scale, width * scale, height * scale, tag)
+            elif kind == 'hline':
+                (lx, ly, length) = args
+                g_item = GHorzLineItem(gcanvas, x + lx * scale, y + ly * scale, length * scale, tag)
+            else:
+                (lx, ly, length) = args
+                g_item = GVertLineItem(gcanvas, x + lx * scale, y + ly * scale, length * scale, tag)
+
+            gobject._items[name] = g_item
+            g_item.add()
+            for (prop, value) in style.items():
+                setattr(g_item, prop, value)
+
+        for (node_name, item_name, label) in self._nodes:
+            gobject._nodes[node_name] = GNode(name=label, g_object=gobject, g_item=gobject._items[item_name])
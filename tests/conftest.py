@@ -0,0 +1,34 @@
+import importlib
+import sys
+
+import pytest
+
+import faketk
+
+
+@pytest.fixture
+def tkshapes():
+    """ the tkshapes package, freshly imported on top of faketk (so a GCanvas needs no display) """
+    saved = dict(sys.modules)
+    for name in list(sys.modules):
+        if name == 'tkshapes' or name.startswith('tkshapes.'):
+            del sys.modules[name]
+    sys.modules.update(faketk.modules())
+    try:
+        yield importlib.import_module('tkshapes')
+    finally:
+        for name in list(sys.modules):
+            if name not in saved:
+                del sys.modules[name]
+        sys.modules.update(saved)
+
+
+@pytest.fixture
+def make_gcanvas(tkshapes):
+    """ make_gcanvas(**options) makes a GCanvas (with the built-in GObject types) on a faketk Canvas """
+    def make_gcanvas(**options):
+        gcanvas = tkshapes.GCanvas(None, **options)
+        gcanvas.register_builtins()
+        return gcanvas
+    return make_gcanvas
+
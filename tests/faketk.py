@@ -0,0 +1,462 @@
+"""
+Just enough of tkinter for a GCanvas to run without a display:  a Canvas that keeps its items (type, coords, tags,
+options and stacking order) in Python, and runs the Tcl scripts tkshapes generates (see gtcl.py) in a real Tcl
+interpreter whose widget command calls back into it.  See the make_gcanvas fixture in conftest.py
+"""
+import collections
+import re
+import types
+import tkinter
+
+# The modifiers fire() drops to find a less specific binding (Tk picks the most specific one on each tag)
+MODIFIERS = ("Command", "Control", "Shift", "Alt", "Option", "Meta")
+
+
+def flatten(args):
+    flat = []
+    for arg in args:
+        if isinstance(arg, (list, tuple)):
+            flat.extend(flatten(arg))
+        else:
+            flat.append(float(arg))
+    return flat
+
+
+def event(widget=None, **kwargs):
+    fields = dict(x=0, y=0, delta=0, num=1, state=0, widget=widget)
+    fields.update(kwargs)
+    return types.SimpleNamespace(**fields)
+
+
+def idle(gcanvas):
+    """ run everything a GCanvas and its Canvas have scheduled with after() / after_idle() """
+    while gcanvas._after or gcanvas.canvas._after:
+        gcanvas.run_after()
+        gcanvas.canvas.run_after()
+
+
+class Widget:
+
+    def __init__(self, parent=None, **kwargs):
+        self._after = {}
+        self._after_id = 0
+        self._bindings = {}
+        self._registered = {}
+        self._w = '.w%d' % id(self)
+        self.generated = []
+
+    def __str__(self):
+        return self._w
+
+    def after(self, ms, func=None, *args):
+        self._after_id += 1
+        after_id = 'after#%d' % self._after_id
+        self._after[after_id] = (func, args)
+        return after_id
+
+    def after_idle(self, func, *args):
+        return self.after(0, func, *args)
+
+    def after_cancel(self, after_id):
+        self._after.pop(after_id, None)
+
+    def run_after(self):
+        """ run the after() callbacks, including the ones they schedule, until there are none left """
+        while self._after:
+            (func, args) = self._after.pop(next(iter(self._after)))
+            func(*args)
+
+    def bind(self, sequence, func=None, add=None):
+        self._bindings.setdefault(sequence, []).append(func)
+
+    def event_generate(self, sequence, **kwargs):
+        self.generated.append(sequence)
+        for func in self._bindings.get(sequence, []):
+            func(event(self))
+
+    def _register(self, func, subst=None, needcleanup=1):
+        name = 'py%d' % id(func)
+        self._registered[name] = func
+        return name
+
+    def grid(self, **kwargs):
+        pass
+
+    def grid_rowconfigure(self, *args, **kwargs):
+        pass
+
+    def grid_columnconfigure(self, *args, **kwargs):
+        pass
+
+    def configure(self, **kwargs):
+        pass
+
+    config = configure
+
+    def set(self, *args):
+        pass
+
+    def winfo_width(self):
+        return 800
+
+    def winfo_height(self):
+        return 600
+
+
+class Item:
+
+    def __init__(self, item_id, item_type, coords, options):
+        self.id = item_id
+        self.type = item_type
+        self.coords = coords
+        self.options = dict(options)
+        tags = self.options.pop('tags', self.options.pop('tag', ()))
+        if isinstance(tags, str):
+            tags = tags.split()
+        self.tags = list(dict.fromkeys(tags))
+
+
+class Tk:
+    """ the canvas' tk (Tcl interpreter) """
+
+    def __init__(self, canvas):
+        self.canvas = canvas
+
+    def eval(self, script):
+        self.canvas.calls['eval'] += 1
+        return self.canvas.run_script(script)
+
+    def call(self, *args):
+        return ''
+
+    @staticmethod
+    def splitlist(s):
+        return tuple(s.split()) if isinstance(s, str) else tuple(s)
+
+
+class Canvas(Widget):
+
+    _subst_format_str = '%# %b %x %y'
+
+    def __init__(self, parent=None, **kwargs):
+        super().__init__(parent, **kwargs)
+        self.items = collections.OrderedDict()
+        self.next_id = 1
+        self.tag_bindings = collections.defaultdict(dict)
+        self.current = None
+        self.xoff = 0.0
+        self.yoff = 0.0
+        self.scrollregion = (0, 0, 1, 1)
+        self.scroll_commands = []
+        self.calls = collections.Counter()
+        self.tk = Tk(self)
+
+    # Items
+
+    def _create(self, item_type, args, kwargs):
+        self.calls['create'] += 1
+        item_id = self.next_id
+        self.next_id += 1
+        self.items[item_id] = Item(item_id, item_type, flatten(args), kwargs)
+        return item_id
+
+    def create_line(self, *args, **kwargs):
+        return self._create('line', args, kwargs)
+
+    def create_rectangle(self, *args, **kwargs):
+        return self._create('rectangle', args, kwargs)
+
+    def create_oval(self, *args, **kwargs):
+        return self._create('oval', args, kwargs)
+
+    def create_polygon(self, *args, **kwargs):
+        return self._create('polygon', args, kwargs)
+
+    def create_text(self, *args, **kwargs):
+        return self._create('text', args, kwargs)
+
+    def match(self, tag_or_id):
+        """ the items a tag, item ID or tag search expression refers to, in stacking order """
+        if isinstance(tag_or_id, (tuple, list)):
+            if not tag_or_id:
+                return []
+            tag_or_id = tag_or_id[0]
+        if isinstance(tag_or_id, int) or (isinstance(tag_or_id, str) and tag_or_id.isdigit()):
+            item = self.items.get(int(tag_or_id))
+            return [item] if item else []
+        if tag_or_id == 'all':
+            return list(self.items.values())
+        if tag_or_id == 'current':
+            item = self.items.get(self.current)
+            return [item] if item else []
+        if re.search(r'&&|\|\||!|\(', tag_or_id):
+            return [item for item in self.items.values() if self._expression(tag_or_id, item.tags)]
+        return [item for item in self.items.values() if tag_or_id in item.tags]
+
+    @staticmethod
+    def _expression(expression, tags):
+        python = expression.replace('&&', ' and ').replace('||', ' or ').replace('!', ' not ')
+        python = re.sub(r'[^\s()]+', lambda m: m.group(0) if m.group(0) in ('and', 'or', 'not')
+                        else repr(m.group(0) in tags), python)
+        return eval(python)
+
+    @staticmethod
+    def _bbox(item):
+        if not item.coords:
+            return None
+        (xs, ys) = (item.coords[0::2], item.coords[1::2])
+        return (min(xs), min(ys), max(xs), max(ys))
+
+    def find_withtag(self, tag_or_id):
+        self.calls['find_withtag'] += 1
+        return tuple(item.id for item in self.match(tag_or_id))
+
+    def find_closest(self, x, y, *args):
+        best = None
+        for item in self.items.values():
+            box = self._bbox(item)
+            if box and item.options.get('state') != 'hidden':
+                distance = max(box[0] - x, 0, x - box[2]) ** 2 + max(box[1] - y, 0, y - box[3]) ** 2
+                if best is None or distance <= best[0]:
+                    best = (distance, item.id)
+        return (best[1],) if best else ()
+
+    def bbox(self, *tags):
+        self.calls['bbox'] += 1
+        boxes = [self._bbox(item) for tag in tags for item in self.match(tag)]
+        boxes = [box for box in boxes if box]
+        if not boxes:
+            return None
+        return (int(min(b[0] for b in boxes)), int(min(b[1] for b in boxes)),
+                int(max(b[2] for b in boxes)) + 1, int(max(b[3] for b in boxes)) + 1)
+
+    def type(self, tag_or_id):
+        items = self.match(tag_or_id)
+        return items[0].type if items else None
+
+    def gettags(self, tag_or_id):
+        items = self.match(tag_or_id)
+        return tuple(items[0].tags) if items else ()
+
+    def itemconfigure(self, tag_or_id, **kwargs):
+        self.calls['itemconfigure'] += 1
+        for item in self.match(tag_or_id):
+            if 'tags' in kwargs:
+                tags = kwargs['tags']
+                item.tags = list(dict.fromkeys(tags.split() if isinstance(tags, str) else tags))
+            item.options.update((k, v) for (k, v) in kwargs.items() if k != 'tags')
+
+    itemconfig = itemconfigure
+
+    def itemcget(self, tag_or_id, option):
+        items = self.match(tag_or_id)
+        return items[0].options.get(option, '') if items else ''
+
+    def coords(self, tag_or_id, *args):
+        self.calls['coords'] += 1
+        items = self.match(tag_or_id)
+        if args:
+            for item in items:
+                item.coords = flatten(args)
+            return None
+        return list(items[0].coords) if items else []
+
+    def move(self, tag_or_id, dx, dy):
+        self.calls['move'] += 1
+        for item in self.match(tag_or_id):
+            item.coords = [v + (dy if i % 2 else dx) for (i, v) in enumerate(item.coords)]
+
+    def scale(self, tag_or_id, x0, y0, sx, sy):
+        for item in self.match(tag_or_id):
+            item.coords = [y0 + (v - y0) * sy if i % 2 else x0 + (v - x0) * sx for (i, v) in enumerate(item.coords)]
+
+    def delete(self, *tags):
+        self.calls['delete'] += 1
+        for tag in tags:
+            for item in self.match(tag):
+                del self.items[item.id]
+
+    def addtag_withtag(self, new_tag, tag_or_id):
+        for item in self.match(tag_or_id):
+            if new_tag not in item.tags:
+                item.tags.append(new_tag)
+
+    def dtag(self, tag_or_id, old_tag=None):
+        for item in self.match(tag_or_id):
+            if old_tag in item.tags:
+                item.tags.remove(old_tag)
+
+    def _restack(self, tag_or_id, reference, above):
+        self.calls['restack'] += 1
+        moving = [item.id for item in self.match(tag_or_id)]
+        if reference is not None:
+            references = self.match(reference)
+            if not references:
+                return
+            reference = (references[-1] if above else references[0]).id
+            if reference in moving:
+                return
+        for item_id in moving:
+            self.items.move_to_end(item_id)
+        rest = [item_id for item_id in self.items if item_id not in moving]
+        if reference is None:
+            order = rest + moving if above else moving + rest
+        else:
+            position = rest.index(reference) + (1 if above else 0)
+            order = rest[:position] + moving + rest[position:]
+        self.items = collections.OrderedDict((item_id, self.items[item_id]) for item_id in order)
+
+    def tag_raise(self, tag_or_id, above=None):
+        self._restack(tag_or_id, above, True)
+
+    lift = tag_raise
+
+    def tag_lower(self, tag_or_id, below=None):
+        self._restack(tag_or_id, below, False)
+
+    def stacking_order(self):
+        return list(self.items)
+
+    # Bindings
+
+    def tag_bind(self, tag, sequence, func=None, add=None):
+        self.calls['tag_bind'] += 1
+        self.tag_bindings[tag][sequence] = func
+
+    def tag_unbind(self, tag, sequence, funcid=None):
+        self.tag_bindings[tag].pop(sequence, None)
+
+    def fire(self, sequence, item_id=None, **kwargs):
+        """
+        deliver the event sequence to the tag bindings of item_id (or of the current item), the way Tk does:  on
+        each of the item's tags, and then on "all", only the most specific binding that matches runs
+        """
+        if item_id is not None:
+            self.current = item_id
+        the_event = event(self, **kwargs)
+        fields = sequence.strip('<>').split('-')
+        candidates = [sequence]
+        while len(fields) > 1 and fields[0] in MODIFIERS:
+            fields.pop(0)
+            candidates.append('<' + '-'.join(fields) + '>')
+        for tag in self.items[self.current].tags + ['all']:
+            bindings = self.tag_bindings.get(tag, {})
+            for candidate in candidates:
+                if candidate in bindings:
+                    func = bindings[candidate]
+                    if isinstance(func, str):
+                        # bound by a Tcl script (see GCanvas.create_many()), which calls a registered command with
+                        # some arguments and then the event fields, which _substitute() turns into the event
+                        words = tkinter.Tcl().splitlist(re.search(r'\[([^\]]*)\]', func).group(1))
+                        self._event = the_event
+                        self._registered[words[0]](*words[1:])
+                    else:
+                        func(the_event)
+                    break
+
+    def _substitute(self, *fields):
+        return self._event
+
+    # Scrolling
+
+    def canvasx(self, x, *args):
+        return float(x) + self.xoff
+
+    def canvasy(self, y, *args):
+        return float(y) + self.yoff
+
+    def xview(self, *args):
+        width = self.scrollregion[2] - self.scrollregion[0]
+        return ((self.xoff - self.scrollregion[0]) / width, (self.xoff + 800 - self.scrollregion[0]) / width)
+
+    def yview(self, *args):
+        height = self.scrollregion[3] - self.scrollregion[1]
+        return ((self.yoff - self.scrollregion[1]) / height, (self.yoff + 600 - self.scrollregion[1]) / height)
+
+    def xview_moveto(self, fraction):
+        self.xoff = self.scrollregion[0] + fraction * (self.scrollregion[2] - self.scrollregion[0])
+        self._scrolled()
+
+    def yview_moveto(self, fraction):
+        self.yoff = self.scrollregion[1] + fraction * (self.scrollregion[3] - self.scrollregion[1])
+        self._scrolled()
+
+    def xview_scroll(self, number, what):
+        self.xoff += number
+        self._scrolled()
+
+    def yview_scroll(self, number, what):
+        self.yoff += number
+        self._scrolled()
+
+    def scan_mark(self, x, y):
+        self._mark = (x, y)
+
+    def scan_dragto(self, x, y, gain=1):
+        self.xoff -= x - self._mark[0]
+        self.yoff -= y - self._mark[1]
+        self._scrolled()
+
+    def _scrolled(self):
+        for command in self.scroll_commands:
+            command('0', '1')
+
+    def configure(self, **kwargs):
+        if kwargs.get('scrollregion'):
+            self.scrollregion = tuple(float(v) for v in kwargs['scrollregion'])
+        for option in ('xscrollcommand', 'yscrollcommand'):
+            if option in kwargs:
+                self.scroll_commands.append(kwargs[option])
+
+    config = configure
+
+    # Tcl
+
+    def run_script(self, script):
+        """ run a Tcl script, with the canvas' widget command handled by this Canvas """
+        tcl = tkinter.Tcl()
+
+        def widget(*args):
+            if args[0] == 'create':
+                self.calls['script_create'] += 1
+                rest = list(args[2:])
+                coords = []
+                while rest and not (rest[0].startswith('-') and not rest[0][1:2].isdigit()):
+                    coords.append(float(rest.pop(0)))
+                options = {}
+                while rest:
+                    (option, value) = (rest.pop(0)[1:], rest.pop(0))
+                    options[option] = tcl.splitlist(value) if option == 'tags' else value
+                return str(self._create(args[1], coords, options))
+            if args[0] == 'coords':
+                self.calls['script_coords'] += 1
+                self.items[int(args[1])].coords = [float(v) for v in args[2:]]
+                return ''
+            if args[0] == 'bind':
+                self.calls['script_bind'] += 1
+                self.tag_bindings[args[1]][args[2]] = args[3]
+                return ''
+            raise NotImplementedError(args)
+
+        tcl.createcommand(self._w, widget)
+        return tcl.eval(script)
+
+
+class Frame(Widget):
+    pass
+
+
+class Scrollbar(Widget):
+    pass
+
+
+def modules():
+    """ tkinter and tkinter.ttk modules with Frame, Canvas and Scrollbar replaced by the fakes """
+    fake_tkinter = types.ModuleType('tkinter')
+    fake_tkinter.__dict__.update((k, v) for (k, v) in vars(tkinter).items() if not k.startswith('__'))
+    fake_tkinter.Frame = Frame
+    fake_tkinter.Canvas = Canvas
+    fake_ttk = types.ModuleType('tkinter.ttk')
+    fake_ttk.Scrollbar = Scrollbar
+    fake_tkinter.ttk = fake_ttk
+    return {'tkinter': fake_tkinter, 'tkinter.ttk': fake_ttk}
@@ -0,0 +1,110 @@
+import asyncio
+
+import pytest
+from tkshapes import gasync
+from tkshapes.gdispatch import GDispatcher
+from tkshapes.gevent import GEvent, GEventType, ClickableClickedData, AddConnectionData
+
+
+# A GDispatcher has the subscribe() / unsubscribe() of a GCanvas, which is all that gasync needs
+
+class Gate:
+    def __init__(self, tag):
+        self._tag = tag
+
+def test_events():
+    d = GDispatcher()
+
+    async def main():
+        received = []
+
+        async def consume():
+            async for event in gasync.events(d, GEventType.CLICKABLE_CLICKED):
+                received.append(event.event_data.g_object)
+                if len(received) == 2:
+                    break
+
+        task = asyncio.ensure_future(consume())
+        await asyncio.sleep(0)
+        for tag in ('G:1', 'G:2'):
+            d.dispatch(GEvent(GEventType.CLICKABLE_CLICKED, ClickableClickedData(g_object=tag)))
+        await task
+        return received
+
+    assert asyncio.run(main()) == ['G:1', 'G:2']
+    # the subscriptions go away with the iterator
+    assert len(d) == 0
+
+def test_events_before_iterating():
+    d = GDispatcher()
+
+    async def main():
+        # the GEvents posted between events() and the first __anext__() are kept
+        events = gasync.events(d, GEventType.CLICKABLE_CLICKED)
+        d.dispatch(GEvent(GEventType.CLICKABLE_CLICKED, ClickableClickedData(g_object='G:1')))
+        event = await events.__anext__()
+        await events.aclose()
+        return event.event_data.g_object
+
+    assert asyncio.run(main()) == 'G:1'
+    assert len(d) == 0
+
+    # and an iterator that is never used doesn't stay subscribed
+    events = gasync.events(d)
+    assert len(d) == len(GEventType.ALL)
+    del events
+    assert len(d) == 0
+
+def test_wait_for_connection():
+    d = GDispatcher()
+    (a, b, c) = (Gate('G:1'), Gate('G:2'), Gate('G:3'))
+
+    async def main():
+        waiter = asyncio.ensure_future(gasync.wait_for_connection(d, c, timeout=5))
+        await asyncio.sleep(0)
+        d.dispatch(GEvent(GEventType.ADD_CONNECTION, AddConnectionData(from_g_object=a, to_g_object=b)))
+        d.dispatch(GEvent(GEventType.ADD_CONNECTION, AddConnectionData(from_g_object=a, to_g_object=c)))
+        return await waiter
+
+    event = asyncio.run(main())
+    assert event.event_data.to_g_object is c
+    assert len(d) == 0
+
+def test_wait_for_timeout():
+    d = GDispatcher()
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(gasync.wait_for_click(d, timeout=0.01))
+    assert len(d) == 0
+
+class Widget:
+    """ just enough of a Tk widget for run_asyncio() """
+    def __init__(self):
+        self.after_calls = []
+
+    def after(self, ms, function):
+        self.after_calls.append(function)
+        return len(self.after_calls)
+
+    def after_cancel(self, pending):
+        self.after_calls[pending - 1] = None
+
+def test_run_asyncio():
+    loop = asyncio.new_event_loop()
+    try:
+        widget = Widget()
+        ran = []
+        stop = gasync.run_asyncio(widget, loop)
+        loop.call_soon(ran.append, 1)
+        widget.after_calls[-1]()
+        assert ran == [1] and len(widget.after_calls) == 2
+        stop()
+        assert widget.after_calls[-1] is None
+    finally:
+        loop.close()
+
+def test_run_asyncio_refuses_a_running_loop():
+    async def main():
+        with pytest.raises(RuntimeError, match='run_tk'):
+            gasync.run_asyncio(Widget(), asyncio.get_running_loop())
+
+    asyncio.run(main())
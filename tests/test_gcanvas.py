@@ -0,0 +1,582 @@
+import pytest
+
+from faketk import event, idle
+
+
+def record_mouse_handlers(tkshapes, monkeypatch):
+    """ replace the GObject mouse handlers with ones that only record (GObject label, handler name) """
+    calls = []
+    for (suffix, sequence, method) in tkshapes.GObject.mouse_binding_table:
+        monkeypatch.setattr(tkshapes.GObject, method,
+                            lambda self, event, method=method: calls.append((self.label, method)))
+    return calls
+
+def test_dispatch_mode_runs_the_same_handlers(tkshapes, make_gcanvas, monkeypatch):
+    calls = record_mouse_handlers(tkshapes, monkeypatch)
+    handled = {}
+    for dispatch in (False, True):
+        gcanvas = make_gcanvas(dispatch=dispatch)
+        gate = gcanvas.create('GAndGate', 100, 100, label='gate')
+        switch = gcanvas.create('GToggleSwitch', 300, 100, label='switch')
+        gate.add_mouse_bindings()
+        switch.add_mouse_bindings()
+        idle(gcanvas)
+        handled[dispatch] = []
+        for g_item in (gate._items['body'], gate._items['output_dot'], switch._items['slider_switch']):
+            for sequence in ('<Enter>', '<ButtonPress-1>', '<B1-Motion>', '<ButtonRelease-1>',
+                             '<Command-ButtonPress-1>', '<ButtonPress-2>', '<Leave>'):
+                gcanvas.canvas.fire(sequence, g_item.item)
+                handled[dispatch].append((sequence, sorted(calls)))
+                del calls[:]
+    assert handled[True] == handled[False]
+
+    # the gate's body is draggable but not clickable, and a Command-click on the switch still clicks it
+    assert ('<ButtonPress-1>', [('gate', 'on_button_press')]) in handled[True]
+    assert ('<Command-ButtonPress-1>', [('switch', 'on_button_click')]) in handled[True]
+
+def test_events_go_to_subscribers_and_the_queue(tkshapes, make_gcanvas):
+    gcanvas = make_gcanvas()
+    (a, b) = (gcanvas.create('GAndGate', 100, 100), gcanvas.create('GAndGate', 300, 100))
+    received = []
+    gcanvas.subscribe(tkshapes.GEventType.CLICKABLE_CLICKED, received.append, tag=a._tag)
+
+    def click(g_object):
+        data = tkshapes.gevent.ClickableClickedData(canvas_item=None, g_item=None, g_object=g_object)
+        gcanvas.post_event(tkshapes.GEvent(tkshapes.GEventType.CLICKABLE_CLICKED, data))
+
+    click(a)
+    click(b)
+    idle(gcanvas)
+    assert [g_event.event_data.g_object for g_event in received] == [a]
+    assert [g_event.event_data.g_object for g_event in gcanvas.event_queue.drain_all()] == [a, b]
+    assert gcanvas.canvas.generated == ['<<ClickableClicked>>']
+
+    # an exclusive subscription takes the GEvents it gets
+    gcanvas.subscribe(tkshapes.GEventType.CLICKABLE_CLICKED, received.append, tag=b._tag, exclusive=True)
+    click(a)
+    click(b)
+    idle(gcanvas)
+    assert [g_event.event_data.g_object for g_event in received] == [a, a, b]
+    assert [g_event.event_data.g_object for g_event in gcanvas.event_queue.drain_all()] == [a]
+    assert gcanvas.canvas.generated == ['<<ClickableClicked>>'] * 2
+
+def test_culling(make_gcanvas):
+    gcanvas = make_gcanvas(virtualized=True)
+    canvas = gcanvas.canvas
+    # the view starts at 5000, 5000 (800 x 600), and GObjects within cull_margin (500) of it are drawn
+    left = gcanvas.create('GOval', 5100, 5100, 50, 50)
+    middle = gcanvas.create('GOval', 5850, 5100, 50, 50)
+    right = gcanvas.create('GOval', 7700, 5100, 50, 50)
+    idle(gcanvas)
+    assert gcanvas.materialized_gobjects == {left, middle}
+    assert not right.materialized and right._items['GOval'].item is None
+
+    # scroll right, so left is more than twice cull_margin out of view (and deleted from the canvas), middle is
+    # between the two margins (and stays), and right comes into view
+    canvas.xview_scroll(1500, 'units')
+    idle(gcanvas)
+    assert gcanvas.materialized_gobjects == {middle, right}
+    assert not left.materialized and left._items['GOval'].item is None
+    assert right._items['GOval'].item in canvas.items
+
+def test_delete_frees_the_coord_store_slot(make_gcanvas):
+    gcanvas = make_gcanvas()
+    store = gcanvas.coord_store
+    g_item = gcanvas.create('GOval', 100, 100, 50, 50)._items['GOval']
+    (slot, item) = (g_item.slot, g_item.item)
+
+    # dematerialize() only deletes the canvas item
+    g_item.dematerialize()
+    assert item not in gcanvas.canvas.items and item not in gcanvas.item_index
+    assert store.items[slot] is g_item
+    g_item.materialize()
+
+    g_item.delete()
+    assert g_item.item is None and g_item.slot is None
+    assert store.items[slot] is None
+    assert gcanvas.create('GOval', 100, 100, 50, 50)._items['GOval'].slot == slot
+
+def test_event_queue_options(tkshapes, make_gcanvas):
+    gcanvas = make_gcanvas(event_queue_maxsize=2, event_queue_policy=tkshapes.gevent.DROP_OLDEST)
+    gobjects = [gcanvas.create('GAndGate', 100 + 200 * i, 100) for i in range(3)]
+    for gobject in gobjects:
+        data = tkshapes.gevent.ClickableClickedData(canvas_item=None, g_item=None, g_object=gobject)
+        gcanvas.post_event(tkshapes.GEvent(tkshapes.GEventType.CLICKABLE_CLICKED, data))
+    assert [g_event.event_data.g_object for g_event in gcanvas.event_queue.drain_all()] == gobjects[1:]
+    assert gcanvas.event_queue.stats['dropped'] == 1
+
+    # by default, the queue grows rather than lose GEvents
+    gcanvas = make_gcanvas(event_queue_maxsize=2)
+    for gobject in gobjects:
+        data = tkshapes.gevent.ClickableClickedData(canvas_item=None, g_item=None, g_object=gobject)
+        gcanvas.post_event(tkshapes.GEvent(tkshapes.GEventType.CLICKABLE_CLICKED, data))
+    assert [g_event.event_data.g_object for g_event in gcanvas.event_queue.drain_all()] == gobjects
+    assert (gcanvas.event_queue.stats['dropped'], gcanvas.event_queue.stats['high_water']) == (0, 3)
+
+    assert make_gcanvas().event_queue.maxsize == 1000
+    with pytest.raises(ValueError):
+        make_gcanvas(event_queue_policy=tkshapes.gevent.BLOCK)
+
+def test_zoom_is_a_view_transform(make_gcanvas):
+    gcanvas = make_gcanvas()
+    canvas = gcanvas.canvas
+    g_item = gcanvas.create('GOval', 5100, 5100, 50, 50)._items['GOval']
+    model_coords = g_item.model_coords
+    for delta in (1, 1, 1):
+        gcanvas.on_zoom(event(canvas, x=100, y=100, delta=delta))
+    zl = gcanvas.zoom_level
+    assert zl == 1.1 ** 3
+
+    # the model stays put, and the canvas items (and their outline widths) are scaled to the zoom level
+    assert g_item.model_coords == model_coords
+    assert canvas.coords(g_item.item) == pytest.approx([c * zl for c in model_coords])
+    assert canvas.items[g_item.item].options['width'] == pytest.approx(float(g_item.options['width']) * zl)
+    assert gcanvas.canvas_to_model(gcanvas.model_to_canvas(model_coords)) == pytest.approx(model_coords)
+
+    # zooming back out gets back to exactly the same scale
+    for delta in (-1, -1, -1):
+        gcanvas.on_zoom(event(canvas, x=100, y=100, delta=delta))
+    assert gcanvas.zoom_level == 1
+    assert canvas.coords(g_item.item) == pytest.approx(model_coords)
+
+def test_item_index(make_gcanvas):
+    gcanvas = make_gcanvas()
+    gate = gcanvas.create('GAndGate', 100, 100)
+    body = gate._items['body']
+
+    # every canvas item of every GItem is indexed, and IDs can be an int, a str, or a tuple from find_withtag()
+    assert all(gcanvas.item_index[g_item.item] == (gate, g_item) for g_item in gate._items.values())
+    for id in (body.item, str(body.item), (body.item,), gcanvas.canvas.find_withtag(body.item)):
+        assert gcanvas.lookup_id(id) == (gate, body)
+    assert gcanvas.get_gobject_by_id(body.item) is gate
+    assert gcanvas.get_item_by_id(body.item) is body
+    assert gate.get_item_by_id(body.item) is body
+    assert gcanvas.lookup_id(()) == (None, None)
+    assert gcanvas.lookup_id(gcanvas._bg_item) == (None, None)
+
+    # the index follows the canvas item when it's deleted and re-created
+    item = body.item
+    body.dematerialize()
+    assert gcanvas.lookup_id(item) == (None, None)
+    body.materialize()
+    assert body.item != item and gcanvas.lookup_id(body.item) == (gate, body)
+
+def test_update_selection(tkshapes, make_gcanvas, monkeypatch):
+    gcanvas = make_gcanvas()
+    (a, b, c) = [gcanvas.create('GAndGate', 5100 + 200 * i, 5100, label=label) for (i, label) in enumerate('abc')]
+    calls = []
+    for method in ('set_selected', 'clear_selected'):
+        original = getattr(tkshapes.GObject, method)
+        monkeypatch.setattr(tkshapes.GObject, method,
+                            lambda self, method=method, original=original: (calls.append((method, self.label)),
+                                                                              original(self)))
+    changed = []
+    gcanvas.subscribe(tkshapes.GEventType.SELECTION_CHANGED, changed.append)
+
+    def labels(gobjects):
+        return sorted(gobject.label for gobject in gobjects)
+
+    gcanvas.update_selection([a, b])
+    gcanvas.update_selection([b, c])
+    # only the GObjects whose selection changes are touched, and each change is announced once
+    assert sorted(calls) == [('clear_selected', 'a'), ('set_selected', 'a'), ('set_selected', 'b'),
+                             ('set_selected', 'c')]
+    assert [(labels(e.event_data.added), labels(e.event_data.removed)) for e in changed] == [
+        (['a', 'b'], []), (['c'], ['a'])]
+    assert labels(changed[-1].event_data.selection) == labels(gcanvas.selection) == ['b', 'c']
+    assert (a._selected, b._selected, c._selected) == (False, True, True)
+
+    del calls[:], changed[:]
+    gcanvas.update_selection([c, b])
+    assert calls == [] and changed == []
+
+    # a selection box around c (the view starts at 5000, 5000)
+    gcanvas.on_button_press(event(gcanvas.canvas, x=450, y=50))
+    gcanvas.on_button_motion(event(gcanvas.canvas, x=600, y=200))
+    gcanvas.on_button_release(event(gcanvas.canvas, x=750, y=300))
+    assert labels(gcanvas.selection) == ['c']
+    assert calls == [('clear_selected', 'b')]
+
+def test_drag_moves_once_per_frame(make_gcanvas):
+    gcanvas = make_gcanvas()
+    canvas = gcanvas.canvas
+    gate = gcanvas.create('GAndGate', 5100, 5100)
+    idle(gcanvas)
+    body = gate._items['body']
+    before = (canvas.coords(body.item), body.model_coords)
+    canvas.current = body.item
+
+    gate.on_button_press(event(canvas, x=10, y=10))
+    for x in range(11, 21):
+        gate.on_button_motion(event(canvas, x=x, y=x))
+    # nothing has moved yet, and there's one frame waiting
+    assert canvas.calls['move'] == 0
+    assert [func.__name__ for (func, args) in gcanvas._after.values()] == ['apply_drag']
+    gcanvas.run_after()
+    assert canvas.calls['move'] == 1
+    assert canvas.coords(body.item) == [c + 10 for c in before[0]]
+    assert body.model_coords == [c + 10 for c in before[1]]
+
+    # the movement still waiting for a frame is applied when the button is released
+    gate.on_button_motion(event(canvas, x=25, y=25))
+    gate.on_button_release(event(canvas, x=25, y=25))
+    assert canvas.calls['move'] == 2 and not gcanvas._after
+    assert canvas.coords(body.item) == [c + 15 for c in before[0]]
+    assert gate.bounds == gcanvas.coord_store.bounds(gate.slots)
+
+def test_drag_updates_each_wire_once_per_frame(tkshapes, make_gcanvas, monkeypatch):
+    gcanvas = make_gcanvas()
+    canvas = gcanvas.canvas
+    (a, b, c) = (gcanvas.create('GAndGate', 5100, 5100 + 100 * i) for i in range(3))
+
+    def wire(node1, node2):
+        g_wire = gcanvas.create('GWire', (0, 0, 10, 10))
+        g_wire.connect(node1, node2)
+        g_wire.update()
+        return g_wire
+
+    # a's output goes to both of b's inputs (so both ends of those wires move with a and b), and b's to c
+    inside = (wire(a.node('output'), b.node('input_1')), wire(a.node('output'), b.node('input_2')))
+    across = wire(b.node('output'), c.node('input_1'))
+    idle(gcanvas)
+
+    calls = []
+    GWire = tkshapes.gobjects.gwire.GWire
+    for name in ('move', 'update'):
+        def record(g_wire, *args, _method=getattr(GWire, name), _name=name):
+            calls.append((g_wire, _name))
+            return _method(g_wire, *args)
+        monkeypatch.setattr(GWire, name, record)
+
+    a.toggle_selected()
+    b.toggle_selected()
+    before = (a.node('output').anchor, c.node('input_1').anchor)
+    canvas.current = a._items['body'].item
+    a.on_button_press(event(canvas, x=10, y=10))
+    for frame in range(3):
+        for x in range(5):
+            a.on_button_motion(event(canvas, x=11 + 5 * frame + x, y=10))
+        gcanvas.run_after()
+    a.on_button_release(event(canvas, x=25, y=10))
+
+    # each frame, the wires inside the selection are just moved, and the one across its edge is re-drawn, once each
+    assert sorted(calls.count((g_wire, 'move')) for g_wire in inside) == [3, 3]
+    assert [calls.count((g_wire, 'update')) for g_wire in inside] == [0, 0]
+    assert (calls.count((across, 'move')), calls.count((across, 'update'))) == (0, 3)
+    assert a.node('output').anchor == pytest.approx((before[0][0] + 15, before[0][1]))
+    assert c.node('input_1').anchor == before[1]
+
+    # and every wire still ends on its nodes' anchors, in model coords and on the canvas
+    for g_wire in inside + (across,):
+        ends = [coord for g_node in g_wire.connection.g_nodes for coord in g_node.anchor]
+        assert g_wire._coords == pytest.approx(ends)
+        for g_item in g_wire._items.values():
+            points = canvas.coords(g_item.item)
+            assert points[:2] + points[-2:] == pytest.approx(gcanvas.model_to_canvas(ends))
+
+def test_node_anchor_follows_its_gobject(make_gcanvas):
+    gcanvas = make_gcanvas()
+    canvas = gcanvas.canvas
+    gate = gcanvas.create('GAndGate', 5100, 5100)
+    idle(gcanvas)
+    g_node = gate.node('output')
+
+    def drawn_anchor():
+        """ the center of the node's canvas item, in model coords """
+        (x0, y0, x1, y1) = gcanvas.canvas_to_model(canvas.coords(g_node.g_item.item))
+        return ((x0 + x1) / 2, (y0 + y1) / 2)
+
+    # reading the anchor doesn't ask the canvas anything
+    queries = canvas.calls['coords'] + canvas.calls['bbox']
+    anchor = g_node.anchor
+    assert canvas.calls['coords'] + canvas.calls['bbox'] == queries
+    assert anchor == pytest.approx(drawn_anchor())
+
+    # zooming doesn't move it (in model coords), moving the GObject does
+    for delta in (1, 1, -1):
+        gcanvas.on_zoom(event(canvas, x=400, y=300, delta=delta))
+        assert g_node.anchor == anchor
+        assert g_node.anchor == pytest.approx(drawn_anchor())
+    gate.move(33, -11)
+    zl = gcanvas.zoom_level
+    assert g_node.anchor == pytest.approx((anchor[0] + 33 / zl, anchor[1] - 11 / zl))
+    assert g_node.anchor == pytest.approx(drawn_anchor())
+
+    # and so does dragging it
+    canvas.current = gate._items['body'].item
+    gate.on_button_press(event(canvas, x=10, y=10))
+    gate.on_button_motion(event(canvas, x=30, y=50))
+    gate.on_button_release(event(canvas, x=30, y=50))
+    assert g_node.anchor == pytest.approx((anchor[0] + 53 / zl, anchor[1] + 29 / zl))
+    assert g_node.anchor == pytest.approx(drawn_anchor())
+
+def test_gesture_overlays_are_reused(make_gcanvas):
+    gcanvas = make_gcanvas()
+    canvas = gcanvas.canvas
+    (a, b) = (gcanvas.create('GAndGate', 5100, 5100), gcanvas.create('GAndGate', 5400, 5100))
+    idle(gcanvas)
+
+    # the selection box is created once, and then only moved
+    created = canvas.calls['create']
+    gcanvas.on_button_press(event(canvas, x=10, y=10))
+    for x in range(20, 100, 10):
+        gcanvas.on_button_motion(event(canvas, x=x, y=x))
+    assert canvas.calls['create'] == created + 1
+    (box,) = canvas.find_withtag('selection_box')
+    assert canvas.coords(box) == [5010, 5010, 5090, 5090]
+    gcanvas.on_button_release(event(canvas, x=90, y=90))
+    assert canvas.find_withtag('selection_box') == () and not gcanvas.overlays
+
+    # so are the two lines previewing a connection, until it's made
+    (output_dot, input_dot) = (a._items['output_dot'], b._items['input_dot1'])
+    canvas.current = output_dot.item
+    created = canvas.calls['create']
+    a.on_start_connection(event(canvas, x=0, y=0))
+    (x0, y0, x1, y1) = canvas.bbox(input_dot.item)
+    (x, y) = ((x0 + x1) / 2 - canvas.xoff, (y0 + y1) / 2 - canvas.yoff)
+    for i in range(5):
+        a.on_making_connection(event(canvas, x=x - 5 + i, y=y))
+    assert canvas.calls['create'] == created + 2
+    assert len(gcanvas.overlays) == 2
+    end = [int(x - 1 + canvas.xoff), int(y + canvas.yoff)]
+    assert all(canvas.coords(line)[-2:] == end for line in gcanvas.overlays)
+    a.on_end_connection(event(canvas, x=x, y=y))
+    assert not gcanvas.overlays and canvas.find_withtag('overlay') == ()
+    (wire,) = [gobject for gobject in gcanvas.gobjects.values() if gobject.connection is not None]
+    assert [g_node.g_item for g_node in wire.connection.g_nodes] == [output_dot, input_dot]
+
+def test_batched_item_changes(make_gcanvas):
+    gcanvas = make_gcanvas()
+    canvas = gcanvas.canvas
+
+    # a GObject is built in a batch, so each canvas item is created once, with its options and tags
+    (created, configured) = (canvas.calls['create'], canvas.calls['itemconfigure'])
+    gate = gcanvas.create('GAndGate', 5100, 5100)
+    assert canvas.calls['create'] == created + len(gate._items)
+    assert canvas.calls['itemconfigure'] == configured
+    body = gate._items['body']
+    assert 'layer:bodies' in canvas.items[body.item].tags
+
+    # changes made in a batch go to the canvas in one itemconfigure when it ends
+    configured = canvas.calls['itemconfigure']
+    with body.batch():
+        body.fill_color = 'red'
+        body.outline_color = 'green'
+        body.outline_width = 3
+        body.highlight_group = 'group'
+        assert canvas.calls['itemconfigure'] == configured
+    assert canvas.calls['itemconfigure'] == configured + 1
+    item = canvas.items[body.item]
+    assert (item.options['fill'], item.options['outline'], item.options['width']) == ('red', 'green', 3.0)
+    assert 'width:3' in item.tags and gate._tag + ':highlight_group:group' in item.tags
+
+    # selecting a GObject changes each of its GItems in one call
+    configured = canvas.calls['itemconfigure']
+    gate.set_selected()
+    assert canvas.calls['itemconfigure'] <= configured + len(gate._items)
+    assert all('selected' in canvas.items[g_item.item].tags for g_item in gate._items.values())
+
+def test_unchanged_options_are_not_sent(make_gcanvas):
+    gcanvas = make_gcanvas()
+    canvas = gcanvas.canvas
+    g_item = gcanvas.create('GOval', 5100, 5100, 50, 50)._items['GOval']
+
+    configured = canvas.calls['itemconfigure']
+    g_item.fill_color = 'red'
+    g_item.fill_color = 'red'
+    g_item.outline_width = g_item.outline_width
+    g_item.highlighted = False
+    assert canvas.calls['itemconfigure'] == configured + 1
+    assert canvas.items[g_item.item].options['fill'] == 'red'
+
+    # the cache is what the canvas item has, so a re-created canvas item gets the same options and tags
+    item = canvas.items[g_item.item]
+    g_item.dematerialize()
+    g_item.materialize()
+    assert (canvas.items[g_item.item].options, canvas.items[g_item.item].tags) == (item.options, item.tags)
+
+def test_hover_highlighting(tkshapes, make_gcanvas):
+    for native_highlight in (False, True):
+        gcanvas = make_gcanvas(native_highlight=native_highlight)
+        canvas = gcanvas.canvas
+        (gate, nand) = (gcanvas.create('GAndGate', 5100, 5100), gcanvas.create('GNandGate', 5300, 5100))
+        idle(gcanvas)
+        body = gate._items['body']
+        item = canvas.items[body.item]
+        assert (item.options['activeoutline'], item.options['activewidth']) == ('orange', 5)
+
+        # without native highlighting the outline is set on <Enter> and put back on <Leave>, and with it Tk does it
+        canvas.current = body.item
+        configured = canvas.calls['itemconfigure']
+        gate.on_enter(event(canvas))
+        assert item.options['outline'] == ('blue' if native_highlight else 'orange')
+        gate.on_leave(event(canvas))
+        assert item.options['outline'] == 'blue'
+        assert canvas.calls['itemconfigure'] == configured + (0 if native_highlight else 2)
+
+        # a highlight group is highlighted together, with one itemconfigure of its tag
+        members = (nand._items['body'], nand._items['not_dot'])
+        canvas.current = members[0].item
+        configured = canvas.calls['itemconfigure']
+        nand.on_enter(event(canvas))
+        assert canvas.calls['itemconfigure'] == configured + 1
+        assert [canvas.items[m.item].options['outline'] for m in members] == ['orange', 'orange']
+        assert all(m.highlighted for m in members)
+        nand.on_leave(event(canvas))
+        assert [canvas.items[m.item].options['outline'] for m in members] == ['blue', 'blue']
+
+        # Tk's own hover (native highlighting) uses the highlight colour and width, for every member of a group too
+        for m in members + (body,):
+            assert (canvas.items[m.item].options['activeoutline'], m.options['activewidth']) == ('orange', 5)
+        plain = tkshapes.gitem.GRectItem(gcanvas, 5500, 5100, 20, 20, 'Plain')
+        plain.add()
+        assert canvas.items[plain.item].options['activeoutline'] == plain.active_outline_color
+        assert canvas.items[plain.item].options['activewidth'] == plain.active_outline_width * gcanvas.zoom_level
+
+        # a line in a highlight group is highlighted by its fill (it has no outline), separately from the outlines
+        line = nand._items['output_line']
+        (line.highlightable, line.outline_width) = (True, 2.0)
+        line.highlight_group = 'body_plus_not_bubble'
+        configured = canvas.calls['itemconfigure']
+        nand.on_enter(event(canvas))
+        assert canvas.calls['itemconfigure'] == configured + 2
+        assert canvas.items[line.item].options['fill'] == 'orange' and 'outline' not in canvas.items[line.item].options
+        assert [canvas.items[m.item].options['outline'] for m in members] == ['orange', 'orange']
+        nand.on_leave(event(canvas))
+        assert canvas.items[line.item].options['fill'] == 'blue'
+
+def test_layers(make_gcanvas):
+    gcanvas = make_gcanvas()
+    canvas = gcanvas.canvas
+    a = gcanvas.create('GAndGate', 5100, 5100)
+    gcanvas.create('GWire', (5160, 5130, 5300, 5117), name='GWire')
+    b = gcanvas.create('GOrGate', 5300, 5100)
+    gcanvas.create_overlay('rectangle', (5000, 5000, 5010, 5010))
+
+    def layers():
+        """ the layer of each canvas item in a layer, bottom to top """
+        return [gcanvas.layers.index(tag[len('layer:'):]) for item in canvas.items.values()
+                for tag in item.tags if tag.startswith('layer:')]
+
+    # everything is put into its layer when things go idle, with one tag_lower() per layer
+    assert layers() != sorted(layers())
+    restacked = canvas.calls['restack']
+    idle(gcanvas)
+    assert canvas.calls['restack'] == restacked + len(gcanvas.layers)
+    assert layers() == sorted(layers())
+
+    # raising a GObject brings it to the front of its layers, but no further
+    def top(gobject, layer):
+        items = [item_id for item_id in canvas.stacking_order() if 'layer:' + layer in canvas.items[item_id].tags]
+        return max(items.index(g_item.item) for g_item in gobject._items.values() if g_item.layer == layer)
+
+    assert top(b, 'bodies') > top(a, 'bodies')
+    gcanvas.raise_gobjects([a])
+    assert top(a, 'bodies') > top(b, 'bodies')
+    assert layers() == sorted(layers())
+
+def test_create_many(make_gcanvas):
+    gcanvas = make_gcanvas()
+    canvas = gcanvas.canvas
+    specs = [('GAndGate', (5100 + 100 * i, 5100)) for i in range(20)]
+    gates = gcanvas.create_many(specs, mouse_bindings=True)
+
+    # one Tcl evaluation for all of the canvas items and bindings, and one command per handler method
+    assert canvas.calls['eval'] == 1
+    assert canvas.calls['create'] == canvas.calls['script_create'] + 1 + len(gcanvas.layers)
+    assert canvas.calls['script_create'] == sum(len(gate._items) for gate in gates)
+    assert canvas.calls['script_bind'] == len(gates) * len(gates[0].mouse_binding_table)
+    assert len(canvas._registered) == len({method for (suffix, sequence, method) in gates[0].mouse_binding_table})
+    assert all(g_item.item in canvas.items for gate in gates for g_item in gate._items.values())
+
+    # the bindings work
+    body = gates[3]._items['body']
+    before = canvas.coords(body.item)
+    canvas.fire('<ButtonPress-1>', body.item, x=10, y=10)
+    canvas.fire('<B1-Motion>', body.item, x=15, y=20)
+    canvas.fire('<ButtonRelease-1>', body.item, x=15, y=20)
+    assert canvas.coords(body.item) == [c + (10 if i % 2 else 5) for (i, c) in enumerate(before)]
+
+def test_create_many_cleans_up_after_an_error(make_gcanvas, monkeypatch):
+    gcanvas = make_gcanvas()
+    canvas = gcanvas.canvas
+
+    def created(gobjects):
+        """ each GItem has exactly one canvas item, which is the one it knows about """
+        return all(canvas.find_withtag(gobject._tag) == tuple(sorted(g.item for g in gobject._items.values()))
+                   for gobject in gobjects)
+
+    # an unknown type halfway through:  the GObjects created before it are still drawn
+    with pytest.raises(KeyError):
+        gcanvas.create_many([('GAndGate', (5100, 5100)), ('GOrGate', (5200, 5100)), ('GNoSuchGate', (0, 0))])
+    assert gcanvas.bulk_items is None
+    assert len(gcanvas.gobjects) == 2 and created(gcanvas.gobjects.values())
+
+    # the script fails after creating some of the canvas items
+    def fail(script):
+        canvas.run_script(script)
+        raise RuntimeError('Tcl error')
+    monkeypatch.setattr(canvas.tk, 'eval', fail)
+    with pytest.raises(RuntimeError):
+        gcanvas.create_many([('GAndGate', (5100, 5300)), ('GOrGate', (5200, 5300))])
+    monkeypatch.undo()
+    assert len(gcanvas.gobjects) == 4 and created(gcanvas.gobjects.values())
+
+def test_graph_paper_viewport_only(make_gcanvas):
+    gcanvas = make_gcanvas()
+    canvas = gcanvas.canvas
+    paper = gcanvas.create('GGraphPaper', 0, 0, 10000, 10000, viewport_only=True)
+    idle(gcanvas)
+
+    def shown():
+        return [canvas.coords(line) for line in paper._grid_lines[:paper._grid_shown]]
+
+    # only the lines around the view (800 x 600, plus viewport_margin) are drawn
+    margin = paper.viewport_margin
+    assert paper._grid_shown == (800 + 2 * margin) // 10 + 1 + (600 + 2 * margin) // 10 + 1
+    assert all(5000 - margin <= points[0] <= 5800 + margin for points in shown() if points[0] == points[2])
+
+    # panning and zooming re-position the pooled lines, rather than creating new ones every time
+    for (dx, dy) in ((150, 0), (0, 150), (-300, -300), (1000, 1000)):
+        canvas.xview_scroll(dx, 'units')
+        canvas.yview_scroll(dy, 'units')
+        idle(gcanvas)
+    pool = list(paper._grid_lines)
+    for delta in (1, 1, -1, -1, 1, -1):
+        gcanvas.on_zoom(event(canvas, x=400, y=300, delta=delta))
+        idle(gcanvas)
+    canvas.xview_scroll(-500, 'units')
+    idle(gcanvas)
+    assert paper._grid_lines[:len(pool)] == pool
+    assert len(paper._grid_lines) <= (800 + 2 * margin + 600 + 2 * margin) // 9 + 4
+    assert len(canvas.find_withtag(paper._tag + ':grid')) == len(paper._grid_lines)
+
+def test_graph_paper_density(make_gcanvas):
+    gcanvas = make_gcanvas()
+    canvas = gcanvas.canvas
+    paper = gcanvas.create('GGraphPaper', 0, 0, 10000, 10000, viewport_only=True)
+    idle(gcanvas)
+
+    # zoomed out until 10 units are closer than min_line_spacing pixels, every 10th line is drawn instead
+    while 10 * gcanvas.zoom_level >= paper.min_line_spacing:
+        gcanvas.on_zoom(event(canvas, x=400, y=300, delta=-1))
+    idle(gcanvas)
+    xs = sorted(points[0] for points in (canvas.coords(line) for line in paper._grid_lines[:paper._grid_shown])
+                if points[0] == points[2])
+    spacing = 100 * gcanvas.zoom_level
+    assert [b - a for (a, b) in zip(xs, xs[1:])] == pytest.approx([spacing] * (len(xs) - 1))
+    assert spacing >= paper.min_line_spacing
+
+def test_graph_paper_viewport_only_virtualized(make_gcanvas):
+    # a sheet out of view has no canvas item, which mustn't stop the grid being worked out
+    gcanvas = make_gcanvas(virtualized=True)
+    paper = gcanvas.create('GGraphPaper', 0, 0, 200, 200, viewport_only=True)
+    idle(gcanvas)
+    assert paper._items['background_rect'].item is None
+    assert paper._grid_shown == 0
+
+    gcanvas.canvas.xview_moveto(0)
+    gcanvas.canvas.yview_moveto(0)
+    idle(gcanvas)
+    assert paper._items['background_rect'].item is not None
+    assert paper._grid_shown == 2 * 21
@@ -0,0 +1,111 @@
+import threading
+
+from tkshapes.gcommand import GCommandQueue
+
+
+class Canvas:
+    """ just enough of a GCanvas for the command queue """
+    def __init__(self):
+        self.moves = []
+        self.after_calls = []
+
+    def move_gobjects(self, gobjects, dx, dy):
+        self.moves.append((gobjects, dx, dy))
+
+    def after(self, ms, function):
+        self.after_calls.append(function)
+        return len(self.after_calls)
+
+    def after_cancel(self, pending):
+        self.after_calls[pending - 1] = None
+
+class Item:
+    fill_color = 'white'
+
+def test_commands_run_in_order():
+    q = GCommandQueue(Canvas())
+    ran = []
+    for i in range(5):
+        q.put(ran.append, i)
+    assert q.drain(limit=3) == 3
+    assert ran == [0, 1, 2]
+    assert q.drain() == 2
+    assert ran == [0, 1, 2, 3, 4]
+
+def test_property_updates_coalesce():
+    q = GCommandQueue(Canvas())
+    item = Item()
+    for color in ('red', 'green', 'blue'):
+        q.set_color(item, color)
+    assert len(q) == 1
+    q.drain()
+    assert item.fill_color == 'blue'
+    assert (q.executed, q.coalesced) == (1, 2)
+
+def test_moves_add_up():
+    canvas = Canvas()
+    q = GCommandQueue(canvas)
+    q.move('a', 1, 2)
+    q.move('b', 5, 5)
+    q.move('a', 3, 4)
+    q.drain()
+    assert canvas.moves == [(['b'], 5, 5), (['a'], 4, 6)]
+
+def test_moves_stay_after_commands_put_between_them():
+    canvas = Canvas()
+    q = GCommandQueue(canvas)
+    ran = []
+    canvas.move_gobjects = lambda gobjects, dx, dy: ran.append(('move', dx, dy))
+
+    class Switch:
+        @property
+        def state(self):
+            return None
+
+        @state.setter
+        def state(self, value):
+            ran.append(('state', value))
+
+    switch = Switch()
+    q.move(switch, 1, 2)
+    q.set_state(switch, True)
+    q.move(switch, 3, 4)
+    assert q.drain() == 2
+    assert ran == [('state', True), ('move', 4, 6)]
+
+def test_put_from_threads():
+    q = GCommandQueue(Canvas())
+    ran = []
+    workers = [threading.Thread(target=lambda: [q.put(ran.append, 1) for i in range(1000)]) for t in range(4)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    q.drain()
+    assert len(ran) == 4000
+
+def test_failed_command_keeps_the_rest():
+    q = GCommandQueue(Canvas())
+    ran = []
+    q.put(ran.append, 1)
+    q.put(int, 'x')
+    q.put(ran.append, 3)
+    try:
+        q.drain()
+    except ValueError:
+        pass
+    assert ran == [1]
+    assert q.drain() == 1
+    assert ran == [1, 3]
+
+def test_start_runs_batches():
+    canvas = Canvas()
+    q = GCommandQueue(canvas, batch_size=2)
+    ran = []
+    for i in range(5):
+        q.put(ran.append, i)
+    q.start()
+    canvas.after_calls[-1]()
+    assert ran == [0, 1]
+    q.stop()
+    assert canvas.after_calls[-1] is None
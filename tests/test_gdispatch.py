@@ -0,0 +1,78 @@
+from tkshapes.gdispatch import GDispatcher
+from tkshapes.gevent import GEvent, GEventType, ClickableClickedData, AddConnectionData, SelectionChangedData
+
+
+class Gate:
+    def __init__(self, tag):
+        self._tag = tag
+
+class Switch(Gate):
+    pass
+
+def clicked(g_object):
+    return GEvent(GEventType.CLICKABLE_CLICKED, ClickableClickedData(canvas_item=1, g_item=None, g_object=g_object))
+
+def test_event_data_by_key():
+    data = ClickableClickedData(canvas_item=1, g_item=None, g_object='a')
+    assert data['canvas_item'] == 1
+    assert data.g_object == 'a'
+    assert not hasattr(data, '__dict__')
+
+def test_event_type_is_interned():
+    assert GEvent(''.join(['Clickable', 'Clicked']), None).event_type is GEventType.CLICKABLE_CLICKED
+
+def test_dispatch_by_type():
+    d = GDispatcher()
+    seen = []
+    d.subscribe(GEventType.CLICKABLE_CLICKED, lambda e: seen.append('any'))
+    d.subscribe(GEventType.CLICKABLE_CLICKED, lambda e: seen.append('switch'), gobject_type=Switch)
+    d.subscribe(GEventType.ADD_CONNECTION, lambda e: seen.append('connection'))
+    assert d.dispatch(clicked(Gate('G:1'))) == 1
+    assert d.dispatch(clicked(Switch('S:1'))) == 2
+    assert seen == ['any', 'any', 'switch']
+    assert d.subscribed(GEventType.SELECTION_CHANGED) is False
+
+def test_dispatch_by_tag():
+    d = GDispatcher()
+    seen = []
+    d.subscribe(GEventType.CLICKABLE_CLICKED, lambda e: seen.append(e.event_data.g_object._tag), tag='G:2')
+    d.dispatch(clicked(Gate('G:1')))
+    d.dispatch(clicked(Gate('G:2')))
+    assert seen == ['G:2']
+
+def test_dispatch_without_gobject():
+    d = GDispatcher()
+    seen = []
+    d.subscribe(GEventType.SELECTION_CHANGED, seen.append)
+    d.subscribe(GEventType.SELECTION_CHANGED, seen.append, gobject_type=Gate)
+    d.dispatch(GEvent(GEventType.SELECTION_CHANGED, SelectionChangedData(added=[], removed=[], selection=[])))
+    assert len(seen) == 1
+
+def test_dispatch_connection_once():
+    d = GDispatcher()
+    seen = []
+    d.subscribe(GEventType.ADD_CONNECTION, seen.append, gobject_type=Gate)
+    data = AddConnectionData(from_g_object=Gate('G:1'), to_g_object=Switch('S:1'))
+    d.dispatch(GEvent(GEventType.ADD_CONNECTION, data))
+    assert len(seen) == 1
+
+def test_unsubscribe():
+    d = GDispatcher()
+    seen = []
+    token = d.subscribe(GEventType.CLICKABLE_CLICKED, seen.append)
+    d.dispatch(clicked(Gate('G:1')))
+    d.unsubscribe(token)
+    assert d.subscribed(GEventType.CLICKABLE_CLICKED) is False
+    d.dispatch(clicked(Gate('G:1')))
+    assert len(seen) == 1
+
+def test_deliver_exclusive():
+    d = GDispatcher()
+    seen = []
+    d.subscribe(GEventType.ADD_CONNECTION, lambda e: seen.append('any'))
+    d.subscribe(GEventType.ADD_CONNECTION, lambda e: seen.append('switch'), tag='S:1', exclusive=True)
+    data = AddConnectionData(from_g_object=Gate('G:1'), to_g_object=Gate('G:2'))
+    assert d.deliver(GEvent(GEventType.ADD_CONNECTION, data)) == (1, False)
+    data = AddConnectionData(from_g_object=Gate('G:1'), to_g_object=Switch('S:1'))
+    assert d.deliver(GEvent(GEventType.ADD_CONNECTION, data)) == (2, True)
+    assert seen == ['any', 'any', 'switch']
@@ -1,5 +1,8 @@
+import queue
+import threading
+
 import pytest
-from tkshapes.gevent import GEvent, GEventQueue
+from tkshapes.gevent import GEvent, GEventQueue, DROP_OLDEST, BLOCK, COALESCE, GROW
 
 def test_event_queue_rejects_int():
     with pytest.raises(TypeError):
@@ -24,6 +27,10 @@ def test_event_type():
     g_event_1 = GEvent('Test1', None)
     assert g_event_1.event_type == 'Test1'
 
+def test_event_has_no_dict():
+    g_event_1 = GEvent('Test1', None)
+    assert not hasattr(g_event_1, '__dict__')
+
 def test_event_queue_name():
     q = GEventQueue('test_queue')
     q_name = q.name
@@ -97,3 +104,84 @@ def test_event_queue_size_after_get():
     q.get_event()
     assert q.get_qsize() == 2
 
+
+def test_event_queue_wraps_around():
+    q = GEventQueue('test_queue', maxsize=3)
+    for i in range(10):
+        q.put_event(GEvent('Test', i))
+        assert q.get_event().event_data == i
+    assert q.is_empty() is True
+
+def test_event_queue_drain_all():
+    q = GEventQueue('test_queue', maxsize=3)
+    for i in range(5):
+        q.put_event(GEvent('Test', i))
+    q.get_event()
+    q.put_event(GEvent('Test', 5))
+    assert [e.event_data for e in q.drain_all()] == [1, 2, 5]
+    assert q.is_empty() is True
+    assert q.drain_all() == []
+
+def test_event_queue_drop_oldest():
+    q = GEventQueue('test_queue', maxsize=2, policy=DROP_OLDEST)
+    for i in range(5):
+        assert q.put_event(GEvent('Test', i)) is True
+    assert [e.event_data for e in q.drain_all()] == [3, 4]
+    assert q.stats == {'size': 0, 'enqueued': 5, 'dropped': 3, 'coalesced': 0, 'high_water': 2}
+
+def test_event_queue_drop_newest_counts():
+    q = GEventQueue('test_queue', maxsize=2)
+    for i in range(5):
+        q.put_event(GEvent('Test', i))
+    assert [e.event_data for e in q.drain_all()] == [0, 1]
+    assert q.dropped == 3
+
+def test_event_queue_coalesce():
+    q = GEventQueue('test_queue', maxsize=2, policy=COALESCE)
+    q.put_event(GEvent('Selection', 1))
+    q.put_event(GEvent('Click', 2))
+    q.put_event(GEvent('Selection', 3))
+    assert q.put_event(GEvent('Other', 4)) is False
+    assert [(e.event_type, e.event_data) for e in q.drain_all()] == [('Selection', 3), ('Click', 2)]
+    assert (q.coalesced, q.dropped) == (1, 1)
+    q.put_event(GEvent('Selection', 5))
+    assert q.get_event().event_data == 5
+
+def test_event_queue_coalesce_by_key():
+    q = GEventQueue('test_queue', policy=COALESCE, key=lambda e: (e.event_type, e.event_data['g_object']))
+    q.put_event(GEvent('Click', {'g_object': 'a', 'n': 1}))
+    q.put_event(GEvent('Click', {'g_object': 'b', 'n': 2}))
+    q.put_event(GEvent('Click', {'g_object': 'a', 'n': 3}))
+    assert [e.event_data['n'] for e in q.drain_all()] == [3, 2]
+
+def test_event_queue_block():
+    q = GEventQueue('test_queue', maxsize=1, policy=BLOCK)
+    q.put_event(GEvent('Test1', None))
+    assert q.put_event(GEvent('Test2', None), timeout=0.01) is False
+    threading.Timer(0.01, q.get_event).start()
+    assert q.put_event(GEvent('Test3', None), timeout=5) is True
+    assert q.get_event().event_type == 'Test3'
+
+def test_event_queue_grow():
+    q = GEventQueue('test_queue', maxsize=2, policy=GROW)
+    q.put_event(GEvent('Test', 0))
+    q.get_event()
+    for i in range(1, 8):
+        assert q.put_event(GEvent('Test', i)) is True
+    assert q.is_full() is False
+    assert [e.event_data for e in q.drain_all()] == list(range(1, 8))
+    assert q.stats == {'size': 0, 'enqueued': 8, 'dropped': 0, 'coalesced': 0, 'high_water': 7}
+
+def test_event_queue_events_compatibility():
+    q = GEventQueue('test_queue', maxsize=1)
+    with pytest.raises(queue.Empty):
+        q.events.get_nowait()
+    q.events.put_nowait(GEvent('Test1', None))
+    assert (q.events.qsize(), q.events.empty(), q.events.full()) == (1, False, True)
+    with pytest.raises(queue.Full):
+        q.events.put_nowait(GEvent('Test2', None))
+    assert q.events.get_nowait().event_type == 'Test1'
+
+def test_event_queue_bad_policy():
+    with pytest.raises(ValueError):
+        GEventQueue('test_queue', policy='foo')
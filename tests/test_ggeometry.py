@@ -0,0 +1,26 @@
+import math
+import pytest
+from tkshapes import ggeometry
+from tkshapes.ggeometry import arc, transform, rotate
+
+def test_arc():
+    points = arc(10, 20, 30, 5, 0, 91)
+    assert len(points) == 91 * 2
+    assert points[:2] == [40.0, 20.0]
+    assert abs(points[-2] - 10) < 1e-9 and abs(points[-1] - 25) < 1e-9
+
+def test_transform():
+    assert transform([1, 2, 3, 4], 10, 20, 2) == [12, 24, 16, 28]
+
+def test_rotate_about_a_point():
+    (x, y) = rotate([2, 1], math.pi / 2, 1, 1)
+    assert abs(x - 1) < 1e-9 and abs(y - 2) < 1e-9
+
+def test_numpy_and_python_agree(monkeypatch):
+    pytest.importorskip('numpy')
+    points = arc(5, 5, 30, 20, -90, 270)
+    with_numpy = (transform(points, 3, 4, 1.5), rotate(points, 1.0, 5, 5))
+    monkeypatch.setattr(ggeometry, 'numpy', None)
+    assert arc(5, 5, 30, 20, -90, 270) == pytest.approx(points)
+    assert transform(points, 3, 4, 1.5) == pytest.approx(with_numpy[0])
+    assert rotate(points, 1.0, 5, 5) == pytest.approx(with_numpy[1])
@@ -0,0 +1,99 @@
+import pytest
+from tkshapes.gconnection import GConnection
+from tkshapes.gnode import GNode
+from tkshapes.gsim import GSimulator
+
+
+# Just enough of the GObjects and GCanvas for the simulator:  logic, GNodes, and GConnections between them
+
+class Part:
+    def __init__(self, logic, *node_names):
+        self.logic = logic
+        self.connection = None
+        self.state = False
+        self._nodes = {name: GNode(name=name, g_object=self, g_item=None) for name in node_names}
+
+class Wire:
+    logic = None
+
+    def __init__(self, node1, node2):
+        self._nodes = {}
+        self.connection = GConnection(name='wire', g_object=self)
+        self.connection.g_nodes = [node1, node2]
+
+class Canvas:
+    def __init__(self):
+        self.gobjects = {}
+
+    def add(self, *parts):
+        for part in parts:
+            self.gobjects[id(part)] = part
+        return parts
+
+    def wire(self, from_part, to_part, to_node):
+        wire = Wire(from_part._nodes['output'], to_part._nodes[to_node])
+        self.gobjects[id(wire)] = wire
+
+def gate(logic):
+    if logic in ('not', 'buffer'):
+        return Part(logic, 'output', 'input')
+    return Part(logic, 'output', 'input_1', 'input_2')
+
+@pytest.mark.parametrize('logic, table', [
+    ('and', [0, 0, 0, 1]),
+    ('or', [0, 1, 1, 1]),
+    ('xor', [0, 1, 1, 0]),
+    ('nand', [1, 1, 1, 0]),
+    ('nor', [1, 0, 0, 0]),
+    ('xnor', [1, 0, 0, 1]),
+])
+def test_truth_tables(logic, table):
+    canvas = Canvas()
+    (a, b, g, bulb) = canvas.add(Part('switch', 'output'), Part('switch', 'output'), gate(logic), Part('bulb', 'input'))
+    canvas.wire(a, g, 'input_1')
+    canvas.wire(b, g, 'input_2')
+    canvas.wire(g, bulb, 'input')
+    sim = GSimulator(canvas)
+    for (i, expected) in enumerate(table):
+        sim.set_input(a, i & 2)
+        sim.set_input(b, i & 1)
+        assert bulb.state == bool(expected)
+
+def test_not_chain_and_levels():
+    canvas = Canvas()
+    (switch, bulb) = canvas.add(Part('switch', 'output'), Part('bulb', 'input'))
+    gates = canvas.add(*[gate('not') for i in range(5)])
+    # wire the chain up backwards, so the gates aren't found in order
+    for (i, g) in reversed(list(enumerate(gates))):
+        canvas.wire(gates[i - 1] if i else switch, g, 'input')
+    canvas.wire(gates[-1], bulb, 'input')
+    sim = GSimulator(canvas)
+    assert sim.gates == list(gates)
+    assert bulb.state is True
+    switch.state = True
+    sim.input_changed(switch)
+    assert bulb.state is False
+    assert sim.value(gates[0]._nodes['output']) is False
+
+def test_only_the_fanout_cone_is_evaluated():
+    canvas = Canvas()
+    switches = canvas.add(*[Part('switch', 'output') for i in range(10)])
+    for switch in switches:
+        previous = switch
+        for g in canvas.add(*[gate('buffer') for i in range(20)]):
+            canvas.wire(previous, g, 'input')
+            previous = g
+    sim = GSimulator(canvas)
+    before = sim.evaluations
+    sim.set_input(switches[3], True)
+    assert sim.evaluations - before == 20
+    # nothing changes, so nothing is evaluated
+    sim.set_input(switches[3], True)
+    assert sim.evaluations - before == 20
+
+def test_oscillating_loop():
+    canvas = Canvas()
+    (g,) = canvas.add(gate('not'))
+    canvas.wire(g, g, 'input')
+    with pytest.raises(RuntimeError):
+        GSimulator(canvas)
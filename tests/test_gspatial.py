@@ -0,0 +1,52 @@
+from tkshapes.gspatial import GSpatialIndex
+
+def test_query_point():
+    index = GSpatialIndex(cell_size=10)
+    index.insert('a', (0, 0, 15, 15))
+    index.insert('b', (100, 100, 120, 110))
+    assert index.query_point(5, 5) == ['a']
+    assert index.query_point(110, 105) == ['b']
+    assert index.query_point(50, 50) == []
+
+def test_query_rect_overlap_and_enclosed():
+    index = GSpatialIndex(cell_size=10)
+    index.insert('a', (0, 0, 15, 15))
+    index.insert('b', (20, 0, 40, 10))
+    assert sorted(index.query_rect((10, 0, 25, 5))) == ['a', 'b']
+    assert index.query_rect((-5, -5, 30, 30), enclosed=True) == ['a']
+    # the corners of the area can come in any order
+    assert index.query_rect((30, 30, -5, -5), enclosed=True) == ['a']
+
+def test_update_moves_key():
+    index = GSpatialIndex(cell_size=10)
+    index.insert('a', (0, 0, 5, 5))
+    index.update('a', (200, 200, 205, 205))
+    assert index.query_point(2, 2) == []
+    assert index.query_point(202, 202) == ['a']
+    index.translate('a', -200, -200)
+    assert index.bounds('a') == (0, 0, 5, 5)
+    assert index.query_point(2, 2) == ['a']
+
+def test_remove():
+    index = GSpatialIndex(cell_size=10)
+    index.insert('a', (0, 0, 5, 5))
+    index.remove('a')
+    index.remove('a')
+    assert 'a' not in index
+    assert len(index) == 0
+    assert index.query_rect((-100, -100, 100, 100)) == []
+
+def test_query_radius_nearest_first():
+    index = GSpatialIndex(cell_size=10)
+    index.insert('far', (20, 0, 22, 2))
+    index.insert('near', (5, 0, 7, 2))
+    index.insert('out', (100, 0, 102, 2))
+    assert index.query_radius(0, 0, 25) == ['near', 'far']
+
+def test_nearest_with_accept():
+    index = GSpatialIndex(cell_size=10)
+    index.insert('a', (3, 0, 4, 1))
+    index.insert('b', (8, 0, 9, 1))
+    assert index.nearest(0, 0, 20) == 'a'
+    assert index.nearest(0, 0, 20, accept=lambda key: key != 'a') == 'b'
+    assert index.nearest(0, 0, 2) is None
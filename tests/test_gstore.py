@@ -0,0 +1,49 @@
+from tkshapes.gstore import GCoordStore
+
+def test_allocate_and_get():
+    store = GCoordStore()
+    a = store.allocate('a', [0, 0, 10, 10])
+    b = store.allocate('b', [5, 5, 6, 6, 7, 7])
+    assert store.get(a) == [0, 0, 10, 10]
+    assert store.get(b) == [5, 5, 6, 6, 7, 7]
+    assert store.items == ['a', 'b']
+
+def test_set_resize_and_compact():
+    store = GCoordStore()
+    a = store.allocate('a', [0, 0, 10, 10])
+    b = store.allocate('b', [1, 2])
+    store.set(a, [1, 1, 2, 2])
+    assert store.get(a) == [1, 1, 2, 2]
+    store.set(a, [3, 3, 4, 4, 5, 5])
+    store.compact()
+    assert store.get(a) == [3, 3, 4, 4, 5, 5]
+    assert store.get(b) == [1, 2]
+    assert len(store.coords) == 8
+
+def test_translate_and_bounds():
+    store = GCoordStore()
+    a = store.allocate('a', [0, 0, 10, 10])
+    b = store.allocate('b', [20, 5, 30, 15])
+    c = store.allocate('c', [100, 100, 110, 110])
+    store.translate([a, b], 1, -1)
+    assert store.get(a) == [1, -1, 11, 9]
+    assert store.get(c) == [100, 100, 110, 110]
+    assert store.bounds([a, b]) == (1, -1, 31, 14)
+    assert store.bounds([]) is None
+
+def test_free_and_reuse():
+    store = GCoordStore()
+    a = store.allocate('a', [0, 0, 10, 10])
+    b = store.allocate('b', [1, 2, 3, 4])
+    store.dirty.update([a, b])
+    store.free(a)
+    assert store.items == [None, 'b'] and len(store) == 1
+    assert store.dirty == {b}
+    store.compact()
+    assert len(store.coords) == 4 and store.get(b) == [1, 2, 3, 4]
+    c = store.allocate('c', [5, 6])
+    assert c == a and store.items == ['c', 'b'] and len(store) == 2
+    assert store.get(c) == [5, 6]
+    assert store.bounds([b, c]) == (1, 2, 5, 6)
+    d = store.allocate('d', [7, 8])
+    assert d == 2
@@ -0,0 +1,38 @@
+import tkinter
+from tkshapes.gtcl import tcl_quote, tcl_list, create_command, build_script
+
+def test_quote_round_trip():
+    tcl = tkinter.Tcl()
+    for value in ['plain', '', 'two words', 'a{b', '}', '[exit]', '$x', 'semi;colon', 'back\\slash', 'new\nline',
+                  'if {"[cmd %# %b]" == "break"} break\n']:
+        assert tcl.eval('set x ' + tcl_quote(value)) == value
+
+def test_quote_float():
+    assert tcl_quote(0.1) == '0.1'
+
+def test_list_round_trip():
+    tcl = tkinter.Tcl()
+    tags = ('GObject:1000000001', 'has space', 'width:2')
+    assert tcl.splitlist(tcl.eval('set x ' + tcl_list(tags))) == tags
+
+def test_quote_tuple_option():
+    tcl = tkinter.Tcl()
+    tcl.eval('proc .c {args} {set ::call $args}')
+    tcl.eval(build_script([create_command('.c', 'line', (0, 0, 10, 10), options={'dash': (4, 2), 'fill': 'red'})]))
+    call = tcl.splitlist(tcl.eval('set ::call'))
+    assert call[-4:-2] == ('-dash', '4 2')
+    assert tcl.splitlist(call[-3]) == ('4', '2')
+    assert tcl_quote([]) == '{}'
+
+def test_build_script_returns_ids():
+    tcl = tkinter.Tcl()
+    tcl.eval('set n 0; proc .c {args} {global n; lappend ::calls $args; incr n}')
+    commands = [create_command('.c', 'line', (0, 0, 10.5, 10), ('a b', 'c'), {'fill': 'blue', 'width': 2.0}),
+                create_command('.c', 'oval', (1, 2, 3, 4))]
+    ids = tcl.splitlist(tcl.eval(build_script(commands)))
+    assert ids == ('1', '2')
+    calls = tcl.splitlist(tcl.eval('set ::calls'))
+    call = tcl.splitlist(calls[0])
+    assert call[:7] == ('create', 'line', '0', '0', '10.5', '10', '-tags')
+    assert tcl.splitlist(call[7]) == ('a b', 'c')
+    assert call[8:] == ('-fill', 'blue', '-width', '2.0')
@@ -0,0 +1,68 @@
+import math
+
+import pytest
+from tkshapes.gtemplate import GTemplate
+
+from faketk import event
+
+def test_geometry_is_computed_once():
+    calls = []
+
+    def body():
+        calls.append(1)
+        return [0, 0, 10, 0, 10, 10]
+
+    template = GTemplate('Test')
+    template.polygon('body', body, {})
+    template.hline('line', 0, 5, -10)
+    assert template.geometry == {'body': (0, 0, 10, 0, 10, 10)}
+    assert template.geometry == {'body': (0, 0, 10, 0, 10, 10)}
+    assert len(calls) == 1
+
+def pre_template_and_gate(x, y):
+    """ the model coords of each of a GAndGate's GItems, in drawing order, worked out as GAndGate used to """
+    points = [x, y, x + 29, y]
+    for angle in range(-90, 90):
+        arc_x = (math.cos(math.radians(angle)) * 30) + (x + 29)
+        arc_y = (math.sin(math.radians(angle)) * 30) + (y + 30)
+        points.extend((arc_x, arc_y))
+    points.extend((x, y + 60))
+    return {
+        'output_line': [x + 59, y + 30, x + 69, y + 30],
+        'output_dot': [x + 69, y + 25, x + 79, y + 35],
+        'input_line1': [x, y + 17, x - 10, y + 17],
+        'input_dot1': [x - 20, y + 12, x - 10, y + 22],
+        'input_line2': [x, y + 43, x - 10, y + 43],
+        'input_dot2': [x - 20, y + 38, x - 10, y + 48],
+        'body': points,
+    }
+
+def test_stamped_gate_matches_pre_template_gate(make_gcanvas):
+    gcanvas = make_gcanvas()
+    canvas = gcanvas.canvas
+    for (x, y) in ((5100, 5100), (5317, 5123.5)):
+        gate = gcanvas.create('GAndGate', x, y)
+        expected = pre_template_and_gate(x, y)
+        assert list(gate._items) == list(expected)
+        for (name, coords) in expected.items():
+            assert canvas.coords(gate._items[name].item) == pytest.approx(gcanvas.model_to_canvas(coords))
+        # the next one is stamped on a zoomed-in canvas
+        gcanvas.on_zoom(event(canvas, x=400, y=300, delta=1))
+
+def test_no_trigonometry_after_the_first_instance(tkshapes, make_gcanvas, monkeypatch):
+    gcanvas = make_gcanvas()
+    calls = []
+    for name in ('cos', 'sin', 'radians'):
+        def counted(*args, _function=getattr(math, name)):
+            calls.append(args)
+            return _function(*args)
+        monkeypatch.setattr(math, name, counted)
+    # (and without NumPy, which would do the trigonometry for arc() itself)
+    monkeypatch.setattr(tkshapes.ggeometry, 'numpy', None)
+
+    for a_type in ('GAndGate', 'GXOrGate', 'GLightBulb'):
+        gcanvas.create(a_type, 5100, 5100)
+        assert calls
+        del calls[:]
+        gcanvas.create(a_type, 5300, 5200)
+        assert calls == []